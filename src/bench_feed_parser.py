@@ -0,0 +1,118 @@
+"""フィードパーサー ベンチマークスクリプト
+
+高速パーサー（iterparse）とfeedparserの解析時間・ピークメモリを比較する。
+
+使い方:
+    # 現在のフィードを取得・保存してベンチマーク
+    PYTHONPATH=. python src/bench_feed_parser.py --capture data/feeds
+
+    # 保存済みフィードでベンチマーク
+    PYTHONPATH=. python src/bench_feed_parser.py data/feeds/*.xml
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from src.utils.config import HATENA_RSS_URL, HN_RSS_URL, QIITA_RSS_URL, RSS_TIMEOUT, ZENN_RSS_URL
+from src.utils.feed_parser import parse_fast, parse_with_feedparser
+from src.utils.http_client import http_client
+from src.utils.logger import get_logger
+
+logger = get_logger("bench_feed_parser")
+
+FEED_URLS = {
+    "qiita": QIITA_RSS_URL,
+    "zenn": ZENN_RSS_URL,
+    "hackernews": HN_RSS_URL,
+    "hatena": HATENA_RSS_URL,
+}
+
+PARSERS: dict[str, Callable[[bytes], list[dict[str, Any]]]] = {
+    "fast": parse_fast,
+    "feedparser": parse_with_feedparser,
+}
+
+
+def capture_feeds(output_dir: Path) -> list[Path]:
+    """全フィードを取得してファイルに保存する
+
+    Args:
+        output_dir: 保存先ディレクトリ
+
+    Returns:
+        保存したファイルのパスリスト
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for source, url in FEED_URLS.items():
+        try:
+            response = http_client.get(url, timeout=RSS_TIMEOUT)
+            response.raise_for_status()
+        except Exception as e:
+            logger.error(f"{source} フィードの取得に失敗: {e}")
+            continue
+        path = output_dir / f"{source}.xml"
+        path.write_bytes(response.content)
+        logger.info(f"保存完了: {path} ({len(response.content):,} bytes)")
+        paths.append(path)
+    return paths
+
+
+def measure(parser: Callable[[bytes], list[dict[str, Any]]], content: bytes, repeat: int) -> dict[str, float]:
+    """解析時間（中央値）とピークメモリを計測する"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser(content)
+        timings.append(time.perf_counter() - start)
+
+    # メモリ計測は時間計測と分けて行う（tracemallocのオーバーヘッドを除外）
+    tracemalloc.start()
+    entries = parser(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"ms": statistics.median(timings) * 1000, "peak_kb": peak / 1024, "entries": len(entries)}
+
+
+def main() -> int:
+    """メイン処理
+
+    Returns:
+        終了コード（0: 正常, 1: エラー）
+    """
+    arg_parser = argparse.ArgumentParser(description="フィードパーサーのベンチマーク")
+    arg_parser.add_argument("files", nargs="*", type=Path, help="保存済みフィードファイル")
+    arg_parser.add_argument("--capture", type=Path, help="フィードを取得して保存するディレクトリ")
+    arg_parser.add_argument("--repeat", type=int, default=20, help="計測の繰り返し回数")
+    args = arg_parser.parse_args()
+
+    files = list(args.files)
+    if args.capture:
+        files.extend(capture_feeds(args.capture))
+
+    if not files:
+        logger.error("ベンチマーク対象のフィードがありません")
+        return 1
+
+    print(f"{'file':<20} {'parser':<12} {'entries':>8} {'time(ms)':>10} {'peak(KB)':>10}")
+    for path in files:
+        content = path.read_bytes()
+        results = {name: measure(parser, content, args.repeat) for name, parser in PARSERS.items()}
+        for name, result in results.items():
+            print(f"{path.name:<20} {name:<12} {result['entries']:>8} {result['ms']:>10.2f} {result['peak_kb']:>10.1f}")
+
+        fast, slow = results["fast"], results["feedparser"]
+        if fast["ms"] > 0 and fast["peak_kb"] > 0:
+            print(f"{'':<20} {'ratio':<12} {'':>8} {slow['ms'] / fast['ms']:>9.1f}x {slow['peak_kb'] / fast['peak_kb']:>9.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
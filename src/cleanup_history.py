@@ -22,9 +22,10 @@ def main() -> int:
         logger.error("履歴ファイルの読み込みに失敗しました")
         return 1
 
-    deleted_count = deduplicator.cleanup_old_entries(days=7)
+    deleted_count = deduplicator.cleanup_old_entries()
 
-    if not deduplicator.save_history():
+    # 削除件数が畳み込みの閾値未満でも、ジャーナルはここでスナップショットに畳み込む
+    if not deduplicator.save_history(compact=True):
         logger.error("履歴ファイルの保存に失敗しました")
         return 1
 
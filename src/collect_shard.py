@@ -0,0 +1,93 @@
+"""シャード収集スクリプト
+
+ソース・優先トピックの一部だけを収集し、結果バンドルを書き出す。
+HNタイトルの翻訳・履歴・マークダウン・通知は行わず、src/merge_runs.py でまとめて処理する。
+
+使い方:
+    PYTHONPATH=. python src/collect_shard.py --sources qiita,zenn
+    PYTHONPATH=. python src/collect_shard.py --topics all --name priority
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from src.main import create_stats, record_fetched
+from src.services.bundle import write_bundle
+from src.services.collection import collect_articles
+from src.services.deduplicator import Deduplicator
+from src.utils.config import BUNDLES_DIR, PRIORITY_TOPICS, SOURCES
+from src.utils.deadline import run_deadline
+from src.utils.feed import feed_cache
+from src.utils.http_client import http_client
+from src.utils.logger import get_logger
+
+logger = get_logger("collect_shard")
+
+
+def _split(value: str) -> list[str]:
+    """カンマ区切りの引数をリストに変換する"""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """コマンドライン引数を解析する"""
+    parser = argparse.ArgumentParser(description="ソース・優先トピックの一部を収集して結果バンドルを書き出す")
+    parser.add_argument("--sources", default="", help=f"収集するソース（カンマ区切り, 'all' で全て: {','.join(SOURCES)}）")
+    parser.add_argument("--topics", default="", help="タグ検索する優先トピック（カンマ区切り, 'all' で PRIORITY_TOPICS）")
+    parser.add_argument("--name", default=None, help="シャード名（省略時はソース・トピックから生成）")
+    parser.add_argument("--output-dir", type=Path, default=BUNDLES_DIR, help="バンドルの出力先ディレクトリ")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """メイン処理
+
+    Returns:
+        終了コード（0: 正常, 1: エラー）
+    """
+    args = parse_args(argv)
+    sources = SOURCES if args.sources == "all" else _split(args.sources)
+    topics = PRIORITY_TOPICS if args.topics == "all" else _split(args.topics)
+
+    unknown = [source for source in sources if source not in SOURCES]
+    if unknown:
+        logger.error(f"不明なソースが指定されました: {', '.join(unknown)}")
+        return 1
+    if not sources and not topics:
+        logger.error("--sources または --topics を指定してください")
+        return 1
+
+    name = args.name or "-".join(sources + topics).lower()
+    logger.info(f"シャード収集開始: {name}（ソース: {sources or 'なし'}, 優先トピック: {topics or 'なし'}）")
+
+    run_deadline.reset()
+    feed_cache.load()
+
+    # 履歴は読み込みのみ（いいね数取得のスキップ判定用）。更新はマージ段階で行う
+    deduplicator = Deduplicator()
+    if not deduplicator.load_history():
+        logger.warning("履歴ファイルの読み込みに問題がありました")
+
+    stats = create_stats()
+    collected = collect_articles(
+        stats,
+        is_known=deduplicator.is_duplicate,
+        sources=sources,
+        topics=topics,
+        topic_sources=["qiita", "zenn"],
+    )
+    record_fetched(collected, stats)
+
+    stats["http"] = http_client.stats()
+
+    try:
+        write_bundle(args.output_dir / f"{name}.json", name, collected, stats, feed_cache.export_run())
+    except Exception as e:
+        logger.error(f"結果バンドルの書き出しに失敗: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
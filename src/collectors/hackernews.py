@@ -1,14 +1,12 @@
 """Hacker News RSS取得モジュール"""
 
 import re
-import socket
-import urllib.error
-from datetime import datetime
 from typing import Any
 
-import feedparser
+import requests
 
 from src.utils.config import HN_RSS_URL, RSS_TIMEOUT
+from src.utils.feed import feed_cache, fetch_feed
 from src.utils.logger import get_logger
 
 logger = get_logger("collectors.hackernews")
@@ -33,50 +31,28 @@ def fetch_top_articles() -> list[dict[str, Any]]:
 
     try:
         # タイムアウト付きでRSSを取得
-        feed = feedparser.parse(
-            HN_RSS_URL,
-            request_headers={"User-Agent": "TechTrendCollector/1.0"},
-        )
-
-        # feedparserの内部でタイムアウトを設定
-        socket.setdefaulttimeout(RSS_TIMEOUT)
-
-        # フィードのステータスチェック
-        if hasattr(feed, "bozo") and feed.bozo:
-            if hasattr(feed, "bozo_exception"):
-                logger.warning(f"RSSパースに問題がありました: {feed.bozo_exception}")
+        entries = fetch_feed(HN_RSS_URL, "hackernews")
+        if entries is None:
+            # 前回から更新なし（304）: パースを省略
+            return []
 
-        if not feed.entries:
+        if not entries:
             logger.warning("Hacker News RSSから記事が取得できませんでした")
             return []
 
         articles = []
 
-        for entry in feed.entries:
+        for entry in entries:
             try:
-                # 公開日時のパース
-                published = None
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    published = datetime(*entry.published_parsed[:6]).isoformat()
-
-                # hnrss.orgはオリジナル記事のリンクをentry.linkとして提供
-                url = entry.link if hasattr(entry, "link") else ""
-
-                # 著者情報
-                author = ""
-                if hasattr(entry, "author"):
-                    author = entry.author
-
-                # ポイント数をdescriptionからパース
-                points = 0
-                if hasattr(entry, "description"):
-                    points = _parse_points_from_description(entry.description)
+                # hnrss.orgはオリジナル記事のリンクをlinkとして提供
+                # ポイント数はdescriptionからパース
+                points = _parse_points_from_description(entry["description"])
 
                 article = {
-                    "title": entry.title,
-                    "url": url,
-                    "author": author,
-                    "published": published,
+                    "title": entry["title"],
+                    "url": entry["link"],
+                    "author": entry["author"],
+                    "published": entry["published"],
                     "tags": [],
                     "source": "hackernews",
                     "points": points,
@@ -92,12 +68,14 @@ def fetch_top_articles() -> list[dict[str, Any]]:
         logger.info(f"Hacker News から {len(articles)} 件の記事を取得完了")
         return articles
 
-    except urllib.error.URLError as e:
-        logger.error(f"ネットワークエラー: {e}")
-        return []
-    except socket.timeout:
+    except requests.Timeout:
         logger.error(f"タイムアウト ({RSS_TIMEOUT}秒)")
         return []
+    except requests.RequestException as e:
+        logger.error(f"ネットワークエラー: {e}")
+        return []
     except Exception as e:
         logger.error(f"予期しないエラー: {e}")
+        # 取得した記事を処理できなかったため、次回も条件なしで取得し直す
+        feed_cache.discard("hackernews")
         return []
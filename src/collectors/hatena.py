@@ -1,14 +1,12 @@
 """はてなブックマーク RSS取得モジュール"""
 
-import socket
-import urllib.error
-from datetime import datetime
 from typing import Any
 from urllib.parse import urlparse
 
-import feedparser
+import requests
 
 from src.utils.config import HATENA_RSS_URL, PRIORITY_TOPIC_LIMIT, RSS_TIMEOUT
+from src.utils.feed import feed_cache, fetch_feed
 from src.utils.logger import get_logger
 
 logger = get_logger("collectors.hatena")
@@ -36,63 +34,34 @@ def fetch_hotentry_articles() -> list[dict[str, Any]]:
     logger.info("はてなブックマーク ホットエントリの取得を開始")
 
     try:
-        socket.setdefaulttimeout(RSS_TIMEOUT)
-
-        feed = feedparser.parse(
-            HATENA_RSS_URL,
-            request_headers={"User-Agent": "TechTrendCollector/1.0"},
-        )
-
-        if hasattr(feed, "bozo") and feed.bozo:
-            if hasattr(feed, "bozo_exception"):
-                logger.warning(f"RSSパースに問題がありました: {feed.bozo_exception}")
+        entries = fetch_feed(HATENA_RSS_URL, "hatena")
+        if entries is None:
+            # 前回から更新なし（304）: パースを省略
+            return []
 
-        if not feed.entries:
+        if not entries:
             logger.warning("はてなブックマーク RSSから記事が取得できませんでした")
             return []
 
         articles = []
 
-        for entry in feed.entries:
+        for entry in entries:
             try:
-                url = entry.link if hasattr(entry, "link") else ""
+                url = entry["link"]
 
                 # Qiita/Zenn URLを除外
                 if _is_excluded_domain(url):
                     logger.debug(f"[スキップ] 除外ドメイン: {url}")
                     continue
 
-                # 公開日時のパース
-                published = None
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    published = datetime(*entry.published_parsed[:6]).isoformat()
-
-                # 著者情報
-                author = ""
-                if hasattr(entry, "author"):
-                    author = entry.author
-
-                # タグ（dc:subject）
-                tags = []
-                if hasattr(entry, "tags"):
-                    tags = [tag.term for tag in entry.tags if hasattr(tag, "term")]
-
-                # ブックマーク数
-                bookmarks = 0
-                if hasattr(entry, "hatena_bookmarkcount"):
-                    try:
-                        bookmarks = int(entry.hatena_bookmarkcount)
-                    except (ValueError, TypeError):
-                        pass
-
                 article = {
-                    "title": entry.title,
+                    "title": entry["title"],
                     "url": url,
-                    "author": author,
-                    "published": published,
-                    "tags": tags,
+                    "author": entry["author"],
+                    "published": entry["published"],
+                    "tags": entry["tags"],  # dc:subject
                     "source": "hatena",
-                    "bookmarks": bookmarks,
+                    "bookmarks": entry["bookmarkcount"] or 0,
                 }
                 articles.append(article)
             except Exception as e:
@@ -105,14 +74,16 @@ def fetch_hotentry_articles() -> list[dict[str, Any]]:
         logger.info(f"はてなブックマーク から {len(articles)} 件の記事を取得完了")
         return articles
 
-    except urllib.error.URLError as e:
-        logger.error(f"ネットワークエラー: {e}")
-        return []
-    except socket.timeout:
+    except requests.Timeout:
         logger.error(f"タイムアウト ({RSS_TIMEOUT}秒)")
         return []
+    except requests.RequestException as e:
+        logger.error(f"ネットワークエラー: {e}")
+        return []
     except Exception as e:
         logger.error(f"予期しないエラー: {e}")
+        # 取得した記事を処理できなかったため、次回も条件なしで取得し直す
+        feed_cache.discard("hatena")
         return []
 
 
@@ -1,16 +1,21 @@
 """Qiita RSS取得モジュール"""
 
-import json
-import socket
-import urllib.error
-import urllib.request
-from datetime import datetime
-from typing import Any
+import threading
+from typing import Any, Callable
 from urllib.parse import urlparse
 
-import feedparser
-
-from src.utils.config import PRIORITY_TOPIC_LIMIT, QIITA_RSS_URL, RSS_TIMEOUT
+import requests
+
+from src.utils.concurrency import host_slot, map_bounded
+from src.utils.config import (
+    API_TIMEOUT,
+    ENRICH_MAX_WORKERS,
+    PRIORITY_TOPIC_LIMIT,
+    QIITA_RSS_URL,
+    RSS_TIMEOUT,
+)
+from src.utils.feed import feed_cache, fetch_feed
+from src.utils.http_client import http_client
 from src.utils.logger import get_logger
 
 logger = get_logger("collectors.qiita")
@@ -31,22 +36,90 @@ def _extract_item_id(url: str) -> str | None:
     return None
 
 
-def _fetch_likes_count(item_id: str) -> int:
-    """Qiita APIからいいね数を取得する"""
+def _fetch_likes_count(item_id: str) -> int | None:
+    """Qiita APIからいいね数を取得する
+
+    Returns:
+        いいね数。取得失敗時はNone
+    """
     try:
         url = f"https://qiita.com/api/v2/items/{item_id}"
-        req = urllib.request.Request(url, headers={"User-Agent": "TechTrendCollector/1.0"})
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode("utf-8"))
-            return data.get("likes_count", 0)
+        with host_slot("qiita.com"):
+            data = http_client.get_json(url, timeout=API_TIMEOUT)
+        return data.get("likes_count", 0)
     except Exception as e:
         logger.debug(f"Qiita APIからいいね数の取得に失敗 (item_id={item_id}): {e}")
-        return 0
+        return None
+
 
+def _enrich_likes(
+    articles: list[dict[str, Any]],
+    stats: dict[str, Any] | None = None,
+    is_known: Callable[[str], bool] | None = None,
+    cancel: threading.Event | None = None,
+) -> None:
+    """記事リストのいいね数をQiita APIから並行取得して設定する
 
-def fetch_trending_articles() -> list[dict[str, Any]]:
+    Args:
+        articles: いいね数を設定する記事リスト（インプレースで更新）
+        stats: 統計情報（指定時は失敗件数・スキップ件数を記録）
+        is_known: 取得済みURL判定関数。Trueの記事はAPI呼び出しをスキップする
+        cancel: 収集の打ち切りイベント。セット後は残りのAPI呼び出しを行わない
+    """
+    skipped = 0
+    if is_known is not None:
+        candidates = []
+        for a in articles:
+            if is_known(a["url"]):
+                skipped += 1
+            else:
+                candidates.append(a)
+    else:
+        candidates = articles
+
+    if stats is not None:
+        stats["qiita_likes_skipped"] = skipped
+    if skipped:
+        logger.info(f"Qiita 取得済み記事 {skipped}件のいいね数取得をスキップ")
+
+    targets = [(a, _extract_item_id(a["url"])) for a in candidates]
+    targets = [(a, item_id) for a, item_id in targets if item_id]
+    if not targets:
+        return
+
+    def fetch(item_id: str) -> int | None:
+        if cancel is not None and cancel.is_set():
+            return None
+        return _fetch_likes_count(item_id)
+
+    results = map_bounded(fetch, [item_id for _, item_id in targets], ENRICH_MAX_WORKERS)
+
+    failed = 0
+    for (article, _), likes in zip(targets, results):
+        if likes is None:
+            failed += 1
+            continue
+        article["likes"] = likes
+
+    if failed:
+        logger.warning(f"Qiita いいね数の取得に失敗: {failed}/{len(targets)}件")
+    if stats is not None:
+        stats["qiita_likes_failed"] = failed
+
+
+def fetch_trending_articles(
+    stats: dict[str, Any] | None = None,
+    is_known: Callable[[str], bool] | None = None,
+    cancel: threading.Event | None = None,
+) -> list[dict[str, Any]]:
     """Qiitaのトレンド記事を取得する
 
+    Args:
+        stats: 統計情報（指定時はいいね数取得の失敗件数・スキップ件数を記録）
+        is_known: 取得済みURL判定関数（例: Deduplicator.is_duplicate）。
+            該当記事はいいね数のAPI取得を行わない
+        cancel: 収集の打ち切りイベント（タイムアウト時にセットされる）
+
     Returns:
         記事情報のリスト（タイトル、URL、著者、公開日時、タグ、ソース）
         取得失敗時は空リスト
@@ -55,71 +128,52 @@ def fetch_trending_articles() -> list[dict[str, Any]]:
 
     try:
         # タイムアウト付きでRSSを取得
-        feed = feedparser.parse(
-            QIITA_RSS_URL,
-            request_headers={"User-Agent": "TechTrendCollector/1.0"},
-        )
-
-        # feedparserの内部でタイムアウトを設定
-        socket.setdefaulttimeout(RSS_TIMEOUT)
-
-        # フィードのステータスチェック
-        if hasattr(feed, "bozo") and feed.bozo:
-            if hasattr(feed, "bozo_exception"):
-                logger.warning(f"RSSパースに問題がありました: {feed.bozo_exception}")
+        entries = fetch_feed(QIITA_RSS_URL, "qiita")
+        if entries is None:
+            # 前回から更新なし（304）: パース・いいね数取得を省略
+            return []
 
-        if not feed.entries:
+        if not entries:
             logger.warning("Qiita RSSから記事が取得できませんでした")
             return []
 
         articles = []
 
-        for entry in feed.entries:
+        for entry in entries:
             try:
-                # タグの取得（Atomフィードのcategory）
-                tags = []
-                if hasattr(entry, "tags"):
-                    tags = [tag.term for tag in entry.tags]
-
-                # 公開日時のパース
-                published = None
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    published = datetime(*entry.published_parsed[:6]).isoformat()
-
-                # いいね数をAPIから取得
-                likes = 0
-                item_id = _extract_item_id(entry.link)
-                if item_id:
-                    likes = _fetch_likes_count(item_id)
-
                 article = {
-                    "title": entry.title,
-                    "url": entry.link,
-                    "author": entry.author if hasattr(entry, "author") else "",
-                    "published": published,
-                    "tags": tags,
+                    "title": entry["title"],
+                    "url": entry["link"],
+                    "author": entry["author"],
+                    "published": entry["published"],
+                    "tags": entry["tags"],  # Atomフィードのcategory
                     "source": "qiita",
-                    "likes": likes,
+                    "likes": 0,
                 }
                 articles.append(article)
             except Exception as e:
                 logger.warning(f"記事のパースに失敗: {e}")
                 continue
 
+        # いいね数をAPIから並行取得（フィード順は保持）
+        _enrich_likes(articles, stats, is_known, cancel)
+
         # いいね数で降順ソート
         articles.sort(key=lambda a: a["likes"], reverse=True)
 
         logger.info(f"Qiita から {len(articles)} 件の記事を取得完了")
         return articles
 
-    except urllib.error.URLError as e:
-        logger.error(f"ネットワークエラー: {e}")
-        return []
-    except socket.timeout:
+    except requests.Timeout:
         logger.error(f"タイムアウト ({RSS_TIMEOUT}秒)")
         return []
+    except requests.RequestException as e:
+        logger.error(f"ネットワークエラー: {e}")
+        return []
     except Exception as e:
         logger.error(f"予期しないエラー: {e}")
+        # 取得した記事を処理できなかったため、次回も条件なしで取得し直す
+        feed_cache.discard("qiita")
         return []
 
 
@@ -137,10 +191,8 @@ def fetch_articles_by_tag(tag: str) -> list[dict[str, Any]]:
 
     try:
         url = f"https://qiita.com/api/v2/tags/{tag}/items?page=1&per_page={PRIORITY_TOPIC_LIMIT}&sort=stock"
-        req = urllib.request.Request(url, headers={"User-Agent": "TechTrendCollector/1.0"})
-
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        with host_slot("qiita.com"):
+            data = http_client.get_json(url, timeout=API_TIMEOUT)
 
         articles = []
         for item in data:
@@ -0,0 +1,94 @@
+"""記事ファイル → 日別まとめファイル 変換スクリプト
+
+articles/YYYY-MM-DD/ 配下の記事ごとのマークダウンファイルを読み込み、
+同じディレクトリの index.md（OUTPUT_MODE = "daily" の形式）にまとめる。
+
+使い方:
+    PYTHONPATH=. python src/convert_articles.py              # 全日付を変換し、元ファイルを削除
+    PYTHONPATH=. python src/convert_articles.py 2026-02-22   # 指定日のみ
+    PYTHONPATH=. python src/convert_articles.py --keep       # 元ファイルを残す
+"""
+
+import argparse
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from src.generators.markdown import DAILY_INDEX_FILENAME, parse_article_markdown, save_daily_bundle
+from src.utils.config import ARTICLES_DIR
+from src.utils.logger import get_logger
+
+logger = get_logger("convert_articles")
+
+_DATE_DIR = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def convert_directory(directory: Path, keep: bool = False) -> int:
+    """1日分のディレクトリを日別まとめファイルに変換する
+
+    Args:
+        directory: articles/YYYY-MM-DD ディレクトリ
+        keep: 元ファイルを残す場合True
+
+    Returns:
+        変換した記事数
+    """
+    files = sorted(path for path in directory.glob("*.md") if path.name != DAILY_INDEX_FILENAME)
+    if not files:
+        return 0
+
+    articles = []
+    converted_files = []
+    for path in files:
+        article = parse_article_markdown(path.read_text(encoding="utf-8"))
+        if article is None:
+            logger.warning(f"記事情報を読み取れないためスキップ: {path}")
+            continue
+        articles.append(article)
+        converted_files.append(path)
+
+    save_daily_bundle(articles, datetime.strptime(directory.name, "%Y-%m-%d"))
+
+    if not keep:
+        for path in converted_files:
+            path.unlink()
+    logger.info(f"{directory.name}: {len(converted_files)}件を {DAILY_INDEX_FILENAME} に変換しました")
+    return len(converted_files)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """メイン処理
+
+    Returns:
+        終了コード（0: 正常, 1: エラー）
+    """
+    parser = argparse.ArgumentParser(description="記事ごとのマークダウンを日別まとめファイルに変換する")
+    parser.add_argument("dates", nargs="*", help="変換する日付（YYYY-MM-DD, 省略時は全て）")
+    parser.add_argument("--keep", action="store_true", help="元の記事ファイルを削除しない")
+    args = parser.parse_args(argv)
+
+    if args.dates:
+        directories = [ARTICLES_DIR / date for date in args.dates]
+    else:
+        directories = sorted(
+            path for path in ARTICLES_DIR.iterdir() if path.is_dir() and _DATE_DIR.match(path.name)
+        )
+
+    total = 0
+    for directory in directories:
+        if not directory.is_dir():
+            logger.error(f"ディレクトリが存在しません: {directory}")
+            return 1
+        try:
+            total += convert_directory(directory, keep=args.keep)
+        except Exception as e:
+            logger.error(f"{directory.name} の変換に失敗しました: {e}")
+            return 1
+
+    logger.info(f"変換完了: {len(directories)}日分, {total}件")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
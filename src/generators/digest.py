@@ -0,0 +1,371 @@
+"""ダイジェスト生成モジュール
+
+1回分の記事を1パスでソース別・優先トピック別にグループ化し、ソースごとのメトリクス
+（いいね数・ポイント数・ブックマーク数）の降順に並べたダイジェストを作る。
+ダイジェストは事前にコンパイルしたテンプレートで、メール（HTML）・日別まとめ
+（マークダウン）・テキストのいずれにも描画できる。
+"""
+
+import hashlib
+import html
+from string import Template
+from typing import Any
+
+# ソース名の表示用マッピング（並び順はダイジェストのソース順）
+SOURCE_DISPLAY_NAMES = {
+    "qiita": "Qiita",
+    "zenn": "Zenn",
+    "hackernews": "Hacker News",
+    "hatena": "はてなブックマーク",
+}
+
+# ソースごとのメトリクス（記事情報のキー, 表示単位）
+SOURCE_METRICS = {
+    "qiita": ("likes", "likes"),
+    "zenn": ("likes", "likes"),
+    "hackernews": ("points", "points"),
+    "hatena": ("bookmarks", "users"),
+}
+
+_SOURCE_RANK = {source: rank for rank, source in enumerate(SOURCE_DISPLAY_NAMES)}
+
+# HTMLメール
+_HTML_SOURCE_ITEM = Template('  <li><a href="$url">$title</a>$metric$original</li>')
+_HTML_TOPIC_ITEM = Template('  <li>[$source] <a href="$url">$title</a>$metric</li>')
+_HTML_LIST = Template("<h3>$heading</h3>\n<ul>\n$items\n</ul>\n")
+_HTML_PRIORITY = Template("<h2>AWS/Python 注目記事</h2>\n$sections<hr>\n")
+_HTML_BODY = Template(
+    "$priority"
+    "<h2>📰 本日のトレンド記事</h2>\n"
+    "<p><strong>取得件数:</strong> Qiita $qiita_fetched件 / Zenn $zenn_fetched件 / "
+    "Hacker News $hn_fetched件 / はてなブックマーク $hatena_fetched件</p>\n"
+    "<p><strong>新規保存:</strong> $new_articles件</p>\n"
+    "$sections"
+    "<hr>\n"
+    "<p>\n"
+    '  <a href="$details_url">\n'
+    "    📁 GitHubで詳細を見る\n"
+    "  </a>\n"
+    "</p>"
+)
+
+# テキスト（Webhookなど）
+_TEXT_ITEM = Template("- $prefix$title$metric $url")
+_TEXT_BODY = Template(
+    "新規保存: $new_articles件 (Qiita $qiita_fetched / Zenn $zenn_fetched / "
+    "Hacker News $hn_fetched / はてなブックマーク $hatena_fetched件取得)\n"
+    "$sections"
+    "\n$details_url"
+)
+
+# 日別まとめ（マークダウン）
+_MD_SECTION_HEADER = Template("<!-- section: $key -->\n$heading\n\n")
+_MD_ENTRY = Template(
+    '<a id="$anchor"></a>\n'
+    "### $title$metric\n"
+    "\n"
+    "$original"
+    "- **URL**: $url\n"
+    "- **ソース**: $source\n"
+    "- **著者**: $author\n"
+    "- **公開日時**: $published\n"
+    "$tags"
+    "$related"
+    "\n\n"
+)
+_MD_DOCUMENT_HEADER = Template("# $date の記事\n\n")
+
+
+def source_label(source: str) -> str:
+    """ソースの表示名を返す"""
+    return SOURCE_DISPLAY_NAMES.get(source, source.capitalize())
+
+
+def metric_value(article: dict[str, Any]) -> int:
+    """記事のソースに応じたメトリクス値を返す（メトリクスがないソースは0）"""
+    metric = SOURCE_METRICS.get(article.get("source", ""))
+    return (article.get(metric[0]) or 0) if metric else 0
+
+
+def metric_label(article: dict[str, Any]) -> str:
+    """記事のメトリクスラベルを生成する
+
+    Args:
+        article: 記事情報
+
+    Returns:
+        メトリクスラベル文字列（例: "123 users", "45 points", "67 likes"）
+        メトリクスがない場合は空文字列
+    """
+    metric = SOURCE_METRICS.get(article.get("source", ""))
+    if not metric:
+        return ""
+    value = article.get(metric[0]) or 0
+    return f"{value} {metric[1]}" if value else ""
+
+
+def article_anchor(url: str) -> str:
+    """記事URLから日別まとめファイル内のアンカーIDを生成する"""
+    return "a-" + hashlib.blake2b(url.encode("utf-8"), digest_size=6).hexdigest()
+
+
+def original_title(article: dict[str, Any]) -> str:
+    """翻訳した記事の原題（翻訳していない場合は空文字列）"""
+    title_en = article.get("title_en")
+    return title_en if title_en and title_en != article["title"] else ""
+
+
+class DigestItem:
+    """ダイジェストの1記事（メトリクスはグループ化時に1回だけ計算する）"""
+
+    __slots__ = ("article", "metric", "metric_label")
+
+    def __init__(self, article: dict[str, Any]):
+        self.article = article
+        self.metric = metric_value(article)
+        self.metric_label = metric_label(article)
+
+
+class DigestSection:
+    """ソースまたは優先トピックごとの記事グループ"""
+
+    __slots__ = ("kind", "name", "items")
+
+    def __init__(self, kind: str, name: str):
+        self.kind = kind  # "source" / "topic"
+        self.name = name
+        self.items: list[DigestItem] = []
+
+    @property
+    def key(self) -> str:
+        """セクションキー（例: "source:qiita", "topic:aws"）"""
+        return f"{self.kind}:{self.name}"
+
+
+class Digest:
+    """1回分の記事のダイジェスト
+
+    sources はソース順、topics は優先トピック名の順に並ぶ。各セクションの記事は
+    メトリクスの降順（同値は入力順）、優先トピックはソース順 → メトリクスの降順に並ぶ。
+    """
+
+    __slots__ = ("target_date", "stats", "sources", "topics")
+
+    def __init__(self, target_date: str, stats: dict[str, Any]):
+        self.target_date = target_date
+        self.stats = stats
+        self.sources: list[DigestSection] = []
+        self.topics: list[DigestSection] = []
+
+    def sections(self) -> list[DigestSection]:
+        """全セクション（ソース → 優先トピックの順）"""
+        return self.sources + self.topics
+
+
+def build_digest(
+    articles: list[dict[str, Any]],
+    target_date: str = "",
+    stats: dict[str, Any] | None = None,
+    priority_articles: list[dict[str, Any]] | None = None,
+) -> Digest:
+    """記事をソース別・優先トピック別にグループ化したダイジェストを作る
+
+    Args:
+        articles: 記事情報のリスト（ソース別セクションに入る）
+        target_date: 対象日付（YYYY-MM-DD形式）
+        stats: 統計情報（取得件数などの表示に使う）
+        priority_articles: 優先トピック記事情報（topic, articles を持つ辞書のリスト）
+
+    Returns:
+        ダイジェスト
+    """
+    digest = Digest(target_date, stats or {})
+
+    by_source: dict[str, DigestSection] = {}
+    for article in articles:
+        source = article.get("source", "")
+        section = by_source.get(source)
+        if section is None:
+            section = by_source[source] = DigestSection("source", source)
+        section.items.append(DigestItem(article))
+
+    by_topic: dict[str, DigestSection] = {}
+    for entry in priority_articles or []:
+        if not entry["articles"]:
+            continue
+        topic = entry["topic"].lower()
+        section = by_topic.get(topic)
+        if section is None:
+            section = by_topic[topic] = DigestSection("topic", topic)
+        section.items.extend(DigestItem(article) for article in entry["articles"])
+
+    for section in by_source.values():
+        section.items.sort(key=lambda item: -item.metric)
+    for section in by_topic.values():
+        section.items.sort(
+            key=lambda item: (_SOURCE_RANK.get(item.article.get("source", ""), len(_SOURCE_RANK)), -item.metric)
+        )
+
+    digest.sources = sorted(by_source.values(), key=lambda section: _SOURCE_RANK.get(section.name, len(_SOURCE_RANK)))
+    digest.topics = sorted(by_topic.values(), key=lambda section: section.name)
+    return digest
+
+
+def _counts(digest: Digest) -> dict[str, Any]:
+    """テンプレートに渡す取得件数"""
+    stats = digest.stats
+    return {
+        key: stats.get(key, 0)
+        for key in ("qiita_fetched", "zenn_fetched", "hn_fetched", "hatena_fetched", "new_articles")
+    }
+
+
+def render_html(digest: Digest, details_url: str) -> str:
+    """ダイジェストをメール本文HTMLに描画する
+
+    Args:
+        digest: ダイジェスト
+        details_url: 記事一覧（GitHub）へのリンク
+
+    Returns:
+        HTML文字列
+    """
+    escape = html.escape
+
+    priority = ""
+    if digest.topics:
+        priority = _HTML_PRIORITY.substitute(
+            sections="".join(
+                _HTML_LIST.substitute(
+                    heading=escape(section.name.upper()),
+                    items="\n".join(
+                        _HTML_TOPIC_ITEM.substitute(
+                            source=escape(source_label(item.article.get("source", ""))),
+                            url=escape(item.article["url"]),
+                            title=escape(item.article["title"]),
+                            metric=f" ({item.metric_label})" if item.metric_label else "",
+                        )
+                        for item in section.items
+                    ),
+                )
+                for section in digest.topics
+            )
+        )
+
+    sections = "".join(
+        _HTML_LIST.substitute(
+            heading=escape(source_label(section.name)),
+            items="\n".join(
+                _HTML_SOURCE_ITEM.substitute(
+                    url=escape(item.article["url"]),
+                    title=escape(item.article["title"]),
+                    metric=f" ({item.metric_label})" if item.metric_label else "",
+                    original=f"<br><small>{escape(original)}</small>" if (original := original_title(item.article)) else "",
+                )
+                for item in section.items
+            ),
+        )
+        for section in digest.sources
+    )
+
+    return _HTML_BODY.substitute(
+        priority=priority, sections=sections, details_url=escape(details_url), **_counts(digest)
+    )
+
+
+def render_text(digest: Digest, details_url: str) -> str:
+    """ダイジェストをテキスト本文に描画する
+
+    Args:
+        digest: ダイジェスト
+        details_url: 記事一覧（GitHub）へのリンク
+
+    Returns:
+        テキスト
+    """
+    blocks = []
+    for section in digest.topics:
+        items = "\n".join(
+            _TEXT_ITEM.substitute(
+                prefix=f"[{source_label(item.article.get('source', ''))}] ",
+                title=item.article["title"],
+                metric=f" ({item.metric_label})" if item.metric_label else "",
+                url=item.article["url"],
+            )
+            for item in section.items
+        )
+        blocks.append(f"\n■ {section.name.upper()}\n{items}\n")
+    for section in digest.sources:
+        items = "\n".join(
+            _TEXT_ITEM.substitute(
+                prefix="",
+                title=item.article["title"],
+                metric=f" ({item.metric_label})" if item.metric_label else "",
+                url=item.article["url"],
+            )
+            for item in section.items
+        )
+        blocks.append(f"\n■ {source_label(section.name)}\n{items}\n")
+
+    return _TEXT_BODY.substitute(sections="".join(blocks), details_url=details_url, **_counts(digest))
+
+
+def markdown_section_header(section: DigestSection) -> str:
+    """日別まとめファイルのセクション見出し（セクションマーカー付き）"""
+    if section.kind == "topic":
+        heading = f"## 優先トピック: {section.name}"
+    else:
+        heading = f"## {source_label(section.name)}"
+    return _MD_SECTION_HEADER.substitute(key=section.key, heading=heading)
+
+
+def markdown_entry(article: dict[str, Any], label: str | None = None) -> str:
+    """日別まとめファイルの記事エントリ（アンカー付き）を描画する
+
+    Args:
+        article: 記事情報
+        label: メトリクスラベル（省略時は記事情報から生成）
+
+    Returns:
+        マークダウン文字列（末尾に空行を含む）
+    """
+    if label is None:
+        label = metric_label(article)
+    original = original_title(article)
+    tags = article.get("tags")
+    related = "".join(
+        f"- **関連記事**: [{item['title']}]({item['url']}) ({SOURCE_DISPLAY_NAMES.get(item['source'], item['source'])})\n"
+        for item in article.get("related", [])
+    )
+    return _MD_ENTRY.substitute(
+        anchor=article_anchor(article["url"]),
+        title=article["title"],
+        metric=f" ({label})" if label else "",
+        original=f"- **原題**: {original}\n" if original else "",
+        url=article["url"],
+        source=source_label(article["source"]),
+        author=article["author"] or "不明",
+        published=article["published"] or "不明",
+        tags=f"- **タグ**: {', '.join(tags)}\n" if tags else "",
+        related=related,
+    )
+
+
+def markdown_section_entries(section: DigestSection) -> str:
+    """セクション内の記事エントリを描画する（見出しなし、既存セクションへの追記用）"""
+    return "".join(markdown_entry(item.article, item.metric_label) for item in section.items)
+
+
+def render_markdown(digest: Digest) -> str:
+    """ダイジェストを日別まとめファイル（index.md）の形式に描画する
+
+    Args:
+        digest: ダイジェスト
+
+    Returns:
+        マークダウン文字列
+    """
+    return _MD_DOCUMENT_HEADER.substitute(date=digest.target_date) + "".join(
+        markdown_section_header(section) + markdown_section_entries(section)
+        for section in digest.sections()
+    )
@@ -1,45 +1,51 @@
 """マークダウン生成モジュール"""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from src.utils.config import ARTICLES_DIR
+from src.generators.digest import (
+    SOURCE_DISPLAY_NAMES,
+    article_anchor,
+    build_digest,
+    markdown_section_entries,
+    markdown_section_header,
+    metric_label,
+    original_title,
+    render_markdown,
+    source_label,
+)
+from src.utils.config import ARTICLES_DIR, MARKDOWN_WRITE_WORKERS, OUTPUT_MODE
+from src.utils.logger import get_logger
 
-# ソース名の表示用マッピング
-SOURCE_DISPLAY_NAMES = {
-    "qiita": "Qiita",
-    "zenn": "Zenn",
-    "hackernews": "Hacker News",
-    "hatena": "はてなブックマーク",
-}
+logger = get_logger("generators.markdown")
 
+# ファイル名に使用不可な文字・連続する空白
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE = re.compile(r"\s+")
 
-def _build_metric_label(article: dict[str, Any]) -> str:
-    """記事のメトリクスラベルを生成する
+# 既存ファイルの記事URL行
+_URL_LINE = re.compile(r"^- \*\*URL\*\*: (.+)$", re.MULTILINE)
 
-    Args:
-        article: 記事情報
+# 日別まとめファイル（OUTPUT_MODE = "daily"）
+DAILY_INDEX_FILENAME = "index.md"
+_SECTION_MARKER = re.compile(r"^<!-- section: (\S+) -->$", re.MULTILINE)
+_ANCHOR = re.compile(r'^<a id="(a-[0-9a-f]+)"></a>$', re.MULTILINE)
 
-    Returns:
-        メトリクスラベル文字列（例: "123 users", "45 points", "67 likes"）
-        メトリクスがない場合は空文字列
-    """
-    source = article.get("source", "")
-    if source == "hatena":
-        bookmarks = article.get("bookmarks", 0)
-        if bookmarks:
-            return f"{bookmarks} users"
-    elif source == "hackernews":
-        points = article.get("points", 0)
-        if points:
-            return f"{points} points"
-    elif source in ("qiita", "zenn"):
-        likes = article.get("likes", 0)
-        if likes:
-            return f"{likes} likes"
-    return ""
+# 保存済みマークダウンの読み取り（記事ごとのファイル・日別まとめファイル共通）
+_TITLE_LINE = re.compile(r"^#{1,3} (.+?)(?: \((\d+) (users|points|likes)\))?$")
+_FIELD_LINE = re.compile(r"^- \*\*(.+?)\*\*: (.*)$")
+_RELATED_LINE = re.compile(r"^- (?:\*\*関連記事\*\*: )?\[(.+)\]\((\S+)\) \((.+)\)$")
+
+# メトリクスラベルの単位 → 記事情報のキー
+_METRIC_KEYS = {"users": "bookmarks", "points": "points", "likes": "likes"}
+
+# 保存結果
+STATUS_CREATED = "created"
+STATUS_UPDATED = "updated"
+STATUS_UNCHANGED = "unchanged"
 
 
 def sanitize_filename(title: str) -> str:
@@ -52,11 +58,11 @@ def sanitize_filename(title: str) -> str:
         サニタイズされたファイル名
     """
     # ファイル名に使用不可な文字を除去
-    sanitized = re.sub(r'[<>:"/\\|?*]', "", title)
+    sanitized = _INVALID_FILENAME_CHARS.sub("", title)
     # 前後の空白を除去
     sanitized = sanitized.strip()
     # 連続する空白を単一の空白に置換
-    sanitized = re.sub(r"\s+", " ", sanitized)
+    sanitized = _WHITESPACE.sub(" ", sanitized)
     # 長すぎる場合は切り詰める
     # Linuxのファイル名上限は255バイト。拡張子(.md=3バイト)を考慮し、250バイトまでに制限
     max_bytes = 250
@@ -77,19 +83,19 @@ def generate_article_markdown(article: dict[str, Any]) -> str:
     Returns:
         マークダウン形式の文字列
     """
-    source_display = SOURCE_DISPLAY_NAMES.get(
-        article["source"], article["source"].capitalize()
-    )
+    source_display = source_label(article["source"])
 
     # メトリクスラベルの生成
-    metric_label = _build_metric_label(article)
-    title_suffix = f" ({metric_label})" if metric_label else ""
+    label = metric_label(article)
+    title_suffix = f" ({label})" if label else ""
+    original = original_title(article)
 
     lines = [
         f"# {article['title']}{title_suffix}",
         "",
         "## 記事情報",
         "",
+        *([f"- **原題**: {original}"] if original else []),
         f"- **URL**: {article['url']}",
         f"- **ソース**: {source_display}",
         f"- **著者**: {article['author'] or '不明'}",
@@ -100,6 +106,13 @@ def generate_article_markdown(article: dict[str, Any]) -> str:
         tags_str = ", ".join(article["tags"])
         lines.append(f"- **タグ**: {tags_str}")
 
+    # 他ソースの類似記事
+    if article.get("related"):
+        lines.extend(["", "## 関連記事", ""])
+        for related in article["related"]:
+            related_display = SOURCE_DISPLAY_NAMES.get(related["source"], related["source"])
+            lines.append(f"- [{related['title']}]({related['url']}) ({related_display})")
+
     lines.append("")
 
     return "\n".join(lines)
@@ -117,21 +130,295 @@ def save_markdown(
     Returns:
         保存したファイルのパス
     """
+    _, filepath, _ = save_markdown_batch([article], date)[0]
+    return filepath
+
+
+def _is_available(filepath: Path, url: str) -> bool:
+    """ファイル名が記事に使えるか（存在しないか、同じ記事のURLが記録されているか）"""
+    if not filepath.exists():
+        return True
+    try:
+        match = _URL_LINE.search(filepath.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError):
+        return False
+    return match is not None and match.group(1).strip() == url
+
+
+def _with_suffix_number(base: str, number: int) -> str:
+    """ファイル名（拡張子なし）に連番を付ける（バイト数の上限を超えないよう切り詰める）"""
+    suffix = f" ({number})"
+    max_bytes = 250 - len(suffix.encode("utf-8"))
+    truncated = base.encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore").rstrip()
+    return truncated + suffix
+
+
+def _write_if_changed(filepath: Path, content: str) -> str:
+    """内容が変わった場合のみファイルを書き込む
+
+    Returns:
+        STATUS_CREATED / STATUS_UPDATED / STATUS_UNCHANGED
+    """
+    data = content.encode("utf-8")
+    if filepath.exists():
+        if filepath.read_bytes() == data:
+            return STATUS_UNCHANGED
+        status = STATUS_UPDATED
+    else:
+        status = STATUS_CREATED
+    filepath.write_bytes(data)
+    return status
+
+
+def save_markdown_batch(
+    articles: list[dict[str, Any]], date: datetime | None = None
+) -> list[tuple[dict[str, Any], Path, str]]:
+    """複数の記事のマークダウンファイルをまとめて保存する
+
+    日付ディレクトリの作成は1回だけ行う。サニタイズ後のファイル名が他の記事と衝突する場合は、
+    記事の並び順に " (2)", " (3)" ... を付けて決定的に解決する（同じ記事のURLが記録された
+    既存ファイルは上書き対象とみなす）。内容が既存ファイルと同一の場合は書き込まない。
+
+    Args:
+        articles: 記事情報のリスト
+        date: 保存日付（指定がなければ今日）
+
+    Returns:
+        (記事, 保存先パス, 状態) のリスト（入力順）。状態は "created" / "updated" / "unchanged"
+    """
+    if not articles:
+        return []
+    if date is None:
+        date = datetime.now()
+
+    # ディレクトリ作成（1回のみ）
+    output_dir = ARTICLES_DIR / date.strftime("%Y-%m-%d")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # ファイル名の決定（衝突は入力順に連番で解決）
+    planned: list[tuple[dict[str, Any], Path, str]] = []
+    used: set[str] = set()
+    for article in articles:
+        base = sanitize_filename(article["title"])
+        name = base
+        number = 1
+        while name in used or not _is_available(output_dir / f"{name}.md", article["url"]):
+            number += 1
+            name = _with_suffix_number(base, number)
+        filepath = output_dir / f"{name}.md"
+        used.add(name)
+        planned.append((article, filepath, generate_article_markdown(article)))
+
+    # 書き込み（内容が同一のファイルはスキップ）
+    with ThreadPoolExecutor(max_workers=max(1, min(MARKDOWN_WRITE_WORKERS, len(planned)))) as executor:
+        statuses = list(executor.map(lambda item: _write_if_changed(item[1], item[2]), planned))
+
+    results = [(article, filepath, status) for (article, filepath, _), status in zip(planned, statuses)]
+    written = sum(1 for _, _, status in results if status != STATUS_UNCHANGED)
+    logger.info(f"マークダウン保存: {written}件書き込み, {len(results) - written}件変更なし（{output_dir}）")
+    return results
+
+
+def _section_order(key: str) -> tuple[int, int, str]:
+    """セクションの並び順（ソース → 優先トピック）"""
+    kind, _, name = key.partition(":")
+    if kind == "source":
+        sources = list(SOURCE_DISPLAY_NAMES)
+        return (0, sources.index(name) if name in sources else len(sources), name)
+    return (1, 0, name)
+
+
+def parse_article_markdown(content: str) -> dict[str, Any] | None:
+    """保存済みのマークダウンから記事情報を復元する
+
+    generate_article_markdown / digest.markdown_entry の出力に対応する。
+
+    Args:
+        content: 1記事分のマークダウン
+
+    Returns:
+        記事情報（タイトルまたはURLが見つからない場合None）
+    """
+    source_keys = {display: key for key, display in SOURCE_DISPLAY_NAMES.items()}
+    article: dict[str, Any] = {"author": "", "published": "", "tags": [], "related": []}
+
+    for line in content.splitlines():
+        if "title" not in article and (match := _TITLE_LINE.match(line)):
+            article["title"] = match.group(1)
+            if match.group(2):
+                article[_METRIC_KEYS[match.group(3)]] = int(match.group(2))
+        elif match := _RELATED_LINE.match(line):
+            article["related"].append(
+                {
+                    "title": match.group(1),
+                    "url": match.group(2),
+                    "source": source_keys.get(match.group(3), match.group(3)),
+                }
+            )
+        elif match := _FIELD_LINE.match(line):
+            name, value = match.group(1), match.group(2).strip()
+            if name == "URL":
+                article["url"] = value
+            elif name == "原題":
+                article["title_en"] = value
+            elif name == "ソース":
+                article["source"] = source_keys.get(value, value.lower())
+            elif name == "著者":
+                article["author"] = "" if value == "不明" else value
+            elif name == "公開日時":
+                article["published"] = "" if value == "不明" else value
+            elif name == "タグ":
+                article["tags"] = [tag.strip() for tag in value.split(",") if tag.strip()]
+
+    if "url" not in article or "title" not in article:
+        return None
+    article.setdefault("source", "")
+    return article
+
+
+def load_saved_articles(directory: Path) -> list[tuple[dict[str, Any], Path]]:
+    """日付ディレクトリに保存済みの記事を読み込む
+
+    記事ごとのファイルと日別まとめファイル（index.md）の両方に対応する。
+    日別まとめファイルの記事には、セクション見出しから優先トピックを復元する。
+
+    Args:
+        directory: articles/YYYY-MM-DD ディレクトリ
+
+    Returns:
+        (記事情報, 保存先パス) のリスト。読み取れないファイルはスキップする
+    """
+    results = []
+    for path in sorted(directory.glob("*.md")):
+        try:
+            content = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"マークダウンの読み込みに失敗（スキップ）: {path}: {e}")
+            continue
+
+        if path.name != DAILY_INDEX_FILENAME:
+            article = parse_article_markdown(content)
+            if article is not None:
+                results.append((article, path))
+            continue
+
+        _, sections = _parse_daily_index(content)
+        for key, body in sections.items():
+            kind, _, name = key.partition(":")
+            anchors = list(_ANCHOR.finditer(body))
+            for anchor, following in zip(anchors, anchors[1:] + [None]):
+                end = following.start() if following else len(body)
+                article = parse_article_markdown(body[anchor.end():end])
+                if article is None:
+                    continue
+                if kind == "topic":
+                    article["priority_topic"] = name
+                results.append((article, path))
+    return results
+
+
+def _parse_daily_index(content: str) -> tuple[str, dict[str, str]]:
+    """日別まとめファイルをヘッダーとセクション（キー → 本文）に分割する"""
+    markers = list(_SECTION_MARKER.finditer(content))
+    if not markers:
+        return content, {}
+    header = content[:markers[0].start()]
+    sections = {}
+    for marker, following in zip(markers, markers[1:] + [None]):
+        end = following.start() if following else len(content)
+        sections[marker.group(1)] = content[marker.start():end]
+    return header, sections
+
+
+def save_daily_bundle(
+    articles: list[dict[str, Any]], date: datetime | None = None
+) -> list[tuple[dict[str, Any], Path, str]]:
+    """記事を日別まとめファイル（articles/YYYY-MM-DD/index.md）に追記する
+
+    記事はソース・優先トピックごとのセクションに、URLから生成したアンカー付きで追加する
+    （セクション分けと記事の並び順はダイジェストと同じ）。同じ日に複数回実行した場合は、
+    既存の記事セクションはそのまま残し、未記録の記事だけを該当セクションの末尾に追記する。
+
+    Args:
+        articles: 記事情報のリスト
+        date: 保存日付（指定がなければ今日）
+
+    Returns:
+        (記事, 保存先パス, 状態) のリスト（入力順）。既に記録済みの記事は "unchanged"
+    """
+    if not articles:
+        return []
     if date is None:
         date = datetime.now()
 
-    # ディレクトリ作成
     date_str = date.strftime("%Y-%m-%d")
     output_dir = ARTICLES_DIR / date_str
     output_dir.mkdir(parents=True, exist_ok=True)
+    filepath = output_dir / DAILY_INDEX_FILENAME
 
-    # ファイル名生成
-    filename = sanitize_filename(article["title"]) + ".md"
-    filepath = output_dir / filename
+    if filepath.exists():
+        content = filepath.read_text(encoding="utf-8")
+        header, sections = _parse_daily_index(content)
+        status_new = STATUS_UPDATED
+    else:
+        content = ""
+        header, sections = "", {}
+        status_new = STATUS_CREATED
+    existing_anchors = set(_ANCHOR.findall(content))
 
-    # マークダウン生成・保存
-    content = generate_article_markdown(article)
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
+    results = []
+    new_articles = []
+    for article in articles:
+        anchor = article_anchor(article["url"])
+        if anchor in existing_anchors:
+            results.append((article, filepath, STATUS_UNCHANGED))
+            continue
+        existing_anchors.add(anchor)
+        new_articles.append(article)
+        results.append((article, filepath, status_new))
 
-    return filepath
+    # 未記録の記事をソース・優先トピック別に（メトリクスの降順で）各セクションへ追記
+    digest = build_digest(
+        [article for article in new_articles if not article.get("priority_topic")],
+        date_str,
+        priority_articles=[
+            {"topic": article["priority_topic"], "articles": [article]}
+            for article in new_articles
+            if article.get("priority_topic")
+        ],
+    )
+
+    if new_articles:
+        if status_new == STATUS_CREATED:
+            new_content = render_markdown(digest)
+        else:
+            for section in digest.sections():
+                if section.key not in sections:
+                    sections[section.key] = markdown_section_header(section)
+                sections[section.key] += markdown_section_entries(section)
+            ordered = sorted(sections, key=_section_order)
+            new_content = header + "".join(sections[key] for key in ordered)
+        temp_file = filepath.with_suffix(".tmp")
+        temp_file.write_text(new_content, encoding="utf-8")
+        temp_file.replace(filepath)
+
+    written = sum(1 for _, _, status in results if status != STATUS_UNCHANGED)
+    logger.info(f"日別まとめに追記: {written}件追加, {len(results) - written}件記録済み（{filepath}）")
+    return results
+
+
+def save_articles(
+    articles: list[dict[str, Any]], date: datetime | None = None
+) -> list[tuple[dict[str, Any], Path, str]]:
+    """出力モード（OUTPUT_MODE）に応じて記事を保存する
+
+    Args:
+        articles: 記事情報のリスト
+        date: 保存日付（指定がなければ今日）
+
+    Returns:
+        (記事, 保存先パス, 状態) のリスト（入力順）
+    """
+    if OUTPUT_MODE == "daily":
+        return save_daily_bundle(articles, date)
+    return save_markdown_batch(articles, date)
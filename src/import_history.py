@@ -0,0 +1,37 @@
+"""history.json → SQLite履歴 取り込みスクリプト"""
+
+import sys
+
+from src.services.sqlite_history_store import SqliteHistoryStore
+from src.utils.config import HISTORY_FILE
+from src.utils.logger import get_logger
+
+logger = get_logger("import_history")
+
+
+def main() -> int:
+    """メイン処理
+
+    Returns:
+        終了コード（0: 正常, 1: エラー）
+    """
+    logger.info("history.json の取り込み開始")
+
+    if not HISTORY_FILE.exists():
+        logger.error(f"履歴ファイルが存在しません: {HISTORY_FILE}")
+        return 1
+
+    store = SqliteHistoryStore()
+    try:
+        imported = store.import_json(HISTORY_FILE)
+        logger.info(f"取り込み完了: {imported}件（合計{len(store)}件）")
+        return 0
+    except Exception as e:
+        logger.error(f"取り込みに失敗しました: {e}")
+        return 1
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
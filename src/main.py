@@ -2,18 +2,29 @@
 
 import sys
 from datetime import datetime
+from pathlib import Path
 
-from src.collectors import hackernews, hatena, qiita, zenn
-from src.generators.markdown import save_markdown
+from src.generators.markdown import DAILY_INDEX_FILENAME, STATUS_UNCHANGED, save_articles
+from src.services.collection import collect_articles
 from src.services.deduplicator import Deduplicator
+from src.services.near_duplicate import group_near_duplicates
 from src.services.notifier import (
+    enabled_channel_names,
     is_notifier_enabled,
+    notification_outbox,
     send_failure_notification,
     send_success_notification,
+    wait_for_notifications,
 )
+from src.services.search_index import update_search_index
+from src.services.translation_cache import translation_cache
 from src.services.translator import translate_hn_titles
-from src.utils.config import PRIORITY_TOPICS, validate_config
+from src.utils.config import NEAR_DUP_ENABLED, NEAR_DUP_WINDOW_DAYS, validate_config
+from src.utils.deadline import run_deadline
+from src.utils.feed import feed_cache
+from src.utils.http_client import http_client
 from src.utils.logger import get_logger
+from src.utils.url import canonicalize_url
 
 logger = get_logger("main")
 
@@ -31,6 +42,43 @@ def print_summary(stats: dict, execution_time: str, output_dir: str) -> None:
     hn_new = stats["hn_fetched"] - stats.get("hn_duplicates", 0)
     hatena_new = stats["hatena_fetched"] - stats.get("hatena_duplicates", 0)
 
+    latency_lines = "\n".join(
+        f"- {name}: {'タイムアウト' if seconds is None else f'{seconds}秒'}"
+        for name, seconds in stats.get("latency", {}).items()
+    ) or "- なし"
+
+    feed_lines = "\n".join(
+        f"- {source}: {'304 未更新' if info['status'] == 304 else info['status'] or '未取得'} "
+        f"(累計ヒット率: {info['not_modified']}/{info['requests']} = {info['rate']:.0%})"
+        for source, info in stats.get("feed_cache", {}).items()
+    ) or "- なし"
+
+    http_stats = stats.get("http", {})
+    translation_cache_stats = stats.get("translation_cache", {})
+    outbox_stats = stats.get("outbox", {})
+    channel_lines = "\n".join(
+        f"- {name}: 送信 {channel['sent']}件 / 失敗 {channel['failed']}件 ({channel['seconds']}秒)"
+        + (f" 最終エラー: {channel['last_error']}" if channel["last_error"] else "")
+        for name, channel in outbox_stats.get("channels", {}).items()
+    ) or "- 送信なし"
+    translation = stats.get("translation", {})
+    translation_lines = "\n".join(
+        f"- チャンク{number}: {chunk['titles']}件 {'成功' if chunk['ok'] else '失敗（英語のまま）'} "
+        f"({chunk['seconds']}秒, {chunk['attempts']}回, トークン: 入力 {chunk['prompt_tokens']} / 出力 {chunk['output_tokens']})"
+        for number, chunk in translation.get("chunks", {}).items()
+    ) or "- なし"
+
+    seen_filter = stats.get("seen_filter")
+    if seen_filter:
+        seen_filter_lines = (
+            f"- 登録件数: {seen_filter['count']:,}件 / 想定 {seen_filter['capacity']:,}件 "
+            f"({seen_filter['size_bytes']:,} bytes)\n"
+            f"- 推定偽陽性率: {seen_filter['fp_rate']:.2e} (目標: {seen_filter['target_fp_rate']:.0e})\n"
+            f"- 長期履歴で重複判定: {seen_filter['hits']}件"
+        )
+    else:
+        seen_filter_lines = "- 無効"
+
     summary = f"""
 ========================================
 TechTrendCollector 実行結果
@@ -42,55 +90,58 @@ TechTrendCollector 実行結果
 - Zenn:         {stats['zenn_fetched']}件取得 (新規: {zenn_new}件, 重複: {stats.get('zenn_duplicates', 0)}件)
 - Hacker News:  {stats['hn_fetched']}件取得 (新規: {hn_new}件, 重複: {stats.get('hn_duplicates', 0)}件)
 - はてなブックマーク: {stats['hatena_fetched']}件取得 (新規: {hatena_new}件, 重複: {stats.get('hatena_duplicates', 0)}件)
+- いいね数取得失敗: Qiita {stats.get('qiita_likes_failed', 0)}件, Zenn {stats.get('zenn_likes_failed', 0)}件
+- いいね数取得スキップ（取得済み）: Qiita {stats.get('qiita_likes_skipped', 0)}件, Zenn {stats.get('zenn_likes_skipped', 0)}件
+
+[取得時間]
+{latency_lines}
+
+[フィード条件付き取得 (ETag/Last-Modified)]
+{feed_lines}
+
+[HTTP通信]
+- リクエスト数: {http_stats.get('requests', 0)}件
+- 受信バイト数: {http_stats.get('bytes', 0):,} bytes
+- 接続: 新規 {http_stats.get('new_connections', 0)}件 / 再利用 {http_stats.get('reused_connections', 0)}件
+
+[HNタイトル翻訳]
+- 翻訳対象: 新規 {stats.get('hn_translation_targets', 0)}件 (取得 {stats['hn_fetched']}件から重複を除外)
+{translation_lines}
+- キャッシュヒット: {translation_cache_stats.get('hits', 0)}件 / ミス: {translation_cache_stats.get('misses', 0)}件
+- 保持件数: {translation_cache_stats.get('size', 0)}件 (期限切れ・上限超過で削除: {translation_cache_stats.get('evicted', 0)}件)
+
+[履歴]
+- 保持期間切れで削除: {stats.get('history_expired', 0)}件
+
+[長期重複判定 (ブルームフィルタ)]
+{seen_filter_lines}
 
 [マークダウン生成]
-- 生成ファイル数: {stats['new_articles']}件
+- 生成ファイル数: {stats.get('files_written', 0)}件 (内容が同一でスキップ: {stats.get('files_unchanged', 0)}件)
+- 類似記事として統合: {stats.get('near_duplicates', 0)}件
 - 出力先: {output_dir}
+- 検索インデックスに登録: {stats.get('search_indexed', 0)}件
 
 [優先トピック (AWS/Python)]
 - 取得記事数: {stats.get('priority_fetched', 0)}件 (新規: {stats.get('priority_new', 0)}件)
 
 [通知]
-- メール送信: {stats.get('notification_status', '未送信')}
+- 通知: {stats.get('notification_status', '未送信')}
+{channel_lines}
+- 送信待ちキュー: 送信 {outbox_stats.get('sent', 0)}件 / 未送信 {outbox_stats.get('pending', 0)}件 (送信失敗 {outbox_stats.get('failed_attempts', 0)}回)
 ========================================
 """
     print(summary)
     logger.info("実行結果サマリーを出力しました")
 
 
-def main() -> int:
-    """メイン処理
+def create_stats() -> dict:
+    """統計情報の初期値を生成する
 
     Returns:
-        終了コード（0: 正常, 1: エラー）
+        統計情報
     """
-    execution_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    target_date = datetime.now().strftime("%Y-%m-%d")
-
-    logger.info("=" * 50)
-    logger.info("TechTrendCollector - 記事収集開始")
-    logger.info("=" * 50)
-
-    # 設定バリデーション
-    logger.info("設定を検証中...")
-    is_valid, warnings = validate_config()
-    for warning in warnings:
-        logger.warning(warning)
-
-    # 通知機能確認
-    notifier_enabled = is_notifier_enabled()
-    if notifier_enabled:
-        logger.info("Resend 通知機能が有効です")
-    else:
-        logger.info("Resend 通知機能は無効です")
-
-    # 重複チェッカー初期化
-    deduplicator = Deduplicator()
-    if not deduplicator.load_history():
-        logger.warning("履歴ファイルの読み込みに問題がありました")
-
-    # 統計情報
-    stats = {
+    return {
         "qiita_fetched": 0,
         "zenn_fetched": 0,
         "hn_fetched": 0,
@@ -99,87 +150,120 @@ def main() -> int:
         "zenn_duplicates": 0,
         "hn_duplicates": 0,
         "hatena_duplicates": 0,
+        "qiita_likes_failed": 0,
+        "zenn_likes_failed": 0,
+        "qiita_likes_skipped": 0,
+        "zenn_likes_skipped": 0,
         "new_articles": 0,
+        "files_written": 0,
+        "files_unchanged": 0,
         "duplicates": 0,
         "priority_fetched": 0,
         "priority_new": 0,
+        "near_duplicates": 0,
+        "history_expired": 0,
+        "search_indexed": 0,
+        "hn_translation_targets": 0,
         "notification_status": "未送信",
+        "latency": {},
     }
 
-    # Qiita記事取得
-    logger.info("Qiita トレンド記事を取得中...")
-    qiita_articles = qiita.fetch_trending_articles()
-    stats["qiita_fetched"] = len(qiita_articles)
-
-    # Zenn記事取得
-    logger.info("Zenn トレンド記事を取得中...")
-    zenn_articles = zenn.fetch_trending_articles()
-    stats["zenn_fetched"] = len(zenn_articles)
-
-    # Hacker News記事取得
-    logger.info("Hacker News トップ記事を取得中...")
-    hn_articles = hackernews.fetch_top_articles()
-    stats["hn_fetched"] = len(hn_articles)
-
-    # HN記事タイトルを日本語に翻訳（Gemini API 1回呼び出し）
-    if hn_articles:
-        logger.info("Hacker News 記事タイトルを翻訳中...")
-        hn_articles = translate_hn_titles(hn_articles)
-
-    # はてなブックマーク記事取得
-    logger.info("はてなブックマーク ホットエントリを取得中...")
-    hatena_articles = hatena.fetch_hotentry_articles()
-    stats["hatena_fetched"] = len(hatena_articles)
-
-    # AWS/Python 優先トピック記事の取得
-    priority_articles: list[dict] = []  # {topic, source, articles} のリスト管理用
-    priority_all_articles: list[dict] = []  # 全優先記事のフラットリスト
 
-    for topic in PRIORITY_TOPICS:
-        logger.info(f"優先トピック '{topic}' の記事を取得中...")
+def record_fetched(collected: dict, stats: dict) -> None:
+    """取得件数を統計情報に記録する
 
-        # Qiita: タグ別API取得
-        topic_qiita = qiita.fetch_articles_by_tag(topic)
-        if topic_qiita:
-            priority_articles.append({"topic": topic, "source": "qiita", "articles": topic_qiita})
-            priority_all_articles.extend(topic_qiita)
+    Args:
+        collected: collect_articles の戻り値と同じ形式の取得結果
+        stats: 統計情報
+    """
+    stats["qiita_fetched"] = len(collected["qiita"])
+    stats["zenn_fetched"] = len(collected["zenn"])
+    stats["hn_fetched"] = len(collected["hackernews"])
+    stats["hatena_fetched"] = len(collected["hatena"])
+    stats["priority_fetched"] = sum(len(entry["articles"]) for entry in collected["priority"])
 
-        # Zenn: トピック別API取得
-        topic_zenn = zenn.fetch_articles_by_topic(topic)
-        if topic_zenn:
-            priority_articles.append({"topic": topic, "source": "zenn", "articles": topic_zenn})
-            priority_all_articles.extend(topic_zenn)
 
-        # はてなブックマーク: 取得済み記事からフィルタリング
-        topic_hatena = hatena.filter_articles_by_tag(hatena_articles, topic)
-        if topic_hatena:
-            priority_articles.append({"topic": topic, "source": "hatena", "articles": topic_hatena})
-            priority_all_articles.extend(topic_hatena)
+def finish_notifications(queued: Path | None, stats: dict, sent_status: str) -> None:
+    """送信待ちの通知の送信完了を待ち、結果を統計情報に記録する
 
-    stats["priority_fetched"] = len(priority_all_articles)
+    送信中の通知は完了まで待つ（OUTBOX_WAIT_TIMEOUT）が、送信に失敗した通知の再送は待たない。
+    送信できなかった通知は data/outbox/ に残り、次回の実行（通常は翌日の定期実行）で再送される。
 
-    # 全記事をマージ
-    all_articles = qiita_articles + zenn_articles + hn_articles + hatena_articles
+    Args:
+        queued: 今回登録した通知ファイル（登録に失敗した場合None）
+        stats: 統計情報
+        sent_status: 送信できた場合の notification_status
+    """
+    stats["outbox"] = wait_for_notifications()
+    if queued is None:
+        stats["notification_status"] = "失敗"
+    elif queued.exists():
+        stats["notification_status"] = "送信待ち（次回実行時に再送）"
+    else:
+        stats["notification_status"] = sent_status
+
+
+def process_collected(
+    collected: dict,
+    stats: dict,
+    deduplicator: Deduplicator,
+    notifier_enabled: bool,
+    execution_time: str,
+) -> int:
+    """取得結果の重複チェック・マークダウン保存・履歴保存・通知を行う
+
+    Args:
+        collected: collect_articles の戻り値と同じ形式の取得結果
+        stats: 統計情報
+        deduplicator: 履歴を読み込み済みの重複チェッカー
+        notifier_enabled: 通知を送信するかどうか
+        execution_time: 実行日時
+
+    Returns:
+        終了コード（0: 正常, 1: エラー）
+    """
+    target_date = datetime.now().strftime("%Y-%m-%d")
 
-    # 全ソース失敗チェック
-    if stats["qiita_fetched"] == 0 and stats["zenn_fetched"] == 0 and stats["hn_fetched"] == 0 and stats["hatena_fetched"] == 0:
+    # AWS/Python 優先トピック記事（{topic, source, articles} のリスト）
+    priority_articles: list[dict] = collected["priority"]
+    priority_all_articles: list[dict] = []  # 全優先記事のフラットリスト
+    priority_topics: dict[int, str] = {}  # id(記事) → 優先トピック（最初に現れたトピック）
+    for entry in priority_articles:
+        for article in entry["articles"]:
+            priority_topics.setdefault(id(article), entry["topic"])
+        priority_all_articles.extend(entry["articles"])
+
+    # 全記事をマージ
+    all_articles = collected["qiita"] + collected["zenn"] + collected["hackernews"] + collected["hatena"]
+
+    # 全ソース失敗チェック（304で未更新のソースは失敗扱いしない）
+    source_counts = {
+        "qiita": stats["qiita_fetched"],
+        "zenn": stats["zenn_fetched"],
+        "hackernews": stats["hn_fetched"],
+        "hatena": stats["hatena_fetched"],
+    }
+    if all(count == 0 and not feed_cache.is_not_modified(source) for source, count in source_counts.items()):
         error_message = "全てのソース（Qiita, Zenn, Hacker News, はてなブックマーク）からの記事取得に失敗しました"
         logger.error(error_message)
         if notifier_enabled:
-            if send_failure_notification(error_message):
-                stats["notification_status"] = "エラー通知送信済み"
+            finish_notifications(send_failure_notification(error_message), stats, "エラー通知送信済み")
         print_summary(stats, execution_time, f"articles/{target_date}/")
         return 1
 
     # 新規保存された記事を追跡
     saved_articles: list[dict] = []
+    saved_priority_articles: list[dict] = []
 
-    # 重複チェック・保存
+    # URLによる重複チェック（同一実行内の重複も除外）
     logger.info("記事を処理中...")
+    new_articles: list[dict] = []
+    seen_keys: set[str] = set()
     for article in all_articles:
         source = article["source"]
+        key = canonicalize_url(article["url"])
 
-        if deduplicator.is_duplicate(article["url"]):
+        if key in seen_keys or deduplicator.is_duplicate(article["url"]):
             stats["duplicates"] += 1
             if source == "qiita":
                 stats["qiita_duplicates"] += 1
@@ -192,42 +276,88 @@ def main() -> int:
             logger.debug(f"[スキップ] 重複: {article['title'][:40]}...")
             continue
 
-        # マークダウン保存
-        filepath = save_markdown(article)
-        logger.info(f"保存完了: {filepath.name}")
-
-        # 履歴に追加
-        deduplicator.add_to_history(article)
-        saved_articles.append(article)
-        stats["new_articles"] += 1
+        seen_keys.add(key)
+        new_articles.append(article)
 
-    # 優先トピック記事の重複チェック・保存
-    saved_priority_articles: list[dict] = []
-    logger.info("優先トピック記事を処理中...")
+    new_priority_articles: list[dict] = []
     for article in priority_all_articles:
-        if deduplicator.is_duplicate(article["url"]):
+        key = canonicalize_url(article["url"])
+        if key in seen_keys or deduplicator.is_duplicate(article["url"]):
             logger.debug(f"[スキップ] 重複（優先トピック）: {article['title'][:40]}...")
             continue
-
-        filepath = save_markdown(article)
-        logger.info(f"保存完了（優先トピック）: {filepath.name}")
-
+        seen_keys.add(key)
+        new_priority_articles.append(article)
+
+    # 日別まとめで優先トピックのセクションに入れる記事だけに印を付ける
+    # （はてなの優先記事は通常の記事と同じ辞書のため、取得結果全体には付けない）
+    for article in new_priority_articles:
+        article["priority_topic"] = priority_topics[id(article)]
+
+    # 新規のHN記事だけタイトルを日本語に翻訳（類似記事の判定は翻訳後のタイトルで行う）
+    new_hn_articles = [article for article in new_articles if article["source"] == "hackernews"]
+    stats["hn_translation_targets"] = len(new_hn_articles)
+    if new_hn_articles:
+        logger.info(f"Hacker News 記事タイトルを翻訳中...（新規 {len(new_hn_articles)}件）")
+        translate_hn_titles(new_hn_articles, stats)
+    stats["translation_cache"] = translation_cache.stats()
+
+    # タイトルの類似による重複チェック（類似記事は代表記事の関連記事として記録）
+    related_ids: set[int] = set()
+    if NEAR_DUP_ENABLED:
+        related = group_near_duplicates(
+            new_articles + new_priority_articles,
+            deduplicator.iter_recent_entries(NEAR_DUP_WINDOW_DAYS),
+        )
+        related_ids = {id(article) for article in related}
+        stats["near_duplicates"] = len(related)
+
+    # 履歴に追加し、類似記事以外をまとめてマークダウン保存
+    to_save: list[dict] = []
+    for article in new_articles + new_priority_articles:
         deduplicator.add_to_history(article)
-        saved_priority_articles.append(article)
-        stats["priority_new"] += 1
+        if id(article) not in related_ids:
+            to_save.append(article)
+
+    priority_ids = {id(article) for article in new_priority_articles}
+    saved_files = save_articles(to_save)
+    for article, filepath, status in saved_files:
+        if status == STATUS_UNCHANGED:
+            stats["files_unchanged"] += 1
+            logger.debug(f"変更なし: {filepath.name}")
+        else:
+            stats["files_written"] += 1
+            label = filepath.name if filepath.name != DAILY_INDEX_FILENAME else article["title"][:40]
+            logger.info(f"保存完了{'（優先トピック）' if id(article) in priority_ids else ''}: {label}")
+
+        if id(article) in priority_ids:
+            saved_priority_articles.append(article)
+            stats["priority_new"] += 1
+        else:
+            saved_articles.append(article)
         stats["new_articles"] += 1
 
+    # 全文検索インデックスの更新
+    stats["search_indexed"] = update_search_index(
+        [(article, filepath) for article, filepath, _ in saved_files], target_date
+    )
+
+    # 保持期間を過ぎた履歴を削除（それより古い記事はブルームフィルタで判定する）
+    stats["history_expired"] = deduplicator.cleanup_old_entries()
+
     # 履歴保存
     if not deduplicator.save_history():
         logger.warning("履歴ファイルの保存に問題がありました")
+    stats["seen_filter"] = deduplicator.seen_filter_stats()
 
-    # 成功通知送信
+    # フィード検証子の保存（履歴保存後に行い、未処理記事の取りこぼしを防ぐ）
+    if not feed_cache.save():
+        logger.warning("フィードキャッシュの保存に問題がありました")
+
+    # 成功通知を送信待ちキューに登録（送信はバックグラウンドで行い、ここでは完了を待つだけ）
     if notifier_enabled:
-        logger.info("メール通知を送信中...")
-        if send_success_notification(saved_articles, stats, priority_articles=priority_articles):
-            stats["notification_status"] = "成功"
-        else:
-            stats["notification_status"] = "失敗"
+        logger.info("通知を送信待ちキューに登録中...")
+        queued = send_success_notification(saved_articles, stats, priority_articles=priority_articles)
+        finish_notifications(queued, stats, "成功")
 
     # サマリー出力
     print_summary(stats, execution_time, f"articles/{target_date}/")
@@ -235,5 +365,57 @@ def main() -> int:
     return 0
 
 
+def main() -> int:
+    """メイン処理
+
+    Returns:
+        終了コード（0: 正常, 1: エラー）
+    """
+    execution_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    logger.info("=" * 50)
+    logger.info("TechTrendCollector - 記事収集開始")
+    logger.info("=" * 50)
+
+    # 実行全体の時間予算を開始（各通信のタイムアウトはこの残り時間以内に収める）
+    run_deadline.reset()
+
+    # 設定バリデーション
+    logger.info("設定を検証中...")
+    is_valid, warnings = validate_config()
+    for warning in warnings:
+        logger.warning(warning)
+
+    # 通知機能確認
+    notifier_enabled = is_notifier_enabled()
+    if notifier_enabled:
+        logger.info(f"通知機能が有効です（チャネル: {', '.join(enabled_channel_names())}）")
+        # 前回までに送信できなかった通知を収集と並行して再送する
+        notification_outbox.start()
+    else:
+        logger.info("通知機能は無効です")
+
+    # フィード検証子の読み込み
+    feed_cache.load()
+
+    # 重複チェッカー初期化
+    deduplicator = Deduplicator()
+    if not deduplicator.load_history():
+        logger.warning("履歴ファイルの読み込みに問題がありました")
+
+    # 統計情報
+    stats = create_stats()
+
+    # 全ソース・優先トピックを並行取得（取得済み記事はいいね数APIを呼ばない）
+    logger.info("全ソースの記事を並行取得中...")
+    collected = collect_articles(stats, is_known=deduplicator.is_duplicate)
+    record_fetched(collected, stats)
+
+    stats["feed_cache"] = feed_cache.hit_rates()
+    stats["http"] = http_client.stats()
+
+    return process_collected(collected, stats, deduplicator, notifier_enabled, execution_time)
+
+
 if __name__ == "__main__":
     sys.exit(main())
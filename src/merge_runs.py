@@ -0,0 +1,81 @@
+"""シャード実行結果のマージスクリプト
+
+src/collect_shard.py が書き出した結果バンドルをまとめ、全シャード分を1回の実行として
+重複チェック・マークダウン保存・履歴保存・通知を行う。
+
+使い方:
+    PYTHONPATH=. python src/merge_runs.py                # data/bundles/*.json
+    PYTHONPATH=. python src/merge_runs.py path/to/*.json
+"""
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from src.main import create_stats, process_collected, record_fetched
+from src.services.bundle import combine_bundles, load_bundles
+from src.services.deduplicator import Deduplicator
+from src.services.notifier import is_notifier_enabled
+from src.utils.config import BUNDLES_DIR, validate_config
+from src.utils.feed import feed_cache
+from src.utils.logger import get_logger
+
+logger = get_logger("merge_runs")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """コマンドライン引数を解析する"""
+    parser = argparse.ArgumentParser(description="シャード実行の結果バンドルをマージして保存・通知する")
+    parser.add_argument("bundles", nargs="*", type=Path, help="結果バンドル（省略時は data/bundles/*.json）")
+    parser.add_argument("--keep", action="store_true", help="処理後もバンドルを削除しない")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """メイン処理
+
+    Returns:
+        終了コード（0: 正常, 1: エラー）
+    """
+    args = parse_args(argv)
+    execution_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    paths = args.bundles or sorted(BUNDLES_DIR.glob("*.json"))
+    bundles = load_bundles(paths)
+    if not bundles:
+        logger.error("マージする結果バンドルがありません")
+        return 1
+
+    logger.info(f"{len(bundles)}件のシャード結果をマージします")
+
+    is_valid, warnings = validate_config()
+    for warning in warnings:
+        logger.warning(warning)
+    notifier_enabled = is_notifier_enabled()
+
+    # 各シャードのフィード検証子を取り込む
+    feed_cache.load()
+    collected, collection_stats, feed_states = combine_bundles(bundles)
+    for state in feed_states:
+        feed_cache.apply_run(state)
+
+    deduplicator = Deduplicator()
+    if not deduplicator.load_history():
+        logger.warning("履歴ファイルの読み込みに問題がありました")
+
+    stats = create_stats()
+    stats.update(collection_stats)
+    record_fetched(collected, stats)
+    stats["feed_cache"] = feed_cache.hit_rates()
+
+    exit_code = process_collected(collected, stats, deduplicator, notifier_enabled, execution_time)
+
+    if exit_code == 0 and not args.keep:
+        for path in paths:
+            path.unlink(missing_ok=True)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
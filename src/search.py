@@ -0,0 +1,96 @@
+"""記事検索スクリプト
+
+収集済みの記事を全文検索インデックス（data/search.db）から検索する。
+
+使い方:
+    python -m src.search Bedrock --source zenn --days 30
+    python -m src.search "Claude Code" --since 2026-02-01 --until 2026-02-28
+    python -m src.search --tag python --limit 50
+    python -m src.search --rebuild        # articles/ からインデックスを再構築
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+
+from src.generators.markdown import SOURCE_DISPLAY_NAMES
+from src.services.search_index import SearchIndex
+from src.utils.config import SOURCES
+from src.utils.logger import get_logger
+
+logger = get_logger("search")
+
+
+def _date(value: str) -> str:
+    """YYYY-MM-DD 形式の日付を検証する"""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"日付は YYYY-MM-DD 形式で指定してください: {value}")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """コマンドライン引数を解析する"""
+    parser = argparse.ArgumentParser(description="収集済みの記事を検索する")
+    parser.add_argument("query", nargs="*", help="検索語（空白区切りでAND検索）")
+    parser.add_argument("--source", action="append", choices=SOURCES, help="ソースで絞り込む（複数指定可）")
+    parser.add_argument("--tag", help="タグで絞り込む（大文字小文字を区別しない）")
+    parser.add_argument("--since", type=_date, help="収集日の下限（YYYY-MM-DD）")
+    parser.add_argument("--until", type=_date, help="収集日の上限（YYYY-MM-DD）")
+    parser.add_argument("--days", type=int, help="直近N日間に収集した記事に絞り込む")
+    parser.add_argument("--limit", type=int, default=20, help="表示件数（デフォルト: 20）")
+    parser.add_argument("--rebuild", action="store_true", help="articles/ からインデックスを再構築する")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """メイン処理
+
+    Returns:
+        終了コード（0: 正常, 1: エラー）
+    """
+    args = parse_args(argv)
+    index = SearchIndex()
+    try:
+        is_new = index.open()
+        if args.rebuild or is_new:
+            if is_new and not args.rebuild:
+                logger.info("検索インデックスが存在しないため articles/ から作成します")
+            index.rebuild()
+            if not (args.query or args.source or args.tag or args.since or args.until or args.days):
+                return 0
+
+        since = args.since
+        if args.days is not None:
+            since = max(since or "", (datetime.now() - timedelta(days=args.days)).strftime("%Y-%m-%d"))
+
+        results = index.search(
+            " ".join(args.query),
+            sources=args.source,
+            since=since,
+            until=args.until,
+            tag=args.tag,
+            limit=args.limit,
+        )
+    except Exception as e:
+        logger.error(f"検索に失敗しました: {e}")
+        return 1
+    finally:
+        index.close()
+
+    if not results:
+        print("該当する記事はありません")
+        return 0
+
+    for rank, result in enumerate(results, 1):
+        source_display = SOURCE_DISPLAY_NAMES.get(result["source"], result["source"])
+        print(f"{rank:>3}. [{result['collected_date']}] [{source_display}] {result['title']}")
+        print(f"     {result['url']}")
+        if result["tags"]:
+            print(f"     タグ: {result['tags']}")
+        print(f"     {result['path']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
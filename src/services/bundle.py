@@ -0,0 +1,143 @@
+"""シャード実行の結果バンドルモジュール
+
+ソース・優先トピックごとに分割して収集した結果（取得記事・統計・フィード検証子）を
+JSONファイルに書き出し、マージ段階でまとめて1回分の取得結果に戻す。
+履歴はシャードでは更新せず、マージ段階で全シャード分をまとめて重複チェックする。
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.collectors import hatena
+from src.utils.config import PRIORITY_TOPICS, SOURCES
+from src.utils.logger import get_logger
+
+logger = get_logger("services.bundle")
+
+BUNDLE_VERSION = 1
+
+# 優先トピックのソース順（collect_articles と同じ）
+_PRIORITY_SOURCE_ORDER = ["qiita", "zenn", "hatena"]
+
+
+def write_bundle(
+    path: Path,
+    name: str,
+    collected: dict[str, Any],
+    stats: dict[str, Any],
+    feed_state: dict[str, Any],
+) -> Path:
+    """シャードの取得結果をバンドルとして書き出す
+
+    Args:
+        path: 出力先ファイル
+        name: シャード名
+        collected: collect_articles の戻り値
+        stats: 統計情報
+        feed_state: FeedCache.export_run の戻り値
+
+    Returns:
+        書き出したファイルのパス
+    """
+    bundle = {
+        "version": BUNDLE_VERSION,
+        "shard": name,
+        "created_at": datetime.now().isoformat(),
+        "collected": collected,
+        "stats": stats,
+        "feed_cache": feed_state,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(bundle, f, ensure_ascii=False)
+    temp_file.replace(path)
+    logger.info(f"結果バンドルを書き出しました: {path}")
+    return path
+
+
+def load_bundles(paths: list[Path]) -> list[dict[str, Any]]:
+    """バンドルを読み込む（形式が不正なファイルはスキップ）
+
+    Args:
+        paths: バンドルファイルのリスト
+
+    Returns:
+        読み込んだバンドルのリスト
+    """
+    bundles = []
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                bundle = json.load(f)
+            if bundle.get("version") != BUNDLE_VERSION or not isinstance(bundle.get("collected"), dict):
+                raise ValueError("バンドルの形式が不正です")
+            bundles.append(bundle)
+            logger.info(f"結果バンドルを読み込みました: {path.name}（シャード: {bundle.get('shard')}）")
+        except (OSError, ValueError) as e:
+            logger.error(f"結果バンドルの読み込みに失敗（スキップ）: {path}: {e}")
+    return bundles
+
+
+def _merge_stats(target: dict[str, Any], source: dict[str, Any]) -> None:
+    """統計情報を合算する（数値は加算、辞書は再帰的にマージ）"""
+    for key, value in source.items():
+        if isinstance(value, bool) or value is None:
+            target.setdefault(key, value)
+        elif isinstance(value, (int, float)):
+            current = target.get(key, 0)
+            target[key] = (current if isinstance(current, (int, float)) else 0) + value
+        elif isinstance(value, dict):
+            if key == "latency":
+                # タスク名はシャード間で重複しないため、そのまま並べる
+                target.setdefault(key, {}).update(value)
+            else:
+                _merge_stats(target.setdefault(key, {}), value)
+
+
+def combine_bundles(bundles: list[dict[str, Any]]) -> tuple[dict[str, Any], dict[str, Any], list[dict[str, Any]]]:
+    """複数のバンドルを1回分の取得結果にまとめる
+
+    はてなブックマークの優先トピックは、全シャードのはてな記事をまとめてから
+    PRIORITY_TOPICS で絞り込み直す（トピックとはてなが別シャードでもよい）。
+
+    Args:
+        bundles: load_bundles の戻り値
+
+    Returns:
+        (collect_articles と同じ形式の取得結果, 合算した収集統計, フィード検証子の状態のリスト)
+    """
+    collected: dict[str, Any] = {source: [] for source in SOURCES}
+    priority_entries: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    topic_order: list[str] = list(PRIORITY_TOPICS)
+    stats: dict[str, Any] = {}
+    feed_states: list[dict[str, Any]] = []
+
+    for bundle in bundles:
+        bundle_collected = bundle["collected"]
+        for source in SOURCES:
+            collected[source].extend(bundle_collected.get(source, []))
+        for entry in bundle_collected.get("priority", []):
+            if entry["source"] == "hatena":
+                continue
+            if entry["topic"] not in topic_order:
+                topic_order.append(entry["topic"])
+            priority_entries.setdefault((entry["topic"], entry["source"]), []).extend(entry["articles"])
+        _merge_stats(stats, bundle.get("stats", {}))
+        feed_states.append(bundle.get("feed_cache", {}))
+
+    for topic in topic_order:
+        topic_hatena = hatena.filter_articles_by_tag(collected["hatena"], topic)
+        if topic_hatena:
+            priority_entries[(topic, "hatena")] = topic_hatena
+
+    collected["priority"] = [
+        {"topic": topic, "source": source, "articles": priority_entries[(topic, source)]}
+        for topic in topic_order
+        for source in _PRIORITY_SOURCE_ORDER
+        if priority_entries.get((topic, source))
+    ]
+    return collected, stats, feed_states
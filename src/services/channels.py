@@ -0,0 +1,189 @@
+"""通知チャネルモジュール
+
+通知の送信先（Resendメール・Webhook）を共通のインターフェースで扱い、
+有効な全チャネルへ並行して送信する。
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
+from typing import Any
+
+from src.utils.config import NOTIFICATION_TIMEOUT, NOTIFICATION_TIMEOUT_GRACE, WEBHOOK_TIMEOUT
+from src.utils.http_client import http_client
+from src.utils.logger import get_logger
+
+logger = get_logger("services.channels")
+
+# Resend メール送信APIエンドポイント
+RESEND_API_URL = "https://api.resend.com/emails"
+
+# Discord のメッセージ本文の上限文字数
+_DISCORD_CONTENT_LIMIT = 2000
+
+
+class NotificationChannel(ABC):
+    """通知チャネルのインターフェース
+
+    send() には送信待ちキューに登録した内容（件名 "subject"、HTML本文 "html"、
+    テキスト本文 "text"）をそのまま渡す。本文の生成は登録時の1回だけ行う。
+    """
+
+    name: str = ""
+    timeout: float = NOTIFICATION_TIMEOUT
+
+    @abstractmethod
+    def is_enabled(self) -> bool:
+        """送信に必要な設定がそろっているかどうか"""
+
+    @abstractmethod
+    def send(self, payload: dict[str, Any]) -> None:
+        """通知を送信する
+
+        Raises:
+            Exception: 送信に失敗した場合
+        """
+
+
+class ResendChannel(NotificationChannel):
+    """Resend APIによるメール通知"""
+
+    name = "resend"
+
+    def __init__(self, api_key: str, to: str, timeout: float = NOTIFICATION_TIMEOUT):
+        self._api_key = api_key
+        self._to = to
+        self.timeout = timeout
+
+    def is_enabled(self) -> bool:
+        return bool(self._api_key and self._to)
+
+    def send(self, payload: dict[str, Any]) -> None:
+        http_client.post_json(
+            RESEND_API_URL,
+            {
+                "from": "onboarding@resend.dev",
+                "to": [self._to],
+                "subject": payload["subject"],
+                "html": payload["html"],
+            },
+            headers={"Authorization": f"Bearer {self._api_key}"},
+            timeout=self.timeout,
+        )
+
+
+class WebhookChannel(NotificationChannel):
+    """Webhook（Slack / Discord 互換のJSON POST）による通知
+
+    本文はテキスト形式で、Slack の "text" と Discord の "content" の両方に設定する。
+    """
+
+    name = "webhook"
+
+    def __init__(self, url: str, timeout: float = WEBHOOK_TIMEOUT):
+        self._url = url
+        self.timeout = timeout
+
+    def is_enabled(self) -> bool:
+        return bool(self._url)
+
+    def send(self, payload: dict[str, Any]) -> None:
+        text = f"{payload['subject']}\n\n{payload.get('text', '')}".rstrip()
+        http_client.post_json(
+            self._url,
+            {"text": text, "content": text[:_DISCORD_CONTENT_LIMIT]},
+            timeout=self.timeout,
+        )
+
+
+def _timed_send(channel: NotificationChannel, payload: dict[str, Any]) -> float:
+    """チャネルで通知を送信し、所要時間（秒）を返す"""
+    started = time.monotonic()
+    channel.send(payload)
+    return time.monotonic() - started
+
+
+class NotificationDispatcher:
+    """有効な全チャネルへ通知を並行送信し、チャネル別の送信結果を集計する"""
+
+    def __init__(self, channels: list[NotificationChannel]):
+        self._channels = channels
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, Any]] = {}
+
+    def enabled_channels(self) -> list[NotificationChannel]:
+        """設定がそろっているチャネルを返す"""
+        return [channel for channel in self._channels if channel.is_enabled()]
+
+    def _record(self, name: str, error: str | None, seconds: float) -> None:
+        """チャネル別の送信結果を記録する"""
+        with self._lock:
+            entry = self._stats.setdefault(name, {"sent": 0, "failed": 0, "seconds": 0.0, "last_error": None})
+            if error is None:
+                entry["sent"] += 1
+            else:
+                entry["failed"] += 1
+                entry["last_error"] = error
+            entry["seconds"] = round(entry["seconds"] + seconds, 2)
+
+    def _finish(self, channel: NotificationChannel, seconds: float, error: str | None, delivered: list[str]) -> None:
+        """チャネルの送信結果を記録し、成功した場合は送信済みチャネルに追加する"""
+        self._record(channel.name, error, seconds)
+        if error is None:
+            delivered.append(channel.name)
+            logger.info(f"通知を送信しました（{channel.name}, {seconds:.2f}秒）")
+        else:
+            logger.error(f"通知の送信に失敗しました（{channel.name}）: {error}")
+
+    def send(self, payload: dict[str, Any]) -> bool:
+        """未送信のチャネルへ通知を並行送信する
+
+        各チャネルは自身のタイムアウトに猶予（NOTIFICATION_TIMEOUT_GRACE）を加えた時間以内に
+        完了しなければ失敗とする。送信できたチャネル名は payload["delivered"] に記録し、
+        再送時は失敗したチャネルにだけ送る。待機を打ち切ったチャネルも、戻る前に完了して
+        いれば送信済みとして記録する（送信待ちキューが payload を書き戻す前に反映し、重複送信を防ぐ）。
+
+        Args:
+            payload: 送信待ちキューに登録した内容（送信済みチャネルを追記する）
+
+        Returns:
+            全チャネルへの送信が完了した場合True
+        """
+        delivered: list[str] = payload.setdefault("delivered", [])
+        channels = [channel for channel in self.enabled_channels() if channel.name not in delivered]
+        if not channels:
+            return True
+
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=len(channels), thread_name_prefix="notify")
+        futures = [(channel, executor.submit(_timed_send, channel, payload)) for channel in channels]
+        timed_out: list[tuple[NotificationChannel, Future, float]] = []
+        for channel, future in futures:
+            wait = channel.timeout + NOTIFICATION_TIMEOUT_GRACE
+            try:
+                seconds = future.result(timeout=max(0.0, started + wait - time.monotonic()))
+                self._finish(channel, seconds, None, delivered)
+            except FuturesTimeout:
+                timed_out.append((channel, future, wait))
+            except Exception as e:
+                self._finish(channel, time.monotonic() - started, str(e), delivered)
+
+        # 他のチャネルを待つ間に完了していれば送信済みとして扱う（次回の再送対象から外す）
+        for channel, future, wait in timed_out:
+            if not future.done() or future.cancelled():
+                self._finish(channel, wait, f"タイムアウト ({wait}秒)", delivered)
+            elif future.exception() is not None:
+                self._finish(channel, wait, str(future.exception()), delivered)
+            else:
+                self._finish(channel, future.result(), None, delivered)
+        # タイムアウトしたチャネルの完了は待たない
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        return all(channel.name in delivered for channel in channels)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """チャネル別の送信件数・失敗件数・所要時間を返す"""
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._stats.items()}
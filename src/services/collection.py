@@ -0,0 +1,168 @@
+"""記事収集モジュール（全ソース・優先トピックを並行取得）"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from src.collectors import hackernews, hatena, qiita, zenn
+from src.utils.config import (
+    COLLECT_MAX_WORKERS,
+    COLLECT_TIMEOUTS,
+    PRIORITY_TOPICS,
+    SOURCES,
+)
+from src.utils.deadline import run_deadline
+from src.utils.feed import feed_cache
+from src.utils.logger import get_logger
+
+logger = get_logger("services.collection")
+
+# 収集タスクの実行関数（タスク専用の統計情報, 打ち切りイベント）→ 記事リスト
+TaskFunc = Callable[[dict[str, Any], threading.Event], list[dict[str, Any]]]
+
+
+def _timed(
+    func: TaskFunc, task_stats: dict[str, Any], cancel: threading.Event
+) -> Callable[[], tuple[list[dict[str, Any]], float]]:
+    """実行時間を計測するラッパーを返す
+
+    統計情報はタスク専用の辞書に書き込み、完了したタスクの分だけ呼び出し側でマージする。
+    タイムアウトで打ち切られたタスクが共有の統計情報を書き換えることはない。
+    """
+
+    def wrapper() -> tuple[list[dict[str, Any]], float]:
+        start = time.monotonic()
+        articles = func(task_stats, cancel)
+        return articles, round(time.monotonic() - start, 2)
+
+    return wrapper
+
+
+def _build_tasks(
+    is_known: Callable[[str], bool] | None,
+    sources: list[str],
+    topics: list[str],
+    topic_sources: list[str],
+) -> list[tuple[str, str, TaskFunc]]:
+    """収集タスクの一覧を生成する
+
+    Returns:
+        (タスク名, タイムアウト種別, 実行関数) のリスト
+    """
+    tasks: list[tuple[str, str, TaskFunc]] = []
+
+    if "qiita" in sources:
+        tasks.append(
+            ("qiita", "qiita", lambda st, c: qiita.fetch_trending_articles(st, is_known=is_known, cancel=c))
+        )
+    if "zenn" in sources:
+        tasks.append(
+            ("zenn", "zenn", lambda st, c: zenn.fetch_trending_articles(st, is_known=is_known, cancel=c))
+        )
+    if "hackernews" in sources:
+        tasks.append(("hackernews", "hackernews", lambda st, c: hackernews.fetch_top_articles()))
+    if "hatena" in sources:
+        tasks.append(("hatena", "hatena", lambda st, c: hatena.fetch_hotentry_articles()))
+
+    for topic in topics:
+        if "qiita" in topic_sources:
+            tasks.append((f"qiita:{topic}", "priority", lambda st, c, t=topic: qiita.fetch_articles_by_tag(t)))
+        if "zenn" in topic_sources:
+            tasks.append((f"zenn:{topic}", "priority", lambda st, c, t=topic: zenn.fetch_articles_by_topic(t)))
+
+    return tasks
+
+
+def collect_articles(
+    stats: dict[str, Any],
+    is_known: Callable[[str], bool] | None = None,
+    sources: list[str] | None = None,
+    topics: list[str] | None = None,
+    topic_sources: list[str] | None = None,
+) -> dict[str, Any]:
+    """全ソースと優先トピックの記事を並行取得する
+
+    各タスクはスレッドプールで同時に実行し、ソースごとのタイムアウトを超えたものは
+    空リストとして扱う（そのソースの新しいフィード検証子は保存しない）。結果はタスク定義順にマージするため実行順序に依存しない。
+
+    Args:
+        stats: 統計情報（ソース別の取得時間を stats["latency"] に記録）
+        is_known: 取得済みURL判定関数（Qiita/Zennのいいね数取得スキップ用）
+        sources: 対象ソース（Noneの場合は全ソース）
+        topics: 対象優先トピック（Noneの場合はPRIORITY_TOPICS）
+        topic_sources: 優先トピックをタグ検索するソース（Noneの場合はsources）
+
+    Returns:
+        {
+            "qiita": [...], "zenn": [...], "hackernews": [...], "hatena": [...],
+            "priority": [{"topic": ..., "source": ..., "articles": [...]}, ...],
+        }
+    """
+    if sources is None:
+        sources = SOURCES
+    if topics is None:
+        topics = PRIORITY_TOPICS
+    if topic_sources is None:
+        topic_sources = sources
+
+    latency: dict[str, float | None] = stats.setdefault("latency", {})
+    tasks = _build_tasks(is_known, sources, topics, topic_sources)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(COLLECT_MAX_WORKERS, len(tasks) or 1)))
+    futures: list[tuple[str, str, dict[str, Any], threading.Event, Future]] = []
+    start = time.monotonic()
+    try:
+        for name, timeout_key, func in tasks:
+            task_stats: dict[str, Any] = {}
+            cancel = threading.Event()
+            future = executor.submit(_timed(func, task_stats, cancel))
+            futures.append((name, timeout_key, task_stats, cancel, future))
+
+        results: dict[str, list[dict[str, Any]]] = {}
+        for name, timeout_key, task_stats, cancel, future in futures:
+            # タイムアウトは全タスク共通の開始時刻から計測し、実行全体の残り時間も超えない
+            remaining = min(
+                COLLECT_TIMEOUTS[timeout_key] - (time.monotonic() - start),
+                run_deadline.remaining(),
+            )
+            try:
+                results[name], latency[name] = future.result(timeout=max(0.0, remaining))
+                stats.update(task_stats)
+                # 結果を使うタスクの検証子だけを保存対象にする（打ち切った・失敗したフィードは次回も取得し直す）
+                feed_cache.commit(name)
+            except TimeoutError:
+                logger.error(f"{name} の取得がタイムアウトしました ({COLLECT_TIMEOUTS[timeout_key]}秒)")
+                latency[name] = None
+                results[name] = []
+                # 打ち切ったタスクには残りのAPI呼び出しをやめさせる
+                cancel.set()
+            except Exception as e:
+                logger.error(f"{name} の取得に失敗: {e}")
+                latency[name] = None
+                results[name] = []
+    finally:
+        # タイムアウトしたタスクの完了は待たない（実行中のものは打ち切りイベントで早期に終了させる）
+        for _, _, _, cancel, _ in futures:
+            cancel.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    collected: dict[str, Any] = {source: results.get(source, []) for source in SOURCES}
+
+    # 優先トピック（トピック → Qiita/Zenn/はてなの順でマージ）
+    priority: list[dict[str, Any]] = []
+    for topic in topics:
+        for source in ("qiita", "zenn"):
+            topic_articles = results.get(f"{source}:{topic}", [])
+            if topic_articles:
+                priority.append({"topic": topic, "source": source, "articles": topic_articles})
+
+        # はてなブックマーク: 取得済み記事からフィルタリング
+        if "hatena" in sources:
+            topic_hatena = hatena.filter_articles_by_tag(collected["hatena"], topic)
+            if topic_hatena:
+                priority.append({"topic": topic, "source": "hatena", "articles": topic_hatena})
+    collected["priority"] = priority
+
+    logger.info(f"全ソースの取得完了（{round(time.monotonic() - start, 2)}秒）")
+    return collected
@@ -1,153 +1,177 @@
 """重複チェックモジュール"""
 
-import fcntl
-import json
-import shutil
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
-
-from src.utils.config import HISTORY_FILE
+from typing import Any, Iterator
+
+from src.services.history_store import HistoryStore, JsonHistoryStore
+from src.utils.bloom import BloomFilter
+from src.utils.config import (
+    HISTORY_BACKEND,
+    HISTORY_INDEX_ENABLED,
+    HISTORY_INDEX_FILE,
+    HISTORY_RETENTION_DAYS,
+    SEEN_FILTER_CAPACITY,
+    SEEN_FILTER_ENABLED,
+    SEEN_FILTER_FILE,
+    SEEN_FILTER_FP_RATE,
+)
+from src.utils.hash_index import HashIndex
 from src.utils.logger import get_logger
+from src.utils.url import canonicalize_url
 
 logger = get_logger("services.deduplicator")
 
 
-class Deduplicator:
-    """記事の重複チェックを行うクラス"""
+def create_history_store(backend: str = HISTORY_BACKEND) -> HistoryStore:
+    """設定に応じた履歴ストアを生成する
 
-    def __init__(self):
-        self._history: dict[str, Any] = {"articles": []}
-        self._urls: set[str] = set()
-        self._lock_file: Path | None = None
+    Args:
+        backend: "json" / "journal" / "sqlite"
 
-    def _get_backup_path(self) -> Path:
-        """バックアップファイルのパスを取得"""
-        return HISTORY_FILE.with_suffix(".json.bak")
+    Returns:
+        履歴ストア
+    """
+    if backend == "journal":
+        from src.services.journal_history_store import JournalHistoryStore
 
-    def _create_backup(self) -> None:
-        """履歴ファイルのバックアップを作成"""
-        if HISTORY_FILE.exists():
-            backup_path = self._get_backup_path()
-            try:
-                shutil.copy2(HISTORY_FILE, backup_path)
-                logger.debug(f"バックアップ作成: {backup_path}")
-            except Exception as e:
-                logger.warning(f"バックアップ作成に失敗: {e}")
+        return JournalHistoryStore()
+    if backend == "sqlite":
+        from src.services.sqlite_history_store import SqliteHistoryStore
+
+        return SqliteHistoryStore()
+    if backend != "json":
+        logger.warning(f"不明な履歴バックエンド '{backend}' のため json を使用します")
+    return JsonHistoryStore()
 
-    def _restore_from_backup(self) -> bool:
-        """バックアップから履歴を復元
+
+class Deduplicator:
+    """記事の重複チェックを行うクラス
+
+    URLは canonicalize_url で正規化したキーで管理する（トラッキングパラメータ等の違いを同一視）。
+    履歴の永続化は HistoryStore（JSON / ジャーナル / SQLite）に委譲する。
+    保持期間内の履歴で判定できない場合は、長期のブルームフィルタで取得済みかを判定する。
+
+    URLハッシュ索引を有効にした場合（HISTORY_INDEX_ENABLED）、履歴ファイルのサイズ・更新時刻が
+    保存時と一致する索引があれば重複判定を索引で行い、履歴本体は追加・削除・保存が必要になった
+    時点で読み込む。一致する索引がない場合は履歴本体で判定し、索引は保存時に作り直す。
+    """
+
+    def __init__(
+        self,
+        store: HistoryStore | None = None,
+        seen_filter_path: Path | None = SEEN_FILTER_FILE if SEEN_FILTER_ENABLED else None,
+        index_path: Path | None = HISTORY_INDEX_FILE if HISTORY_INDEX_ENABLED else None,
+    ):
+        self._store = store if store is not None else create_history_store()
+        self._store_loaded = False
+        self._store_load_result = True
+        self._expired = 0
+        self._index_path = index_path
+        self._index: HashIndex | None = None
+        self._seen_filter_path = seen_filter_path
+        self._seen_filter: BloomFilter | None = None
+        self._seen_filter_dirty = False
+        self._long_term_hits: set[str] = set()
+
+    def _ensure_store(self) -> bool:
+        """履歴本体を読み込む（読み込み済みの場合は何もしない）
 
         Returns:
-            復元成功した場合True
+            読み込み成功した場合True
         """
-        backup_path = self._get_backup_path()
-        if backup_path.exists():
-            try:
-                with open(backup_path, "r", encoding="utf-8") as f:
-                    self._history = json.load(f)
-                    self._urls = {article["url"] for article in self._history["articles"]}
-                logger.info("バックアップから履歴を復元しました")
-                return True
-            except Exception as e:
-                logger.error(f"バックアップからの復元に失敗: {e}")
-        return False
+        if not self._store_loaded:
+            self._store_loaded = True
+            self._store_load_result = self._store.load()
+        return self._store_load_result
 
-    def _acquire_lock(self) -> bool:
-        """ファイルロックを取得
+    def _load_index(self) -> bool:
+        """履歴と一致するURLハッシュ索引を読み込む（履歴本体は読まない）
 
         Returns:
-            ロック取得成功した場合True
+            最新の索引を読み込めた場合True
         """
-        lock_path = HISTORY_FILE.with_suffix(".lock")
+        if self._index_path is None or not self._index_path.exists():
+            return False
+
+        fingerprint = self._store.fingerprint()
+        if fingerprint is None:
+            return False
+
         try:
-            lock_path.parent.mkdir(parents=True, exist_ok=True)
-            self._lock_file = open(lock_path, "w")
-            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-            logger.debug("ファイルロックを取得しました")
-            return True
-        except (IOError, OSError) as e:
-            logger.warning(f"ファイルロックの取得に失敗（別プロセスが実行中の可能性）: {e}")
-            if self._lock_file:
-                self._lock_file.close()
-                self._lock_file = None
+            index = HashIndex.load(self._index_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"URLハッシュ索引の読み込みに失敗（履歴から再作成）: {e}")
             return False
 
-    def _release_lock(self) -> None:
-        """ファイルロックを解放"""
-        if self._lock_file:
+        if index.fingerprint != fingerprint:
+            logger.info("URLハッシュ索引が履歴と一致しないため再作成します")
+            index.close()
+            return False
+
+        self._index = index
+        logger.info(f"URLハッシュ索引を読み込みました（{len(index)}件）")
+        return True
+
+    def _load_seen_filter(self) -> None:
+        """長期重複判定用のブルームフィルタを読み込む（存在しない場合は履歴から作成）"""
+        if self._seen_filter_path is None:
+            return
+
+        if self._seen_filter_path.exists():
             try:
-                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
-                self._lock_file.close()
-                self._lock_file = None
-                logger.debug("ファイルロックを解放しました")
-            except Exception as e:
-                logger.warning(f"ファイルロックの解放に失敗: {e}")
+                self._seen_filter = BloomFilter.load(self._seen_filter_path)
+                logger.info(
+                    f"長期重複判定フィルタを読み込みました（{self._seen_filter.count}件, "
+                    f"推定偽陽性率: {self._seen_filter.estimated_fp_rate():.2e}）"
+                )
+                return
+            except (OSError, ValueError) as e:
+                logger.warning(f"長期重複判定フィルタの読み込みに失敗（履歴から再作成）: {e}")
+
+        self._seen_filter = BloomFilter.create(SEEN_FILTER_CAPACITY, SEEN_FILTER_FP_RATE)
+        self._seen_filter_dirty = True
+        self._ensure_store()
+        for key in self._store.iter_keys():
+            self._seen_filter.add(key)
+        logger.info(f"長期重複判定フィルタを履歴から作成しました（{self._seen_filter.count}件）")
 
     def load_history(self) -> bool:
-        """履歴ファイルを読み込む
+        """履歴を読み込む
 
         Returns:
             読み込み成功した場合True
         """
-        # ロック取得
-        if not self._acquire_lock():
-            logger.warning("ロック取得に失敗しましたが、処理を続行します")
-
-        if not HISTORY_FILE.exists():
-            logger.info("履歴ファイルが存在しません。新規作成します。")
-            return True
-
-        try:
-            with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-                self._history = json.load(f)
-
-            # データ構造の検証
-            if not isinstance(self._history, dict):
-                raise ValueError("履歴ファイルの形式が不正です（辞書ではありません）")
-            if "articles" not in self._history:
-                raise ValueError("履歴ファイルに'articles'キーがありません")
-            if not isinstance(self._history["articles"], list):
-                raise ValueError("'articles'がリストではありません")
-
-            self._urls = {article["url"] for article in self._history["articles"]}
-            logger.info(f"履歴ファイルを読み込みました（{len(self._urls)}件）")
-            return True
-
-        except json.JSONDecodeError as e:
-            logger.error(f"履歴ファイルのJSONパースに失敗: {e}")
-            if self._restore_from_backup():
-                return True
-            logger.warning("空の履歴で再作成します")
-            self._history = {"articles": []}
-            self._urls = set()
-            return True
-
-        except ValueError as e:
-            logger.error(f"履歴ファイルの形式エラー: {e}")
-            if self._restore_from_backup():
-                return True
-            logger.warning("空の履歴で再作成します")
-            self._history = {"articles": []}
-            self._urls = set()
-            return True
-
-        except Exception as e:
-            logger.error(f"履歴ファイルの読み込みに失敗: {e}")
-            self._history = {"articles": []}
-            self._urls = set()
-            return False
+        if self._load_index():
+            result = True
+        else:
+            # 履歴本体を読み込むため、索引は作らず履歴で判定する（索引は保存時に作り直す）
+            result = self._ensure_store()
+        self._load_seen_filter()
+        return result
 
     def is_duplicate(self, url: str) -> bool:
         """指定されたURLが既に取得済みかどうかを判定する
 
         Args:
-            url: チェック対象のURL
+            url: チェック対象のURL（正規化前でもよい）
 
         Returns:
             重複している場合はTrue
         """
-        return url in self._urls
+        key = canonicalize_url(url)
+        if self._index is not None:
+            if key in self._index:
+                return True
+        elif self._store.contains(key):
+            return True
+
+        # 保持期間を過ぎた記事はブルームフィルタで判定（偽陽性あり）
+        if self._seen_filter is not None and key in self._seen_filter:
+            self._long_term_hits.add(key)
+            return True
+        return False
 
     def add_to_history(self, article: dict[str, Any]) -> None:
         """記事を履歴に追加する
@@ -155,75 +179,151 @@ class Deduplicator:
         Args:
             article: 追加する記事情報
         """
+        key = canonicalize_url(article["url"])
         history_entry = {
-            "url": article["url"],
+            "url": key,
             "title": article["title"],
             "source": article["source"],
-            "collected_at": datetime.now().isoformat(),
+            "collected_at": int(time.time()),
         }
-        self._history["articles"].append(history_entry)
-        self._urls.add(article["url"])
+        if article.get("related_to"):
+            history_entry["related_to"] = article["related_to"]
+            if article.get("similarity") is not None:
+                history_entry["similarity"] = article["similarity"]
+        self._ensure_store()
+        self._store.add(history_entry)
+        if self._index is not None:
+            self._index.add(key)
+        if self._seen_filter is not None and self._seen_filter.add(key):
+            self._seen_filter_dirty = True
         logger.debug(f"履歴に追加: {article['title'][:40]}...")
 
-    def cleanup_old_entries(self, days: int = 7) -> int:
+    def iter_recent_entries(self, days: int) -> Iterator[dict[str, Any]]:
+        """指定日数以内に収集した履歴エントリを返す
+
+        Args:
+            days: 対象とする日数
+
+        Returns:
+            履歴エントリのイテレータ
+        """
+        self._ensure_store()
+        return self._store.iter_entries(since=datetime.now() - timedelta(days=days))
+
+    def cleanup_old_entries(self, days: int = HISTORY_RETENTION_DAYS) -> int:
         """指定日数より古いエントリを削除する
 
         Args:
-            days: 保持する日数（デフォルト7日）
+            days: 保持する日数（デフォルト HISTORY_RETENTION_DAYS）
 
         Returns:
             削除したエントリ数
         """
+        self._ensure_store()
         cutoff = datetime.now() - timedelta(days=days)
-        original_count = len(self._history["articles"])
-
-        new_articles = []
-        for article in self._history["articles"]:
-            try:
-                collected_at = datetime.fromisoformat(article["collected_at"])
-                if collected_at >= cutoff:
-                    new_articles.append(article)
-            except (KeyError, ValueError) as e:
-                logger.warning(f"不正なエントリをスキップ: {e}")
-                continue
-
-        self._history["articles"] = new_articles
-        self._urls = {article["url"] for article in new_articles}
-
-        deleted_count = original_count - len(new_articles)
-        logger.info(f"クリーンアップ完了: {deleted_count}件削除, {len(new_articles)}件残存")
+        deleted_count = self._store.cleanup(cutoff)
+        self._expired += deleted_count
+        logger.info(f"クリーンアップ完了: {deleted_count}件削除, {len(self._store)}件残存")
         return deleted_count
 
-    def save_history(self) -> bool:
-        """履歴ファイルを保存する
+    def save_history(self, compact: bool = False) -> bool:
+        """履歴を保存する
+
+        Args:
+            compact: Trueの場合は閾値によらず履歴を最小の形に書き直す（ジャーナルの畳み込みなど）
 
         Returns:
             保存成功した場合True
         """
+        # 履歴・索引・フィルタの保存は履歴と同じ排他ロック内で行う
+        # （同時に保存する他プロセスの読み直し・マージ・リネームと交互に実行されない）
         try:
-            # バックアップ作成
-            self._create_backup()
+            with self._store.commit_lock():
+                if not self._store_loaded:
+                    # 履歴に変更がないため、索引・フィルタのみ保存する
+                    result = True
+                else:
+                    result = self._store.compact() if compact else self._store.save()
+                    if result:
+                        self._save_index()
+                self._save_seen_filter()
+        except OSError as e:
+            logger.error(f"履歴のロック取得に失敗: {e}")
+            return False
 
-            # ディレクトリ作成
-            HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        return result
 
-            # 一時ファイルに書き込み後リネーム（アトミック操作）
-            temp_file = HISTORY_FILE.with_suffix(".tmp")
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(self._history, f, ensure_ascii=False, indent=2)
+    def _save_seen_filter(self) -> None:
+        """長期重複判定フィルタを保存する（commit_lock 内で呼び出す）
 
-            temp_file.rename(HISTORY_FILE)
-            logger.info(f"履歴ファイルを保存しました（{len(self._history['articles'])}件）")
-            return True
+        新規登録があった場合のみ、他プロセスが保存したフィルタとの和集合を書き直す
+        （ファイルはGitにコミットしない）。
+        """
+        if self._seen_filter is None or self._seen_filter_path is None or not self._seen_filter_dirty:
+            return
+        try:
+            if self._seen_filter_path.exists():
+                on_disk = BloomFilter.load(self._seen_filter_path)
+                try:
+                    self._seen_filter.merge(on_disk)
+                finally:
+                    on_disk.close()
+            self._seen_filter.save(self._seen_filter_path)
+            self._seen_filter_dirty = False
+        except Exception as e:
+            logger.warning(f"長期重複判定フィルタの保存に失敗: {e}")
 
+    def _save_index(self) -> None:
+        """URLハッシュ索引を保存する（索引がない場合・削除があった場合は履歴から作り直す）"""
+        if self._index_path is None:
+            return
+        fingerprint = self._store.fingerprint()
+        if fingerprint is None:
+            return
+
+        try:
+            if self._index is not None and not self._expired:
+                self._index.save(self._index_path, fingerprint)
+                if len(self._index) == len(self._store):
+                    return
+                # 他プロセスの更新をマージした場合は差分だけでは一致しないため作り直す
+                logger.info("履歴が他のプロセスで更新されていたため、URLハッシュ索引を作り直します")
+
+            if self._index is not None:
+                self._index.close()
+            self._index = HashIndex.from_keys(self._store.iter_keys())
+            self._expired = 0
+            self._index.save(self._index_path, fingerprint)
         except Exception as e:
-            logger.error(f"履歴ファイルの保存に失敗: {e}")
-            return False
+            logger.warning(f"URLハッシュ索引の保存に失敗: {e}")
+
+    def seen_filter_stats(self) -> dict[str, Any] | None:
+        """長期重複判定フィルタの状態を返す
 
-        finally:
-            # ロック解放
-            self._release_lock()
+        Returns:
+            {"count": 登録件数, "capacity": 想定件数, "fp_rate": 推定偽陽性率,
+             "target_fp_rate": 目標偽陽性率, "size_bytes": サイズ, "hits": 今回フィルタで重複判定した件数}
+            フィルタ無効時はNone
+        """
+        if self._seen_filter is None:
+            return None
+        return {
+            "count": self._seen_filter.count,
+            "capacity": self._seen_filter.capacity,
+            "fp_rate": self._seen_filter.estimated_fp_rate(),
+            "target_fp_rate": self._seen_filter.fp_rate,
+            "size_bytes": self._seen_filter.size_bytes,
+            "hits": len(self._long_term_hits),
+        }
 
     def __del__(self):
-        """デストラクタ: ロックを確実に解放"""
-        self._release_lock()
+        """デストラクタ: ロック・接続を確実に解放"""
+        store = getattr(self, "_store", None)
+        if store is not None:
+            store.close()
+        index = getattr(self, "_index", None)
+        if index is not None:
+            index.close()
+        seen_filter = getattr(self, "_seen_filter", None)
+        if seen_filter is not None:
+            seen_filter.close()
@@ -0,0 +1,445 @@
+"""履歴ストアモジュール（重複チェック用の取得履歴の永続化）"""
+
+import bisect
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import threading
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+from src.utils.config import HISTORY_FILE
+from src.utils.logger import get_logger
+from src.utils.url import canonicalize_url
+
+logger = get_logger("services.history_store")
+
+# プロセス内で保持中のファイルロック（ロックファイルの絶対パス → [ファイル, ネスト数]）
+_held_locks: dict[str, list] = {}
+_thread_locks: dict[str, threading.RLock] = {}
+_thread_locks_guard = threading.Lock()
+
+
+@contextmanager
+def file_lock(lock_path: Path) -> Iterator[None]:
+    """ロックファイルによるプロセス間の排他ロック（fcntl.flock）
+
+    同じプロセス・スレッド内ではネストして取得できる（flockは同じプロセスでも別のファイル
+    記述子からの取得をブロックするため、プロセス内ではスレッド用のロックとネスト数で管理する）。
+
+    Args:
+        lock_path: ロックファイルのパス
+    """
+    key = os.path.abspath(lock_path)
+    with _thread_locks_guard:
+        thread_lock = _thread_locks.setdefault(key, threading.RLock())
+
+    with thread_lock:
+        held = _held_locks.get(key)
+        if held is None:
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            lock_file: IO[str] = open(lock_path, "w")
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            held = _held_locks[key] = [lock_file, 0]
+        held[1] += 1
+        try:
+            yield
+        finally:
+            held[1] -= 1
+            if held[1] == 0:
+                del _held_locks[key]
+                fcntl.flock(held[0].fileno(), fcntl.LOCK_UN)
+                held[0].close()
+
+
+class HistoryStore(ABC):
+    """履歴ストアの基底クラス
+
+    エントリは {"url": 正規化済みURL, "title", "source", "collected_at": エポック秒} の辞書。
+    類似記事として記録したエントリは "related_to"（代表記事の正規化済みURL）と
+    "similarity" も持ち、いずれのストアでも保存・読み出しする。
+    """
+
+    @abstractmethod
+    def load(self) -> bool:
+        """履歴を読み込む
+
+        Returns:
+            読み込み成功した場合True
+        """
+
+    @abstractmethod
+    def contains(self, key: str) -> bool:
+        """正規化済みURLが履歴に存在するかどうか"""
+
+    @abstractmethod
+    def add(self, entry: dict[str, Any]) -> None:
+        """エントリを追加する（永続化は save で行う）"""
+
+    @abstractmethod
+    def iter_keys(self) -> Iterator[str]:
+        """履歴中の全ての正規化済みURLを返す"""
+
+    @abstractmethod
+    def iter_entries(self, since: datetime | None = None) -> Iterator[dict[str, Any]]:
+        """エントリを返す（sinceを指定した場合はそれ以降に収集したもののみ）"""
+
+    @abstractmethod
+    def cleanup(self, cutoff: datetime) -> int:
+        """cutoffより前に収集したエントリを削除する
+
+        Returns:
+            削除したエントリ数
+        """
+
+    @abstractmethod
+    def save(self) -> bool:
+        """履歴を保存する
+
+        Returns:
+            保存成功した場合True
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """履歴のエントリ数"""
+
+    def compact(self) -> bool:
+        """履歴を最小の形に書き直して保存する（メンテナンス用。既定は save と同じ）
+
+        Returns:
+            成功した場合True
+        """
+        return self.save()
+
+    def fingerprint(self) -> int | None:
+        """永続化済みの履歴の状態を表すフィンガープリント（読み込み前でも取得可能）
+
+        URLハッシュ索引が最新かどうかの判定に使う。履歴の大きさによらず短時間で求まること。
+        索引を使わないストアはNoneを返す。
+        """
+        return None
+
+    def commit_lock(self) -> AbstractContextManager:
+        """履歴の保存と同じプロセス間の排他ロック（ネストして取得できる）
+
+        履歴と一緒に保存する派生ファイル（長期重複判定フィルタなど）の読み直し・マージ・
+        リネームをこのロック内で行うと、同時に保存する他プロセスの更新を失わない。
+        """
+        return file_lock(HISTORY_FILE.with_suffix(".lock"))
+
+    def close(self) -> None:
+        """リソースを解放する"""
+
+
+def file_fingerprint(*paths: Path) -> int:
+    """ファイル内容から64ビットのフィンガープリントを計算する（存在しないファイルは空として扱う）"""
+    digest = hashlib.blake2b(digest_size=8)
+    for path in paths:
+        digest.update(path.read_bytes() if path.exists() else b"")
+        digest.update(b"\0")
+    return int.from_bytes(digest.digest(), "little", signed=True)
+
+
+def stat_fingerprint(*paths: Path) -> int:
+    """ファイルのサイズ・更新時刻（ナノ秒）・inodeから64ビットのフィンガープリントを計算する
+
+    内容は読まないため、ファイルの大きさによらず一定時間で求まる。保存は一時ファイルの
+    リネームで行うため、内容が変わればinodeも変わる。存在しないファイルは空として扱う。
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for path in paths:
+        try:
+            st = path.stat()
+            digest.update(f"{st.st_size}:{st.st_mtime_ns}:{st.st_ino}".encode("ascii"))
+        except FileNotFoundError:
+            digest.update(b"-")
+        digest.update(b"\0")
+    return int.from_bytes(digest.digest(), "little", signed=True)
+
+
+def to_epoch(collected_at: int | float | str) -> int:
+    """収集日時をエポック秒に変換する（旧形式のISO文字列にも対応）
+
+    Raises:
+        ValueError: 日時として解釈できない場合
+    """
+    if isinstance(collected_at, (int, float)):
+        return int(collected_at)
+    return int(datetime.fromisoformat(collected_at).timestamp())
+
+
+class JsonHistoryStore(HistoryStore):
+    """history.json に全履歴を保存するストア
+
+    エントリは collected_at（エポック秒）の昇順に保持し、期限切れエントリの削除は
+    二分探索で境界を求めて先頭から切り落とす。URLインデックスも削除分だけ更新する。
+
+    複数プロセスの同時実行には楽観的並行制御で対応する。読み込み時のファイルの版
+    （内容のフィンガープリント）を記録し、保存時に版が変わっていれば最新の内容を読み直して
+    自プロセスの追加・削除を和集合として再適用してから書き直す。ロックは版の確認から
+    リネームまでの間だけ保持する（Deduplicator は索引・長期重複判定フィルタの保存まで
+    同じロックを保持する）。
+    """
+
+    def __init__(self, path: Path = HISTORY_FILE):
+        self._path = path
+        self._history: dict[str, Any] = {"articles": []}
+        self._urls: set[str] = set()
+        self._times: list[int] = []
+        self._version: int | tuple | None = None
+        self._added: list[dict[str, Any]] = []
+        self._cutoff: int | None = None
+
+    def _get_backup_path(self) -> Path:
+        """バックアップファイルのパスを取得"""
+        return self._path.with_suffix(".json.bak")
+
+    def _create_backup(self) -> None:
+        """履歴ファイルのバックアップを作成"""
+        if self._path.exists():
+            backup_path = self._get_backup_path()
+            try:
+                shutil.copy2(self._path, backup_path)
+                logger.debug(f"バックアップ作成: {backup_path}")
+            except Exception as e:
+                logger.warning(f"バックアップ作成に失敗: {e}")
+
+    def _restore_from_backup(self) -> bool:
+        """バックアップから履歴を復元
+
+        Returns:
+            復元成功した場合True
+        """
+        backup_path = self._get_backup_path()
+        if backup_path.exists():
+            try:
+                with open(backup_path, "r", encoding="utf-8") as f:
+                    self._history = json.load(f)
+                self._rebuild_index()
+                logger.info("バックアップから履歴を復元しました")
+                return True
+            except Exception as e:
+                logger.error(f"バックアップからの復元に失敗: {e}")
+        return False
+
+    def _rebuild_index(self) -> int:
+        """履歴のURLを正規化キーに置き換え、インデックスを再構築する
+
+        旧形式（未正規化URL・ISO形式の日時）の履歴もここで移行し、収集日時順に並べ替える。
+        正規化後に重複するエントリは先に記録された方を残して削除する。
+
+        Returns:
+            正規化により統合（削除）したエントリ数
+        """
+        articles = []
+        urls: set[str] = set()
+        for article in self._history["articles"]:
+            try:
+                key = canonicalize_url(article["url"])
+                article["collected_at"] = to_epoch(article["collected_at"])
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"不正なエントリをスキップ: {e}")
+                continue
+            if key in urls:
+                continue
+            article["url"] = key
+            urls.add(key)
+            articles.append(article)
+
+        merged = len(self._history["articles"]) - len(articles)
+        articles.sort(key=lambda article: article["collected_at"])
+        self._history["articles"] = articles
+        self._urls = urls
+        self._times = [article["collected_at"] for article in articles]
+        if merged:
+            logger.info(f"URL正規化により重複エントリを{merged}件統合しました")
+        return merged
+
+    def _commit_lock(self) -> AbstractContextManager:
+        """版の確認・読み込み・リネームの間だけ保持する排他ロック"""
+        return file_lock(self._path.with_suffix(".lock"))
+
+    def commit_lock(self) -> AbstractContextManager:
+        return self._commit_lock()
+
+    def _disk_version(self) -> int | tuple | None:
+        """永続化済みの履歴の版（ファイルが存在しない場合None）
+
+        更新時刻は解像度が粗く、inodeも再利用されるため、内容のフィンガープリントを版とする。
+        """
+        if not self._path.exists():
+            return None
+        return file_fingerprint(self._path)
+
+    def _read_history(self) -> dict[str, Any]:
+        """履歴ファイルを読み込んで検証する
+
+        Raises:
+            json.JSONDecodeError: JSONとして不正な場合
+            ValueError: データ構造が不正な場合
+        """
+        with open(self._path, "r", encoding="utf-8") as f:
+            history = json.load(f)
+
+        # データ構造の検証
+        if not isinstance(history, dict):
+            raise ValueError("履歴ファイルの形式が不正です（辞書ではありません）")
+        if "articles" not in history:
+            raise ValueError("履歴ファイルに'articles'キーがありません")
+        if not isinstance(history["articles"], list):
+            raise ValueError("'articles'がリストではありません")
+        return history
+
+    def _reload(self) -> None:
+        """永続化済みの履歴を読み直す（コミットロック内で呼び出す）"""
+        self._version = self._disk_version()
+        if not self._path.exists():
+            self._reset()
+            return
+        self._history = self._read_history()
+        self._rebuild_index()
+
+    def _merge_from_disk(self) -> None:
+        """他プロセスが保存した履歴を読み直し、自プロセスの変更を再適用する（コミットロック内で呼び出す）"""
+        self._reload()
+        for entry in self._added:
+            if entry["url"] not in self._urls:
+                self._insert(entry)
+        if self._cutoff is not None:
+            self._expire(self._cutoff)
+
+    def _reset(self) -> None:
+        """空の履歴で初期化する"""
+        self._history = {"articles": []}
+        self._urls = set()
+        self._times = []
+
+    def load(self) -> bool:
+        try:
+            with self._commit_lock():
+                if self._disk_version() is None:
+                    logger.info("履歴ファイルが存在しません。新規作成します。")
+                    self._reset()
+                    return True
+                self._reload()
+            logger.info(f"履歴ファイルを読み込みました（{len(self._urls)}件）")
+            return True
+
+        except json.JSONDecodeError as e:
+            logger.error(f"履歴ファイルのJSONパースに失敗: {e}")
+            if self._restore_from_backup():
+                return True
+            logger.warning("空の履歴で再作成します")
+            self._reset()
+            return True
+
+        except ValueError as e:
+            logger.error(f"履歴ファイルの形式エラー: {e}")
+            if self._restore_from_backup():
+                return True
+            logger.warning("空の履歴で再作成します")
+            self._reset()
+            return True
+
+        except Exception as e:
+            logger.error(f"履歴ファイルの読み込みに失敗: {e}")
+            self._reset()
+            return False
+
+    def contains(self, key: str) -> bool:
+        return key in self._urls
+
+    def _insert(self, entry: dict[str, Any]) -> None:
+        """エントリを収集日時順の位置に挿入する"""
+        collected_at = entry["collected_at"]
+        articles = self._history["articles"]
+        if not self._times or collected_at >= self._times[-1]:
+            # 通常は現在時刻のエントリなので末尾に追加するだけで順序が保たれる
+            articles.append(entry)
+            self._times.append(collected_at)
+        else:
+            index = bisect.bisect_right(self._times, collected_at)
+            articles.insert(index, entry)
+            self._times.insert(index, collected_at)
+        self._urls.add(entry["url"])
+
+    def add(self, entry: dict[str, Any]) -> None:
+        self._insert(entry)
+        self._added.append(entry)
+
+    def iter_keys(self) -> Iterator[str]:
+        return iter(list(self._urls))
+
+    def iter_entries(self, since: datetime | None = None) -> Iterator[dict[str, Any]]:
+        start = 0 if since is None else bisect.bisect_left(self._times, int(since.timestamp()))
+        return iter(self._history["articles"][start:])
+
+    def _expire(self, cutoff: int) -> int:
+        """cutoff（エポック秒）より前のエントリを削除する"""
+        end = bisect.bisect_left(self._times, cutoff)
+        if end == 0:
+            return 0
+
+        articles = self._history["articles"]
+        for article in articles[:end]:
+            self._urls.discard(article["url"])
+        del articles[:end]
+        del self._times[:end]
+        return end
+
+    def cleanup(self, cutoff: datetime) -> int:
+        epoch = int(cutoff.timestamp())
+        self._cutoff = epoch if self._cutoff is None else max(self._cutoff, epoch)
+        return self._expire(epoch)
+
+    def _on_committed(self) -> None:
+        """履歴ファイルのリネーム直後に呼び出される（コミットロック内）"""
+
+    def _write_temp(self, temp_file: Path) -> None:
+        """現在の履歴を一時ファイルに書き込む"""
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(self._history, f, ensure_ascii=False, indent=2)
+
+    def save(self) -> bool:
+        # 一時ファイルはプロセスごとに分ける（同時に保存しても互いに上書きしない）
+        temp_file = self._path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            # ディレクトリ作成
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+
+            # 通常はロック外で書き込み、版が変わっていなければリネームするだけで済む
+            self._write_temp(temp_file)
+
+            with self._commit_lock():
+                if self._disk_version() != self._version:
+                    logger.info("他のプロセスが履歴を更新したため、読み直してマージします")
+                    self._merge_from_disk()
+                    self._write_temp(temp_file)
+
+                # バックアップ作成後、一時ファイルをリネーム（アトミック操作）
+                self._create_backup()
+                temp_file.replace(self._path)
+                self._version = self._disk_version()
+                self._on_committed()
+
+            self._added = []
+            self._cutoff = None
+            logger.info(f"履歴ファイルを保存しました（{len(self._history['articles'])}件）")
+            return True
+
+        except Exception as e:
+            logger.error(f"履歴ファイルの保存に失敗: {e}")
+            temp_file.unlink(missing_ok=True)
+            return False
+
+    def __len__(self) -> int:
+        return len(self._history["articles"])
+
+    def fingerprint(self) -> int | None:
+        return stat_fingerprint(self._path)
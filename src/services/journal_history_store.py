@@ -0,0 +1,165 @@
+"""ジャーナル形式履歴ストアモジュール（スナップショット + 追記専用ジャーナル）"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.services.history_store import JsonHistoryStore, stat_fingerprint, to_epoch
+from src.utils.config import HISTORY_FILE, HISTORY_JOURNAL_COMPACT_THRESHOLD, HISTORY_JOURNAL_FILE
+from src.utils.logger import get_logger
+
+logger = get_logger("services.journal_history_store")
+
+
+class JournalHistoryStore(JsonHistoryStore):
+    """history.json（スナップショット）と追記専用ジャーナル（JSONL）で履歴を管理するストア
+
+    通常の保存では新規エントリをジャーナルに1行ずつ追記するだけで、書き込み量は
+    新規記事数に比例する。ジャーナルが閾値を超えた場合やクリーンアップ後は
+    スナップショットに畳み込み（コンパクション）、ジャーナルを空にする。
+    """
+
+    def __init__(
+        self,
+        path: Path = HISTORY_FILE,
+        journal_path: Path = HISTORY_JOURNAL_FILE,
+        compact_threshold: int = HISTORY_JOURNAL_COMPACT_THRESHOLD,
+    ):
+        super().__init__(path)
+        self._journal_path = journal_path
+        self._compact_threshold = compact_threshold
+        self._journal_lines = 0
+        self._pending: list[dict[str, Any]] = []
+        self._needs_compaction = False
+
+    def _replay_journal(self) -> int:
+        """ジャーナルを読み込み、スナップショットに未反映のエントリを適用する
+
+        Returns:
+            適用したエントリ数
+        """
+        if not self._journal_path.exists():
+            return 0
+
+        applied = 0
+        with open(self._journal_path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                self._journal_lines += 1
+                try:
+                    entry = json.loads(line)
+                    key = entry["url"]
+                    entry["collected_at"] = to_epoch(entry["collected_at"])
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                    # 書き込み途中で中断した行などは読み飛ばす
+                    logger.warning(f"ジャーナル{line_no}行目をスキップ: {e}")
+                    continue
+                if key in self._urls:
+                    # コンパクション中断時などスナップショットに反映済みのエントリ
+                    continue
+                self._insert(entry)
+                applied += 1
+        return applied
+
+    def _disk_version(self) -> int | tuple | None:
+        # 他プロセスのジャーナル追記もコンパクション時の競合として検出する
+        snapshot_version = super()._disk_version()
+        journal_size = self._journal_path.stat().st_size if self._journal_path.exists() else 0
+        if snapshot_version is None and journal_size == 0:
+            return None
+        return (snapshot_version, journal_size)
+
+    def _reload(self) -> None:
+        super()._reload()
+        self._journal_lines = 0
+        applied = self._replay_journal()
+        if applied:
+            logger.info(f"ジャーナルから{applied}件を適用しました（合計{len(self)}件）")
+
+    def _restore_from_backup(self) -> bool:
+        if not super()._restore_from_backup():
+            return False
+        self._journal_lines = 0
+        applied = self._replay_journal()
+        if applied:
+            logger.info(f"ジャーナルから{applied}件を適用しました（合計{len(self)}件）")
+        return True
+
+    def add(self, entry: dict[str, Any]) -> None:
+        super().add(entry)
+        self._pending.append(entry)
+
+    def cleanup(self, cutoff: datetime) -> int:
+        deleted = super().cleanup(cutoff)
+        if deleted >= self._compact_threshold:
+            # 削除はジャーナルで表現しないため、期限切れエントリが溜まったらスナップショットへ畳み込む
+            # （閾値未満の間はスナップショットに残るが、読み込み後のクリーンアップで毎回除外される）
+            self._needs_compaction = True
+        return deleted
+
+    def fingerprint(self) -> int | None:
+        return stat_fingerprint(self._path, self._journal_path)
+
+    def _append_journal(self) -> None:
+        """未保存のエントリをジャーナルに追記する"""
+        self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 前回の書き込みが行の途中で中断していた場合は改行を補う
+        needs_newline = False
+        if self._journal_path.exists() and self._journal_path.stat().st_size > 0:
+            with open(self._journal_path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b"\n"
+
+        with open(self._journal_path, "a", encoding="utf-8") as f:
+            if needs_newline:
+                f.write("\n")
+            for entry in self._pending:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._added = []
+        self._journal_lines += len(self._pending)
+        logger.info(f"履歴ジャーナルに{len(self._pending)}件を追記しました（ジャーナル{self._journal_lines}行）")
+        self._pending = []
+
+    def _on_committed(self) -> None:
+        # スナップショットのリネームと同じロック内でジャーナルを空にするため、
+        # 他プロセスの追記を取りこぼさない
+        self._journal_path.unlink(missing_ok=True)
+        self._version = self._disk_version()
+        logger.info(f"履歴ジャーナル{self._journal_lines}行をスナップショットに畳み込みました")
+        self._journal_lines = 0
+        self._pending = []
+        self._needs_compaction = False
+
+    def compact(self) -> bool:
+        """ジャーナルをスナップショットに畳み込む
+
+        スナップショットの書き込みが完了してからジャーナルを空にするため、
+        途中で中断しても次回読み込み時に再適用される。他プロセスがスナップショットや
+        ジャーナルを更新していた場合は、読み直してマージしてから保存する。
+
+        Returns:
+            成功した場合True
+        """
+        return super().save()
+
+    def save(self) -> bool:
+        try:
+            if self._needs_compaction or self._journal_lines + len(self._pending) >= self._compact_threshold:
+                return self.compact()
+
+            if self._pending:
+                # 追記は和集合として扱えるため競合確認は不要（コンパクションとの排他のみ）
+                with self._commit_lock():
+                    self._append_journal()
+            return True
+
+        except Exception as e:
+            logger.error(f"履歴ジャーナルの保存に失敗: {e}")
+            return False
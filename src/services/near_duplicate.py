@@ -0,0 +1,187 @@
+"""タイトルの類似記事（ニア重複）検出モジュール
+
+文字n-gramのシングリングとMinHash/LSH（バンディング）で、URLは異なるが同じ話題の記事
+（Hacker News とはてなブックマーク等）を検出する。記事ごとの照合コストは
+同じバケットに入った候補数にのみ比例し、履歴件数には比例しない。
+"""
+
+import hashlib
+import random
+import re
+import unicodedata
+from typing import Any, Iterable
+
+from src.utils.config import (
+    NEAR_DUP_BANDS,
+    NEAR_DUP_NGRAM,
+    NEAR_DUP_NUM_PERM,
+    NEAR_DUP_THRESHOLD,
+)
+from src.utils.logger import get_logger
+from src.utils.url import canonicalize_url
+
+logger = get_logger("services.near_duplicate")
+
+# MinHashの計算に使うメルセンヌ素数（2^61 - 1）
+_PRIME = (1 << 61) - 1
+
+# 記号・空白（シングル生成前に除去）
+_NON_WORD_PATTERN = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def _shingles(title: str, n: int) -> set[str]:
+    """タイトルを正規化して文字n-gramの集合に変換する"""
+    normalized = _NON_WORD_PATTERN.sub("", unicodedata.normalize("NFKC", title).lower())
+    if len(normalized) <= n:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + n] for i in range(len(normalized) - n + 1)}
+
+
+def _hash_shingle(shingle: str) -> int:
+    """シングルを64ビット整数にハッシュする（プロセス間で安定）"""
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class NearDuplicateDetector:
+    """MinHash/LSHによるタイトルの類似記事検出器
+
+    シグネチャを NEAR_DUP_BANDS 個のバンドに分割し、いずれかのバンドが一致した
+    記事だけを候補として推定Jaccard係数を計算する。
+    """
+
+    def __init__(
+        self,
+        threshold: float = NEAR_DUP_THRESHOLD,
+        num_perm: int = NEAR_DUP_NUM_PERM,
+        bands: int = NEAR_DUP_BANDS,
+        ngram: int = NEAR_DUP_NGRAM,
+    ):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm は bands の倍数である必要があります")
+
+        self.threshold = threshold
+        self._num_perm = num_perm
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._ngram = ngram
+
+        # 固定シードで置換用の係数を生成（実行ごとに同じシグネチャになる）
+        rng = random.Random(0)
+        self._coefficients = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)
+        ]
+
+        self._buckets: list[dict[tuple[int, ...], list[str]]] = [{} for _ in range(bands)]
+        self._signatures: dict[str, tuple[int, ...]] = {}
+        self._records: dict[str, dict[str, Any]] = {}
+
+    def _signature(self, title: str) -> tuple[int, ...] | None:
+        """タイトルのMinHashシグネチャを計算する（シングルが空の場合None）"""
+        hashes = [_hash_shingle(s) for s in _shingles(title, self._ngram)]
+        if not hashes:
+            return None
+        return tuple(
+            min((a * h + b) % _PRIME for h in hashes) for a, b in self._coefficients
+        )
+
+    def _band_keys(self, signature: tuple[int, ...]) -> list[tuple[int, ...]]:
+        """シグネチャをバンドごとのバケットキーに分割する"""
+        return [signature[i * self._rows:(i + 1) * self._rows] for i in range(self._bands)]
+
+    def add(self, key: str, title: str, record: dict[str, Any] | None = None) -> None:
+        """記事を索引に追加する
+
+        Args:
+            key: 記事の識別子（正規化済みURL）
+            title: 記事タイトル
+            record: 一致時に返す付随情報（記事dict等）
+        """
+        if key in self._signatures:
+            return
+        signature = self._signature(title)
+        if signature is None:
+            return
+        self._signatures[key] = signature
+        self._records[key] = record if record is not None else {"url": key, "title": title}
+        for band, band_key in zip(self._buckets, self._band_keys(signature)):
+            band.setdefault(band_key, []).append(key)
+
+    def find(self, title: str) -> tuple[dict[str, Any], float] | None:
+        """類似度が閾値以上の既存記事を探す
+
+        Args:
+            title: 判定対象のタイトル
+
+        Returns:
+            (一致した記事の付随情報, 推定Jaccard係数)。該当なしの場合None
+        """
+        signature = self._signature(title)
+        if signature is None:
+            return None
+
+        candidates: set[str] = set()
+        for band, band_key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(band.get(band_key, ()))
+
+        best_key = None
+        best_score = 0.0
+        for key in candidates:
+            other = self._signatures[key]
+            score = sum(1 for a, b in zip(signature, other) if a == b) / self._num_perm
+            if score > best_score:
+                best_key, best_score = key, score
+
+        if best_key is not None and best_score >= self.threshold:
+            return self._records[best_key], best_score
+        return None
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+
+def group_near_duplicates(
+    articles: list[dict[str, Any]],
+    history_entries: Iterable[dict[str, Any]],
+    detector: NearDuplicateDetector | None = None,
+) -> list[dict[str, Any]]:
+    """新規記事のうち、履歴または先行する新規記事と類似するものを抽出する
+
+    類似記事には "related_to"（一致した記事の正規化済みURL）と "similarity" を設定する。
+    一致先が今回の新規記事の場合は、その記事の "related" リストに類似記事を追加する。
+
+    Args:
+        articles: URL重複を除いた新規記事（先頭ほど優先して代表記事になる）
+        history_entries: 照合対象の履歴エントリ
+        detector: 使用する検出器（省略時は設定値で生成）
+
+    Returns:
+        類似記事と判定された記事のリスト
+    """
+    if detector is None:
+        detector = NearDuplicateDetector()
+
+    for entry in history_entries:
+        detector.add(entry["url"], entry.get("title", ""), entry)
+    history_size = len(detector)
+
+    related: list[dict[str, Any]] = []
+    for article in articles:
+        key = canonicalize_url(article["url"])
+        match = detector.find(article["title"])
+        if match is None:
+            detector.add(key, article["title"], article)
+            continue
+
+        primary, score = match
+        article["related_to"] = canonicalize_url(primary["url"])
+        article["similarity"] = round(score, 2)
+        if "collected_at" not in primary:
+            # 今回の新規記事が代表記事
+            primary.setdefault("related", []).append(article)
+        related.append(article)
+        logger.info(
+            f"類似記事: {article['title'][:40]} ≒ {primary.get('title', '')[:40]} (類似度 {score:.2f})"
+        )
+
+    logger.info(f"類似記事判定: 新規{len(articles)}件中{len(related)}件（照合対象の履歴{history_size}件）")
+    return related
@@ -0,0 +1,230 @@
+"""通知の送信待ちキュー（outbox）モジュール
+
+通知はまず data/outbox/ にJSONファイルとして書き出し、バックグラウンドのスレッドが
+指数バックオフで再送しながら送信する。送信できたファイルは削除し、実行終了までに
+送信できなかったものは次回実行時に再送する（送信は少なくとも1回）。
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+from src.utils.config import OUTBOX_BACKOFF_BASE, OUTBOX_BACKOFF_MAX, OUTBOX_DIR, OUTBOX_MAX_AGE_DAYS
+from src.utils.logger import get_logger
+
+logger = get_logger("services.outbox")
+
+
+class NotificationOutbox:
+    """通知の送信待ちキュー
+
+    送信処理は1本のバックグラウンドスレッドで行う。送信に失敗した通知は
+    OUTBOX_BACKOFF_BASE 秒から倍々（上限 OUTBOX_BACKOFF_MAX 秒）の間隔で再送する。
+    """
+
+    def __init__(
+        self,
+        send: Callable[[dict[str, Any]], bool],
+        directory: Path = OUTBOX_DIR,
+        max_age_days: int = OUTBOX_MAX_AGE_DAYS,
+    ):
+        """
+        Args:
+            send: 通知1件を送信する関数（成功時True。例外は送信失敗として扱う）
+            directory: キューのディレクトリ
+            max_age_days: 送信できない通知を failed/ に移すまでの日数
+        """
+        self._send = send
+        self._dir = directory
+        self._max_age = max_age_days * 24 * 60 * 60
+        self._thread: threading.Thread | None = None
+        self._wakeup = threading.Event()
+        self._closing = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._sent = 0
+        self._failed_attempts = 0
+        self._expired = 0
+
+    def _write(self, path: Path, message: dict[str, Any]) -> None:
+        """通知ファイルを書き込む（一時ファイル経由で置き換え）"""
+        temp_file = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(message, f, ensure_ascii=False)
+        temp_file.replace(path)
+
+    def enqueue(self, kind: str, payload: dict[str, Any]) -> Path:
+        """通知をキューに登録する
+
+        Args:
+            kind: 通知の種類（"success" / "failure" など）
+            payload: 送信関数に渡す内容（件名・本文など）
+
+        Returns:
+            登録した通知ファイルのパス（送信完了後に削除される）
+        """
+        self._dir.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        path = self._dir / f"{time.strftime('%Y%m%d-%H%M%S')}-{kind}-{uuid.uuid4().hex[:8]}.json"
+        self._write(
+            path,
+            {
+                "kind": kind,
+                "payload": payload,
+                "created_at": int(now),
+                "attempts": 0,
+                "next_attempt_at": now,
+                "last_error": None,
+            },
+        )
+        logger.info(f"通知を送信待ちキューに登録しました: {path.name}")
+        self._wakeup.set()
+        return path
+
+    def pending(self) -> list[Path]:
+        """送信待ちの通知ファイルを登録順に返す"""
+        if not self._dir.exists():
+            return []
+        return sorted(self._dir.glob("*.json"))
+
+    def _move_to_failed(self, path: Path, reason: str) -> None:
+        """送信を諦めた通知を failed/ に移す（削除はしない）"""
+        failed_dir = self._dir / "failed"
+        failed_dir.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(path), failed_dir / path.name)
+        logger.error(f"通知を送信できないため failed/ に移しました: {path.name}（{reason}）")
+
+    def _attempt(self, path: Path, message: dict[str, Any]) -> float | None:
+        """通知を1回送信する
+
+        Returns:
+            送信に失敗した場合は次回の送信時刻（epoch秒）、成功した場合None
+        """
+        try:
+            ok = self._send(message["payload"])
+            error = None if ok else "送信失敗"
+        except Exception as e:
+            ok, error = False, str(e)
+
+        if ok:
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self._sent += 1
+            logger.info(f"通知を送信しました: {path.name}")
+            return None
+
+        message["attempts"] += 1
+        delay = min(OUTBOX_BACKOFF_BASE * 2 ** (message["attempts"] - 1), OUTBOX_BACKOFF_MAX)
+        message["next_attempt_at"] = time.time() + delay
+        message["last_error"] = error
+        self._write(path, message)
+        with self._lock:
+            self._failed_attempts += 1
+        logger.warning(f"通知の送信に失敗（{message['attempts']}回目, {delay}秒後に再送）: {path.name}: {error}")
+        return message["next_attempt_at"]
+
+    def _process_due(self) -> float | None:
+        """送信時刻を過ぎた通知を送信する
+
+        Returns:
+            残っている通知のうち最も早い送信時刻（epoch秒）。残っていない場合None
+        """
+        next_due: float | None = None
+        for path in self.pending():
+            if self._stop.is_set():
+                return None
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    message = json.load(f)
+                if not isinstance(message.get("payload"), dict):
+                    raise ValueError("'payload'が辞書ではありません")
+            except (OSError, ValueError) as e:
+                self._move_to_failed(path, f"読み込み失敗: {e}")
+                continue
+
+            now = time.time()
+            if message.get("created_at", now) < now - self._max_age:
+                self._move_to_failed(path, f"保存期間切れ, 最終エラー: {message.get('last_error')}")
+                with self._lock:
+                    self._expired += 1
+                continue
+
+            due = message.get("next_attempt_at", now)
+            if due <= now:
+                due = self._attempt(path, message)
+            if due is not None:
+                next_due = due if next_due is None else min(next_due, due)
+        return next_due
+
+    def _run(self) -> None:
+        """バックグラウンド送信ループ"""
+        while not self._stop.is_set():
+            self._wakeup.clear()
+            try:
+                next_due = self._process_due()
+            except Exception as e:
+                logger.error(f"送信待ちキューの処理中にエラー: {e}")
+                next_due = time.time() + OUTBOX_BACKOFF_MAX
+            if self._closing.is_set():
+                # 終了時は送信時刻を過ぎた通知を1回ずつ送ったら終える（再送の待機はしない）
+                return
+            if next_due is None:
+                self._wakeup.wait()
+            else:
+                self._wakeup.wait(max(0.0, next_due - time.time()))
+
+    def start(self) -> None:
+        """バックグラウンド送信を開始する（開始済みの場合は何もしない）
+
+        前回までの実行で送信できなかった通知も送信対象になる。
+        """
+        if self._thread is not None and self._thread.is_alive():
+            self._wakeup.set()
+            return
+        pending = len(self.pending())
+        if pending:
+            logger.info(f"送信待ちの通知が{pending}件あります。バックグラウンドで送信します")
+        self._closing.clear()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="notification-outbox", daemon=True)
+        self._thread.start()
+
+    def close(self, timeout: float) -> dict[str, int]:
+        """送信中・送信時刻を過ぎた通知の送信を待ち、バックグラウンド送信を終了する
+
+        送信時刻を過ぎた通知を1回ずつ送り終えた時点で終了し、バックオフ中の通知の再送は待たない。
+        送信できなかった通知はキューに残し、次回実行時に再送する。timeout は送信中の1回
+        （チャネルのタイムアウト + 猶予）より長くする（デーモンスレッドのため、打ち切ると
+        送信に成功していても記録されず、次回実行時に重複して送信される）。
+
+        Args:
+            timeout: 待機する最大時間（秒）
+
+        Returns:
+            stats() の戻り値
+        """
+        if self._thread is not None:
+            self._closing.set()
+            self._wakeup.set()
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.warning(f"{timeout:.0f}秒以内に送信できなかった通知は次回実行時に再送します")
+            self._stop.set()
+            self._wakeup.set()
+            self._thread = None
+        return self.stats()
+
+    def stats(self) -> dict[str, int]:
+        """今回の実行の送信件数・失敗回数と、残っている通知数を返す"""
+        with self._lock:
+            return {
+                "sent": self._sent,
+                "failed_attempts": self._failed_attempts,
+                "expired": self._expired,
+                "pending": len(self.pending()),
+            }
@@ -0,0 +1,328 @@
+"""全文検索インデックスモジュール
+
+保存した記事のタイトル・タグ・著者を SQLite FTS5（trigram トークナイザ）で索引し、
+ソース・収集日・タグで絞り込んだ検索結果を関連度順に返す。
+インデックスは articles/ 配下のマークダウンからいつでも再構築できる。
+"""
+
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable
+
+from src.generators.markdown import DAILY_INDEX_FILENAME, article_anchor, load_saved_articles
+from src.utils.config import ARTICLES_DIR, ROOT_DIR, SEARCH_DB_FILE
+from src.utils.logger import get_logger
+
+logger = get_logger("services.search_index")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL DEFAULT '',
+    tags TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL DEFAULT '',
+    author TEXT NOT NULL DEFAULT '',
+    published TEXT NOT NULL DEFAULT '',
+    collected_date TEXT NOT NULL,
+    path TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_articles_source_date ON articles (source, collected_date);
+CREATE INDEX IF NOT EXISTS idx_articles_date ON articles (collected_date);
+
+CREATE TABLE IF NOT EXISTS article_tags (
+    article_id INTEGER NOT NULL REFERENCES articles (id) ON DELETE CASCADE,
+    tag TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (tag, article_id)
+) WITHOUT ROWID;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, tags, author,
+    content='articles', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, tags, author) VALUES (new.id, new.title, new.tags, new.author);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, tags, author)
+    VALUES ('delete', old.id, old.title, old.tags, old.author);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, tags, author)
+    VALUES ('delete', old.id, old.title, old.tags, old.author);
+    INSERT INTO articles_fts (rowid, title, tags, author) VALUES (new.id, new.title, new.tags, new.author);
+END;
+"""
+
+# 列ごとの重み（タイトル > タグ > 著者）
+_BM25_WEIGHTS = (10.0, 5.0, 1.0)
+
+# trigram トークナイザで索引検索できる最小文字数（これより短い語は部分一致で絞り込む）
+_MIN_FTS_TERM_LENGTH = 3
+
+_DATE_DIR = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _split_terms(query: str) -> list[str]:
+    """検索語を空白で分割する"""
+    return [term for term in query.split() if term]
+
+
+def _fts_phrase(term: str) -> str:
+    """検索語を FTS5 のフレーズとしてクォートする"""
+    return '"' + term.replace('"', '""') + '"'
+
+
+class SearchIndex:
+    """記事の全文検索インデックス
+
+    記事はURLで一意に管理し、同じURLを再登録した場合は内容を更新する
+    （収集日は最初に登録した日を保持する）。
+    """
+
+    def __init__(self, path: Path = SEARCH_DB_FILE):
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+
+    def open(self) -> bool:
+        """データベースに接続し、スキーマを作成する
+
+        Returns:
+            新規作成した場合True
+        """
+        is_new = not self._path.exists()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self._path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        return is_new
+
+    def _require_conn(self) -> sqlite3.Connection:
+        """接続済みのコネクションを返す"""
+        if self._conn is None:
+            self.open()
+        return self._conn
+
+    def add_articles(self, records: Iterable[tuple[dict[str, Any], str, str]]) -> int:
+        """記事をまとめて登録する（1トランザクション）
+
+        Args:
+            records: (記事情報, 収集日 YYYY-MM-DD, 保存先のリポジトリ相対パス) のイテラブル
+
+        Returns:
+            登録・更新した記事数
+        """
+        conn = self._require_conn()
+        count = 0
+        with conn:
+            for article, collected_date, path in records:
+                tags = [tag for tag in article.get("tags", []) if tag]
+                (article_id,) = conn.execute(
+                    "INSERT INTO articles (url, title, tags, source, author, published, collected_date, path) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (url) DO UPDATE SET title = excluded.title, tags = excluded.tags, "
+                    "source = excluded.source, author = excluded.author, published = excluded.published, "
+                    "path = excluded.path "
+                    "RETURNING id",
+                    (
+                        article["url"],
+                        article.get("title", ""),
+                        ", ".join(tags),
+                        article.get("source", ""),
+                        article.get("author", ""),
+                        article.get("published", ""),
+                        collected_date,
+                        path,
+                    ),
+                ).fetchone()
+                conn.execute("DELETE FROM article_tags WHERE article_id = ?", (article_id,))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO article_tags (article_id, tag) VALUES (?, ?)",
+                    [(article_id, tag) for tag in tags],
+                )
+                count += 1
+        return count
+
+    def search(
+        self,
+        query: str = "",
+        sources: list[str] | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        tag: str | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """記事を検索する
+
+        3文字以上の検索語は FTS5 のフレーズ検索（BM25で順位付け）、それより短い語は
+        タイトル・タグ・著者の部分一致で絞り込む。検索語がない場合は新しい順に返す。
+
+        Args:
+            query: 検索語（空白区切りでAND検索）
+            sources: 絞り込むソースのリスト
+            since: 収集日の下限（YYYY-MM-DD, この日を含む）
+            until: 収集日の上限（YYYY-MM-DD, この日を含む）
+            tag: 絞り込むタグ（大文字小文字を区別しない完全一致）
+            limit: 最大件数
+
+        Returns:
+            記事情報（url, title, tags, source, author, published, collected_date, path, score）のリスト
+        """
+        conn = self._require_conn()
+        terms = _split_terms(query)
+        fts_terms = [term for term in terms if len(term) >= _MIN_FTS_TERM_LENGTH]
+        short_terms = [term for term in terms if len(term) < _MIN_FTS_TERM_LENGTH]
+
+        conditions: list[str] = []
+        params: list[Any] = []
+        if fts_terms:
+            weights = ", ".join(str(weight) for weight in _BM25_WEIGHTS)
+            select_score = f"bm25(articles_fts, {weights})"
+            from_clause = "articles_fts JOIN articles a ON a.id = articles_fts.rowid"
+            conditions.append("articles_fts MATCH ?")
+            params.append(" AND ".join(_fts_phrase(term) for term in fts_terms))
+            order = "score, a.collected_date DESC"
+        else:
+            select_score = "0.0"
+            from_clause = "articles a"
+            order = "a.collected_date DESC, a.id DESC"
+
+        for term in short_terms:
+            conditions.append("(a.title LIKE ? OR a.tags LIKE ? OR a.author LIKE ?)")
+            pattern = f"%{term}%"
+            params.extend([pattern, pattern, pattern])
+        if sources:
+            conditions.append(f"a.source IN ({', '.join('?' * len(sources))})")
+            params.extend(sources)
+        if since:
+            conditions.append("a.collected_date >= ?")
+            params.append(since)
+        if until:
+            conditions.append("a.collected_date <= ?")
+            params.append(until)
+        if tag:
+            conditions.append("a.id IN (SELECT article_id FROM article_tags WHERE tag = ?)")
+            params.append(tag)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = conn.execute(
+            f"SELECT a.url, a.title, a.tags, a.source, a.author, a.published, a.collected_date, a.path, "
+            f"{select_score} AS score FROM {from_clause} {where} ORDER BY {order} LIMIT ?",
+            (*params, limit),
+        )
+        columns = ("url", "title", "tags", "source", "author", "published", "collected_date", "path", "score")
+        return [dict(zip(columns, row)) for row in rows]
+
+    def rebuild(self, articles_dir: Path = ARTICLES_DIR) -> int:
+        """articles/ 配下のマークダウンからインデックスを作り直す
+
+        Args:
+            articles_dir: 記事ディレクトリ
+
+        Returns:
+            登録した記事数
+        """
+        conn = self._require_conn()
+        with conn:
+            conn.execute("DELETE FROM article_tags")
+            conn.execute("DELETE FROM articles")
+            conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('delete-all')")
+
+        directories = sorted(
+            path for path in articles_dir.iterdir() if path.is_dir() and _DATE_DIR.match(path.name)
+        ) if articles_dir.exists() else []
+
+        total = 0
+        for directory in directories:
+            total += self.add_articles(
+                (article, directory.name, _relative_link(path, article["url"]))
+                for article, path in load_saved_articles(directory)
+            )
+        with conn:
+            conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('optimize')")
+        logger.info(f"検索インデックスを再構築しました（{len(directories)}日分, {total}件）")
+        return total
+
+    def catch_up(self, articles_dir: Path = ARTICLES_DIR) -> int:
+        """最後に登録した収集日以降の articles/ を登録し直す
+
+        キャッシュから復元したインデックスが、保存されなかった実行の記事を含まない場合に
+        差分だけを補う（同じ日の記事は再登録しても内容が更新されるだけ）。
+
+        Args:
+            articles_dir: 記事ディレクトリ
+
+        Returns:
+            登録した記事数
+        """
+        (latest,) = self._require_conn().execute("SELECT MAX(collected_date) FROM articles").fetchone()
+        if latest is None or not articles_dir.exists():
+            return 0
+        directories = sorted(
+            path for path in articles_dir.iterdir()
+            if path.is_dir() and _DATE_DIR.match(path.name) and path.name >= latest
+        )
+        total = 0
+        for directory in directories:
+            total += self.add_articles(
+                (article, directory.name, _relative_link(path, article["url"]))
+                for article, path in load_saved_articles(directory)
+            )
+        return total
+
+    def __len__(self) -> int:
+        (count,) = self._require_conn().execute("SELECT COUNT(*) FROM articles").fetchone()
+        return count
+
+    def close(self) -> None:
+        """接続を閉じる"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def _relative_link(path: Path, url: str) -> str:
+    """保存先のリポジトリ相対パス（日別まとめファイルは記事アンカー付き）"""
+    try:
+        link = path.resolve().relative_to(ROOT_DIR.resolve()).as_posix()
+    except ValueError:
+        link = path.as_posix()
+    if path.name == DAILY_INDEX_FILENAME:
+        link += f"#{article_anchor(url)}"
+    return link
+
+
+def update_search_index(saved: list[tuple[dict[str, Any], Path]], collected_date: str) -> int:
+    """保存した記事を検索インデックスに登録する
+
+    インデックスが存在しない場合は、先に articles/ から再構築する。存在する場合は
+    最後に登録した収集日以降の記事を補ってから登録する（GitHub Actions ではキャッシュから
+    復元するため、キャッシュが保存されなかった実行の記事が欠けていることがある）。
+    インデックスの更新に失敗しても収集処理は続行する。
+
+    Args:
+        saved: (記事情報, 保存先パス) のリスト
+        collected_date: 収集日（YYYY-MM-DD）
+
+    Returns:
+        登録した記事数（失敗時は0）
+    """
+    index = SearchIndex()
+    try:
+        if index.open():
+            logger.info("検索インデックスが存在しないため articles/ から再構築します")
+            index.rebuild()
+        else:
+            index.catch_up()
+        return index.add_articles(
+            (article, collected_date, _relative_link(path, article["url"])) for article, path in saved
+        )
+    except Exception as e:
+        logger.warning(f"検索インデックスの更新に失敗: {e}")
+        return 0
+    finally:
+        index.close()
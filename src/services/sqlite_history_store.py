@@ -0,0 +1,241 @@
+"""SQLite履歴ストアモジュール"""
+
+import json
+import sqlite3
+import threading
+from contextlib import AbstractContextManager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from src.services.history_store import HistoryStore, file_lock, to_epoch
+from src.utils.config import HISTORY_DB_FILE, HISTORY_FILE
+from src.utils.logger import get_logger
+from src.utils.url import canonicalize_url, url_hash
+
+logger = get_logger("services.sqlite_history_store")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url_hash INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL DEFAULT '',
+    collected_at INTEGER NOT NULL,
+    related_to TEXT,
+    similarity REAL,
+    UNIQUE (url_hash, url)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_collected_at ON articles (collected_at);
+"""
+
+# 既存のデータベースに追加する列（列名, 型）
+MIGRATION_COLUMNS = [("related_to", "TEXT"), ("similarity", "REAL")]
+
+# 全件走査時に1回のロックで読み出す行数
+_FETCH_SIZE = 1000
+
+
+class SqliteHistoryStore(HistoryStore):
+    """SQLiteに履歴を保存するストア
+
+    URLの64ビットハッシュと収集日時にインデックスを持つため、読み込み時に全件を
+    展開せず、保存時も新規エントリのみをトランザクションでまとめて挿入する。
+
+    contains() は収集中のワーカースレッドからも呼ばれるため、接続はスレッド間で共有し
+    （check_same_thread=False）、接続の使用はすべてロックで直列化する。
+    """
+
+    def __init__(self, path: Path = HISTORY_DB_FILE):
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """データベースに接続し、スキーマを作成する"""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        self._migrate(conn)
+        return conn
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """旧スキーマのデータベースに不足している列を追加する"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(articles)")}
+        for name, column_type in MIGRATION_COLUMNS:
+            if name not in columns:
+                conn.execute(f"ALTER TABLE articles ADD COLUMN {name} {column_type}")
+                logger.info(f"SQLite履歴に列を追加しました: {name}")
+
+    def load(self) -> bool:
+        try:
+            is_new = not self._path.exists()
+            with self._lock:
+                self._conn = self._connect()
+
+            # 初回作成時は既存のhistory.jsonを取り込む
+            if is_new and HISTORY_FILE.exists():
+                logger.info("SQLite履歴を新規作成したため history.json を取り込みます")
+                self.import_json(HISTORY_FILE)
+
+            logger.info(f"SQLite履歴に接続しました（{len(self)}件）")
+            return True
+        except Exception as e:
+            logger.error(f"SQLite履歴の読み込みに失敗: {e}")
+            return False
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            if key in self._pending:
+                return True
+            if self._conn is None:
+                return False
+            row = self._conn.execute(
+                "SELECT 1 FROM articles WHERE url_hash = ? AND url = ? LIMIT 1",
+                (url_hash(key), key),
+            ).fetchone()
+        return row is not None
+
+    def add(self, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._pending[entry["url"]] = entry
+
+    def _iter_rows(self, sql: str, params: tuple = ()) -> Iterator[tuple]:
+        """クエリ結果を返す（ロックは _FETCH_SIZE 行の読み出しごとに取得し、yield 中は保持しない）"""
+        with self._lock:
+            if self._conn is None:
+                return
+            cursor = self._conn.execute(sql, params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(_FETCH_SIZE)
+            if not rows:
+                return
+            yield from rows
+
+    def iter_keys(self) -> Iterator[str]:
+        for (url,) in self._iter_rows("SELECT url FROM articles"):
+            yield url
+        with self._lock:
+            pending = list(self._pending)
+        yield from pending
+
+    def iter_entries(self, since: datetime | None = None) -> Iterator[dict[str, Any]]:
+        cutoff = int(since.timestamp()) if since is not None else 0
+        rows = self._iter_rows(
+            "SELECT url, title, source, collected_at, related_to, similarity FROM articles WHERE collected_at >= ?",
+            (cutoff,),
+        )
+        for url, title, source, collected_at, related_to, similarity in rows:
+            entry = {"url": url, "title": title, "source": source, "collected_at": collected_at}
+            if related_to is not None:
+                entry["related_to"] = related_to
+            if similarity is not None:
+                entry["similarity"] = similarity
+            yield entry
+        with self._lock:
+            pending = list(self._pending.values())
+        for entry in pending:
+            if since is None or entry["collected_at"] >= int(since.timestamp()):
+                yield entry
+
+    def _insert(self, entries: list[dict[str, Any]]) -> int:
+        """エントリを1トランザクションで挿入する
+
+        Returns:
+            挿入したエントリ数（既存URLは無視）
+        """
+        rows = []
+        for entry in entries:
+            try:
+                rows.append(
+                    (
+                        url_hash(entry["url"]),
+                        entry["url"],
+                        entry.get("title", ""),
+                        entry.get("source", ""),
+                        to_epoch(entry["collected_at"]),
+                        entry.get("related_to"),
+                        entry.get("similarity"),
+                    )
+                )
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"不正なエントリをスキップ: {e}")
+
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO articles "
+                "(url_hash, url, title, source, collected_at, related_to, similarity) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            return self._conn.total_changes - before
+
+    def cleanup(self, cutoff: datetime) -> int:
+        with self._lock:
+            if self._conn is None:
+                return 0
+            with self._conn:
+                cursor = self._conn.execute(
+                    "DELETE FROM articles WHERE collected_at < ?", (int(cutoff.timestamp()),)
+                )
+        return cursor.rowcount
+
+    def save(self) -> bool:
+        if self._conn is None:
+            logger.error("SQLite履歴に接続されていません")
+            return False
+        try:
+            with self._lock:
+                inserted = self._insert(list(self._pending.values()))
+                self._pending.clear()
+            logger.info(f"SQLite履歴に保存しました（新規{inserted}件, 合計{len(self)}件）")
+            return True
+        except Exception as e:
+            logger.error(f"SQLite履歴の保存に失敗: {e}")
+            return False
+
+    def import_json(self, json_path: Path) -> int:
+        """history.json の内容を取り込む
+
+        Args:
+            json_path: 取り込むJSON履歴ファイル
+
+        Returns:
+            取り込んだエントリ数
+        """
+        with open(json_path, "r", encoding="utf-8") as f:
+            history = json.load(f)
+
+        entries = []
+        for article in history.get("articles", []):
+            entry = dict(article)
+            entry["url"] = canonicalize_url(entry.get("url", ""))
+            entries.append(entry)
+
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            imported = self._insert(entries)
+        logger.info(f"{json_path.name} から{imported}件を取り込みました")
+        return imported
+
+    def commit_lock(self) -> AbstractContextManager:
+        return file_lock(self._path.with_suffix(".lock"))
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._conn is None:
+                return len(self._pending)
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()
+            return count + len(self._pending)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,157 @@
+"""翻訳キャッシュモジュール
+
+HN記事タイトルの翻訳結果を「英語タイトル + モデル名」のハッシュをキーに永続化し、
+前回までに翻訳したタイトルをGemini APIに再送しないようにする。
+"""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from src.utils.config import (
+    TRANSLATION_CACHE_FILE,
+    TRANSLATION_CACHE_MAX_AGE_DAYS,
+    TRANSLATION_CACHE_MAX_ENTRIES,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger("services.translation_cache")
+
+
+def cache_key(title: str, model: str) -> str:
+    """英語タイトルとモデル名からキャッシュキーを生成する"""
+    return hashlib.blake2b(f"{model}\0{title}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+class TranslationCache:
+    """翻訳結果のキャッシュ（最終利用日時によるLRU・期限切れ削除付き）"""
+
+    def __init__(
+        self,
+        path: Path = TRANSLATION_CACHE_FILE,
+        max_entries: int = TRANSLATION_CACHE_MAX_ENTRIES,
+        max_age_days: int = TRANSLATION_CACHE_MAX_AGE_DAYS,
+    ):
+        self._path = path
+        self._max_entries = max_entries
+        self._max_age = max_age_days * 24 * 60 * 60
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False  # 前回の保存以降にヒット（最終利用日時の更新）・登録があった場合True
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+        self._lock = threading.Lock()
+
+    def load(self) -> bool:
+        """キャッシュファイルを読み込む（読み込み済みの場合は何もしない）
+
+        Returns:
+            読み込み成功した場合True（ファイルが存在しない場合も含む）
+        """
+        if self._loaded:
+            return True
+        self._loaded = True
+        if not self._path.exists():
+            return True
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            entries = data.get("entries", {})
+            if not isinstance(entries, dict):
+                raise ValueError("'entries'が辞書ではありません")
+            self._entries = entries
+            logger.debug(f"翻訳キャッシュを読み込みました（{len(self._entries)}件）")
+            return True
+        except Exception as e:
+            logger.warning(f"翻訳キャッシュの読み込みに失敗（無視して続行）: {e}")
+            self._entries = {}
+            return False
+
+    def get(self, title: str, model: str) -> str | None:
+        """キャッシュ済みの翻訳を返す（ヒット時は最終利用日時を更新）
+
+        Args:
+            title: 英語タイトル
+            model: 翻訳モデル名
+
+        Returns:
+            翻訳後のタイトル（未キャッシュの場合None）
+        """
+        with self._lock:
+            entry = self._entries.get(cache_key(title, model))
+            if entry is None:
+                self._misses += 1
+                return None
+            entry["used_at"] = int(time.time())
+            self._dirty = True
+            self._hits += 1
+            return entry["title"]
+
+    def put(self, title: str, model: str, translated: str) -> None:
+        """翻訳結果を登録する
+
+        Args:
+            title: 英語タイトル
+            model: 翻訳モデル名
+            translated: 翻訳後のタイトル
+        """
+        with self._lock:
+            self._entries[cache_key(title, model)] = {"title": translated, "used_at": int(time.time())}
+            self._dirty = True
+
+    def _evict(self) -> int:
+        """期限切れ・上限超過の翻訳を削除する
+
+        Returns:
+            削除した件数
+        """
+        cutoff = int(time.time()) - self._max_age
+        before = len(self._entries)
+        entries = [(key, entry) for key, entry in self._entries.items() if entry.get("used_at", 0) >= cutoff]
+        if len(entries) > self._max_entries:
+            entries.sort(key=lambda item: item[1].get("used_at", 0), reverse=True)
+            entries = entries[:self._max_entries]
+        self._entries = dict(entries)
+        return before - len(self._entries)
+
+    def save(self) -> bool:
+        """期限切れ・上限超過の翻訳を削除してからキャッシュファイルを保存する
+
+        前回の保存以降にヒット・登録がない場合は書き直さない。
+
+        Returns:
+            保存成功した場合True（変更がない場合も含む）
+        """
+        if not self._dirty:
+            return True
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self._path.with_suffix(".tmp")
+            with self._lock:
+                self._evicted += self._evict()
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    json.dump({"entries": self._entries}, f, ensure_ascii=False, indent=2, sort_keys=True)
+                temp_file.replace(self._path)
+                self._dirty = False
+            return True
+        except Exception as e:
+            logger.warning(f"翻訳キャッシュの保存に失敗: {e}")
+            return False
+
+    def stats(self) -> dict[str, int]:
+        """今回の実行のヒット・ミス件数とキャッシュ件数を返す"""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evicted": self._evicted,
+                "size": len(self._entries),
+            }
+
+
+# プロセス共通の翻訳キャッシュ
+translation_cache = TranslationCache()
@@ -1,11 +1,23 @@
 """HN記事タイトル翻訳モジュール"""
 
 import json
+import time
 from typing import Any
 
 import google.generativeai as genai
 
-from src.utils.config import GEMINI_API_KEY
+from src.services.translation_cache import translation_cache
+from src.utils.concurrency import map_bounded
+from src.utils.config import (
+    GEMINI_API_KEY,
+    TRANSLATION_CHUNK_MAX_CHARS,
+    TRANSLATION_CHUNK_MAX_TITLES,
+    TRANSLATION_CHUNK_RETRIES,
+    TRANSLATION_MAX_WORKERS,
+    TRANSLATION_MODEL,
+    TRANSLATION_TIMEOUT,
+)
+from src.utils.deadline import run_deadline
 from src.utils.logger import get_logger
 
 logger = get_logger("services.translator")
@@ -18,49 +30,163 @@ JSON配列形式で、翻訳後のタイトルのみを入力と同じ順序で
 {titles_json}"""
 
 
-def translate_hn_titles(articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Hacker News記事のタイトルを日本語に一括翻訳する
+def _chunk_titles(titles: list[str], max_titles: int, max_chars: int) -> list[list[str]]:
+    """タイトルを件数・合計文字数の上限に収まるチャンクに分割する（入力順を保持）"""
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    current_chars = 0
+    for title in titles:
+        if current and (len(current) >= max_titles or current_chars + len(title) > max_chars):
+            chunks.append(current)
+            current, current_chars = [], 0
+        current.append(title)
+        current_chars += len(title)
+    if current:
+        chunks.append(current)
+    return chunks
 
-    Gemini APIを1回だけ呼び出し、全タイトルをまとめて翻訳する。
-    翻訳失敗時は英語タイトルのままフォールバックする。
+
+def _translate_chunk(chunk: list[str]) -> dict[str, Any]:
+    """1チャンク分のタイトルを翻訳する（検証に失敗した場合は再試行）
+
+    Args:
+        chunk: 英語タイトルのリスト
+
+    Returns:
+        {"translated": 翻訳タイトルのリスト（失敗時None）, "attempts": 試行回数,
+         "seconds": 所要時間, "prompt_tokens": 入力トークン数, "output_tokens": 出力トークン数}
+    """
+    result: dict[str, Any] = {
+        "translated": None,
+        "attempts": 0,
+        "seconds": 0.0,
+        "prompt_tokens": 0,
+        "output_tokens": 0,
+    }
+    prompt = TRANSLATION_PROMPT.format(titles_json=json.dumps(chunk, ensure_ascii=False))
+    started = time.monotonic()
+
+    for _ in range(TRANSLATION_CHUNK_RETRIES + 1):
+        result["attempts"] += 1
+        try:
+            model = genai.GenerativeModel(TRANSLATION_MODEL)
+            response = model.generate_content(
+                prompt,
+                request_options={"timeout": run_deadline.clamp(TRANSLATION_TIMEOUT)},
+            )
+            usage = getattr(response, "usage_metadata", None)
+            result["prompt_tokens"] += getattr(usage, "prompt_token_count", 0) or 0
+            result["output_tokens"] += getattr(usage, "candidates_token_count", 0) or 0
+
+            translated = _parse_response(response.text, len(chunk))
+            if translated:
+                result["translated"] = translated
+                break
+        except Exception as e:
+            logger.warning(f"タイトル翻訳の呼び出しに失敗（{len(chunk)}件, {result['attempts']}回目）: {e}")
+        if run_deadline.remaining() <= 0:
+            break
+
+    result["seconds"] = round(time.monotonic() - started, 2)
+    return result
+
+
+def translate_hn_titles(articles: list[dict[str, Any]], stats: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+    """Hacker News記事のタイトルを日本語に翻訳する
+
+    翻訳キャッシュにあるタイトルはそのまま使い、未翻訳のタイトルだけを件数・文字数の
+    上限に収まるチャンクに分けてGemini APIで並行翻訳する。チャンクごとに件数を検証し、
+    失敗したチャンクは再試行のうえ、そのチャンクの記事だけ英語タイトルのまま残す。
+    元の英語タイトルは "title_en" に保持する。
 
     Args:
         articles: HN記事リスト
+        stats: 統計情報（指定時は "translation" にチャンクごとの所要時間・トークン数を記録）
 
     Returns:
-        タイトルが翻訳された記事リスト（失敗時は元のまま）
+        タイトルが翻訳された記事リスト（失敗したチャンクは元のまま）
     """
     if not articles:
         return articles
 
-    if not GEMINI_API_KEY:
-        logger.warning("GEMINI_API_KEY が未設定のため翻訳をスキップ")
-        return articles
-
-    titles = [a["title"] for a in articles]
-
+    translation_cache.load()
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel("gemini-2.5-flash-lite")
+        return _translate_titles(articles, stats)
+    finally:
+        # 全件ヒットで早期に戻った場合も最終利用日時の更新を残す（変更がなければ書き込まない）
+        translation_cache.save()
 
-        prompt = TRANSLATION_PROMPT.format(
-            titles_json=json.dumps(titles, ensure_ascii=False)
-        )
 
-        response = model.generate_content(prompt)
+def _translate_titles(articles: list[dict[str, Any]], stats: dict[str, Any] | None) -> list[dict[str, Any]]:
+    """キャッシュ済みの翻訳を適用し、残りのタイトルをチャンクに分けて翻訳する
 
-        translated = _parse_response(response.text, len(titles))
+    Args:
+        articles: HN記事リスト
+        stats: 統計情報
 
-        if translated:
-            for article, translated_title in zip(articles, translated):
-                article["title"] = translated_title
-            logger.info(f"HN記事タイトル {len(translated)}件の翻訳完了")
+    Returns:
+        タイトルが翻訳された記事リスト
+    """
+    # キャッシュ済みの翻訳を適用し、未翻訳のタイトルだけを集める（同じタイトルは1回だけ送る）
+    pending: dict[str, list[dict[str, Any]]] = {}
+    for article in articles:
+        article.setdefault("title_en", article["title"])
+        cached = translation_cache.get(article["title_en"], TRANSLATION_MODEL)
+        if cached is not None:
+            article["title"] = cached
         else:
-            logger.warning("翻訳結果のパースに失敗したためフォールバック")
+            pending.setdefault(article["title_en"], []).append(article)
+
+    cached_count = len(articles) - sum(len(group) for group in pending.values())
+    if cached_count:
+        logger.info(f"HN記事タイトル {cached_count}件を翻訳キャッシュから適用")
+    if not pending:
+        return articles
+
+    if not GEMINI_API_KEY:
+        logger.warning("GEMINI_API_KEY が未設定のため翻訳をスキップ")
+        return articles
 
+    chunks = _chunk_titles(list(pending), TRANSLATION_CHUNK_MAX_TITLES, TRANSLATION_CHUNK_MAX_CHARS)
+    try:
+        genai.configure(api_key=GEMINI_API_KEY)
     except Exception as e:
         logger.error(f"タイトル翻訳に失敗（英語タイトルのまま続行）: {e}")
-
+        return articles
+    results = map_bounded(_translate_chunk, chunks, TRANSLATION_MAX_WORKERS)
+
+    translated_count = 0
+    fallback_count = 0
+    chunk_stats: dict[str, dict[str, Any]] = {}
+    for number, (chunk, result) in enumerate(zip(chunks, results), 1):
+        if result["translated"]:
+            for title, translated_title in zip(chunk, result["translated"]):
+                translation_cache.put(title, TRANSLATION_MODEL, translated_title)
+                for article in pending[title]:
+                    article["title"] = translated_title
+            translated_count += len(chunk)
+        else:
+            fallback_count += len(chunk)
+            logger.warning(f"チャンク{number}（{len(chunk)}件）の翻訳に失敗したため英語タイトルのまま続行")
+        chunk_stats[str(number)] = {
+            "titles": len(chunk),
+            "ok": bool(result["translated"]),
+            **{key: result[key] for key in ("attempts", "seconds", "prompt_tokens", "output_tokens")},
+        }
+
+    logger.info(
+        f"HN記事タイトル {translated_count}件の翻訳完了"
+        f"（{len(chunks)}チャンク, フォールバック: {fallback_count}件）"
+    )
+
+    if stats is not None:
+        stats["translation"] = {
+            "translated": translated_count,
+            "fallback": fallback_count,
+            "prompt_tokens": sum(result["prompt_tokens"] for result in results),
+            "output_tokens": sum(result["output_tokens"] for result in results),
+            "chunks": chunk_stats,
+        }
     return articles
 
 
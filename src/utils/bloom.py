@@ -0,0 +1,161 @@
+"""ブルームフィルタモジュール（長期間の取得済みURL判定用）"""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+from pathlib import Path
+
+# ファイル形式: ヘッダー（マジック, バージョン, 想定件数, 目標偽陽性率, ビット数, ハッシュ数, 登録件数） + ビット配列
+_MAGIC = b"TTCBLOOM"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIQdQIQ")
+
+
+class BloomFilter:
+    """正規化済みURLキーの集合を固定サイズのビット配列で表すブルームフィルタ
+
+    偽陰性はなく、偽陽性率は登録件数が想定件数に近づくほど目標値に近づく。
+    ファイルから読み込んだ場合はmmap（コピーオンライト）で参照し、
+    判定時に必要なページだけを読み込む。
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        fp_rate: float,
+        num_bits: int,
+        num_hashes: int,
+        bits: bytearray | mmap.mmap,
+        offset: int = 0,
+        count: int = 0,
+    ):
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.count = count
+        self._bits = bits
+        self._offset = offset
+
+    @classmethod
+    def create(cls, capacity: int, fp_rate: float) -> "BloomFilter":
+        """想定件数と目標偽陽性率から最適なサイズのフィルタを生成する
+
+        Args:
+            capacity: 想定登録件数
+            fp_rate: 目標偽陽性率（例: 0.001）
+
+        Returns:
+            空のブルームフィルタ
+        """
+        num_bits = max(8, math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(capacity, fp_rate, num_bits, num_hashes, bytearray((num_bits + 7) // 8))
+
+    @classmethod
+    def load(cls, path: Path) -> "BloomFilter":
+        """ファイルからフィルタを読み込む（mmap）
+
+        Raises:
+            ValueError: ファイル形式が不正な場合
+            OSError: ファイルを開けない場合
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        try:
+            magic, version, capacity, fp_rate, num_bits, num_hashes, count = _HEADER.unpack_from(mapped, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("ブルームフィルタのファイル形式が不正です")
+            if len(mapped) < _HEADER.size + (num_bits + 7) // 8:
+                raise ValueError("ブルームフィルタのファイルサイズが不正です")
+        except (struct.error, ValueError):
+            mapped.close()
+            raise
+
+        return cls(capacity, fp_rate, num_bits, num_hashes, mapped, offset=_HEADER.size, count=count)
+
+    def _positions(self, key: str) -> list[int]:
+        """キーに対応するビット位置を返す（2つのハッシュ値による二重ハッシュ法）"""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, key: str) -> bool:
+        bits, offset = self._bits, self._offset
+        return all(bits[offset + (pos >> 3)] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def add(self, key: str) -> bool:
+        """キーを登録する
+
+        Returns:
+            新規に登録した場合True（登録済みと判定された場合False）
+        """
+        bits, offset = self._bits, self._offset
+        added = False
+        for pos in self._positions(key):
+            index = offset + (pos >> 3)
+            mask = 1 << (pos & 7)
+            if not bits[index] & mask:
+                bits[index] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def merge(self, other: "BloomFilter") -> None:
+        """同じパラメータのフィルタとの和集合をとる（登録件数はビットの充填率から推定する）
+
+        Raises:
+            ValueError: ビット数・ハッシュ数が異なる場合
+        """
+        if (self.num_bits, self.num_hashes) != (other.num_bits, other.num_hashes):
+            raise ValueError("ビット数・ハッシュ数が異なるブルームフィルタはマージできません")
+
+        size = self.size_bytes
+        mine = int.from_bytes(self._bits[self._offset:self._offset + size], "little")
+        theirs = int.from_bytes(other._bits[other._offset:other._offset + size], "little")
+        merged = mine | theirs
+        if merged == mine:
+            return
+
+        if isinstance(self._bits, mmap.mmap):
+            self._bits[self._offset:self._offset + size] = merged.to_bytes(size, "little")
+        else:
+            self._bits = bytearray(merged.to_bytes(size, "little"))
+            self._offset = 0
+
+        filled = merged.bit_count()
+        if filled >= self.num_bits:
+            self.count = self.capacity
+        else:
+            self.count = round(-self.num_bits / self.num_hashes * math.log(1 - filled / self.num_bits))
+
+    def estimated_fp_rate(self) -> float:
+        """現在の登録件数における推定偽陽性率"""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    @property
+    def size_bytes(self) -> int:
+        """ビット配列のバイト数"""
+        return (self.num_bits + 7) // 8
+
+    def save(self, path: Path) -> None:
+        """フィルタをファイルに保存する（一時ファイルに書き込み後リネーム）"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = path.with_suffix(f".{os.getpid()}.tmp")
+        header = _HEADER.pack(
+            _MAGIC, _VERSION, self.capacity, self.fp_rate, self.num_bits, self.num_hashes, self.count
+        )
+        with open(temp_file, "wb") as f:
+            f.write(header)
+            f.write(self._bits[self._offset:self._offset + self.size_bytes])
+        temp_file.replace(path)
+
+    def close(self) -> None:
+        """mmapを解放する"""
+        if isinstance(self._bits, mmap.mmap) and not self._bits.closed:
+            self._bits.close()
@@ -0,0 +1,60 @@
+"""並行処理ユーティリティモジュール"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, TypeVar
+
+from src.utils.config import PER_HOST_CONCURRENCY
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# ホスト名ごとの同時接続数制限用セマフォ
+_host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def host_slot(host: str) -> threading.BoundedSemaphore:
+    """ホスト単位の同時実行数を制限するセマフォを取得する
+
+    使用例:
+        with host_slot("qiita.com"):
+            ...  # HTTPリクエスト
+
+    Args:
+        host: 接続先ホスト名
+
+    Returns:
+        ホスト共通のセマフォ（上限: PER_HOST_CONCURRENCY）
+    """
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(PER_HOST_CONCURRENCY)
+            _host_semaphores[host] = semaphore
+        return semaphore
+
+
+def map_bounded(func: Callable[[T], R], items: Iterable[T], max_workers: int) -> list[R]:
+    """上限付きのスレッドプールで関数を並行適用する
+
+    結果は入力と同じ順序で返す。funcは例外を送出しないこと（呼び出し側で処理）。
+
+    Args:
+        func: 各要素に適用する関数
+        items: 入力要素
+        max_workers: 最大ワーカー数
+
+    Returns:
+        入力順に並んだ結果リスト
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    workers = max(1, min(max_workers, len(items)))
+    if workers == 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
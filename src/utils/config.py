@@ -16,18 +16,105 @@ ROOT_DIR = Path(__file__).parent.parent.parent
 DATA_DIR = ROOT_DIR / "data"
 ARTICLES_DIR = ROOT_DIR / "articles"
 
+# 記事の出力形式
+# "files": 記事ごとに1ファイル / "daily": 日別まとめファイル（articles/YYYY-MM-DD/index.md）
+OUTPUT_MODE = os.getenv("OUTPUT_MODE", "files")
+
 # 履歴ファイルパス
 HISTORY_FILE = DATA_DIR / "history.json"
+HISTORY_DB_FILE = DATA_DIR / "history.db"
+HISTORY_JOURNAL_FILE = DATA_DIR / "history.journal.jsonl"
+BUNDLES_DIR = DATA_DIR / "bundles"  # シャード実行の結果バンドルの出力先
+HISTORY_INDEX_FILE = DATA_DIR / "history.idx"  # 重複判定用のURLハッシュ索引（JSON / ジャーナル形式で使用）
+# URLハッシュ索引を使うかどうか。索引は履歴ファイルのサイズ・更新時刻で鮮度を判定するため、
+# 毎回チェックアウトし直す GitHub Actions では一致せず、作り直しの分だけ遅くなる（既定は無効）
+HISTORY_INDEX_ENABLED = os.getenv("HISTORY_INDEX_ENABLED", "false").lower() == "true"
+
+# 履歴バックエンド
+# "json": history.json / "journal": history.json + 追記ジャーナル / "sqlite": history.db
+HISTORY_BACKEND = os.getenv("HISTORY_BACKEND", "json")
+HISTORY_JOURNAL_COMPACT_THRESHOLD = 500  # ジャーナルをスナップショットに畳み込む行数
+HISTORY_RETENTION_DAYS = 7  # 履歴の保持日数（毎回の実行時に期限切れを削除）
+
+# 長期重複判定（ブルームフィルタ）設定
+# 履歴の保持期間を過ぎた記事もここで取得済みと判定する
+SEEN_FILTER_ENABLED = True
+SEEN_FILTER_FILE = DATA_DIR / "seen.bloom"
+SEEN_FILTER_CAPACITY = 200_000  # 想定登録件数（約10年分）
+SEEN_FILTER_FP_RATE = 0.001  # 目標偽陽性率
+
+# 類似記事（ニア重複）検出設定
+NEAR_DUP_ENABLED = True
+NEAR_DUP_THRESHOLD = 0.7  # 類似と判定する推定Jaccard係数の下限
+NEAR_DUP_NUM_PERM = 64  # MinHashのハッシュ関数数
+NEAR_DUP_BANDS = 16  # LSHのバンド数（NEAR_DUP_NUM_PERM の約数）
+NEAR_DUP_NGRAM = 3  # シングルの文字数
+NEAR_DUP_WINDOW_DAYS = 7  # 照合対象とする履歴の期間（日）
+
+# 全文検索インデックス（SQLite FTS5）
+# articles/ から再構築できるためリポジトリには含めない（存在しない場合は初回更新時に再構築）
+SEARCH_DB_FILE = DATA_DIR / "search.db"
+
+# HNタイトル翻訳設定
+TRANSLATION_MODEL = "gemini-2.5-flash-lite"
+TRANSLATION_CACHE_FILE = DATA_DIR / "translation_cache.json"
+TRANSLATION_CACHE_MAX_ENTRIES = 5000  # 保持する翻訳の上限件数（超えた分は最終利用が古い順に削除）
+TRANSLATION_CACHE_MAX_AGE_DAYS = 30  # 最終利用からこの日数を過ぎた翻訳は削除
+TRANSLATION_CHUNK_MAX_TITLES = 15  # 1回のAPI呼び出しで送るタイトル数の上限
+TRANSLATION_CHUNK_MAX_CHARS = 2000  # 1回のAPI呼び出しで送るタイトルの合計文字数の上限
+TRANSLATION_MAX_WORKERS = 3  # チャンクを並行翻訳する最大数
+TRANSLATION_CHUNK_RETRIES = 1  # チャンクの翻訳・検証に失敗した場合の再試行回数
+
+# 通知の送信待ちキュー（outbox）設定
+# 通知はまずここに書き出し、バックグラウンドで送信する（未送信分は次回実行時に再送）
+OUTBOX_DIR = DATA_DIR / "outbox"
+OUTBOX_MAX_AGE_DAYS = 7  # 登録からこの日数を過ぎても送信できない通知は outbox/failed に移す
+OUTBOX_BACKOFF_BASE = 2  # 再送間隔の初期値（秒, 失敗ごとに倍）
+OUTBOX_BACKOFF_MAX = 60  # 再送間隔の上限（秒）
+
+# フィード検証子（ETag/Last-Modified）キャッシュファイルパス
+FEED_CACHE_FILE = DATA_DIR / "feed_cache.json"
 
 # RSS設定
 QIITA_RSS_URL = "https://qiita.com/popular-items/feed.atom"
 ZENN_RSS_URL = "https://zenn.dev/feed"
 HN_RSS_URL = "https://hnrss.org/frontpage"
 HATENA_RSS_URL = "https://b.hatena.ne.jp/hotentry/it.rss"
+FEED_PARSER = "fast"  # "fast": 高速パーサー（失敗時feedparser） / "feedparser": 常にfeedparser
 
 # タイムアウト設定（秒）
+RUN_DEADLINE = 45 * 60  # 実行全体の時間予算（GitHub Actionsのジョブ上限60分未満）
+HTTP_CONNECT_TIMEOUT = 5  # 接続確立のタイムアウト
 RSS_TIMEOUT = 30
 NOTIFICATION_TIMEOUT = 30
+WEBHOOK_TIMEOUT = 10  # Webhook通知のPOST
+# 通知チャネルのタイムアウトを過ぎてから送信完了を待つ猶予（HTTPのタイムアウトは接続確立の時間を含まないため）
+NOTIFICATION_TIMEOUT_GRACE = HTTP_CONNECT_TIMEOUT + 5
+# 実行終了時に通知の送信完了を待つ最大時間（送信中の1回分を打ち切らない長さ。再送の待機はしない）
+OUTBOX_WAIT_TIMEOUT = max(NOTIFICATION_TIMEOUT, WEBHOOK_TIMEOUT) + NOTIFICATION_TIMEOUT_GRACE
+API_TIMEOUT = 10  # Qiita/Zenn API呼び出し
+TRANSLATION_TIMEOUT = 60  # Gemini API呼び出し
+
+# HTTPクライアント設定
+HTTP_POOL_MAXSIZE = 10  # ホストごとに保持する最大接続数
+
+# 並行処理設定
+ENRICH_MAX_WORKERS = 8  # いいね数取得の最大並列数
+PER_HOST_CONCURRENCY = 4  # 同一ホストへの最大同時リクエスト数
+COLLECT_MAX_WORKERS = 8  # ソース・優先トピック取得の最大並列数
+MARKDOWN_WRITE_WORKERS = 4  # マークダウン書き込みの最大並列数
+
+# ソース名の一覧（結果のマージ順）
+SOURCES = ["qiita", "zenn", "hackernews", "hatena"]
+
+# ソース別の取得タイムアウト（秒）
+COLLECT_TIMEOUTS = {
+    "qiita": 180,
+    "zenn": 180,
+    "hackernews": 60,
+    "hatena": 60,
+    "priority": 60,
+}
 
 # 優先トピック設定（AWS/Python専用枠）
 PRIORITY_TOPICS = ["aws", "python"]
@@ -37,6 +124,7 @@ PRIORITY_TOPIC_LIMIT = 5  # 各トピック・各ソースの取得上限件数
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 RESEND_API_KEY = os.getenv("RESEND_API_KEY", "")
 NOTIFICATION_EMAIL = os.getenv("NOTIFICATION_EMAIL", "")
+NOTIFICATION_WEBHOOK_URL = os.getenv("NOTIFICATION_WEBHOOK_URL", "")  # Slack / Discord 互換のWebhook URL
 
 
 def validate_config() -> Tuple[bool, List[str]]:
@@ -49,16 +137,20 @@ def validate_config() -> Tuple[bool, List[str]]:
 
     # Resend APIキーチェック
     if not RESEND_API_KEY:
-        warnings.append("RESEND_API_KEY が未設定です。通知機能は無効になります。")
+        warnings.append("RESEND_API_KEY が未設定です。メール通知は無効になります。")
     elif not RESEND_API_KEY.startswith("re_"):
         warnings.append("RESEND_API_KEY のフォーマットが不正の可能性があります（re_で始まる必要があります）。")
 
     # 通知先メールチェック
     if RESEND_API_KEY and not NOTIFICATION_EMAIL:
-        warnings.append("NOTIFICATION_EMAIL が未設定です。通知機能は無効になります。")
+        warnings.append("NOTIFICATION_EMAIL が未設定です。メール通知は無効になります。")
     elif NOTIFICATION_EMAIL and "@" not in NOTIFICATION_EMAIL:
         warnings.append("NOTIFICATION_EMAIL のフォーマットが不正です。")
 
+    # Webhook URLチェック
+    if NOTIFICATION_WEBHOOK_URL and not NOTIFICATION_WEBHOOK_URL.startswith(("https://", "http://")):
+        warnings.append("NOTIFICATION_WEBHOOK_URL のフォーマットが不正です（http(s):// で始まる必要があります）。")
+
     # ディレクトリ存在チェック・作成
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     ARTICLES_DIR.mkdir(parents=True, exist_ok=True)
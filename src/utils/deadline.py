@@ -0,0 +1,55 @@
+"""実行時間予算（デッドライン）管理モジュール"""
+
+import threading
+import time
+
+import requests
+
+from src.utils.config import RUN_DEADLINE
+
+
+class DeadlineExceeded(requests.Timeout):
+    """実行全体の時間予算を使い切った場合の例外"""
+
+
+class Deadline:
+    """実行全体で共有する時間予算
+
+    各通信処理は remaining() の範囲内で自身のタイムアウトを決める。
+    socket.setdefaulttimeout のようなプロセス全体の設定は変更しない。
+    """
+
+    def __init__(self, budget: float = RUN_DEADLINE):
+        self._lock = threading.Lock()
+        self._expires_at = time.monotonic() + budget
+
+    def reset(self, budget: float = RUN_DEADLINE) -> None:
+        """時間予算を再設定する（実行開始時に呼び出す）"""
+        with self._lock:
+            self._expires_at = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        """残り時間（秒）を返す。期限切れの場合は0"""
+        with self._lock:
+            return max(0.0, self._expires_at - time.monotonic())
+
+    def clamp(self, timeout: float) -> float:
+        """タイムアウト値を残り時間以内に切り詰める
+
+        Args:
+            timeout: 処理ごとのタイムアウト上限（秒）
+
+        Returns:
+            min(timeout, 残り時間)
+
+        Raises:
+            DeadlineExceeded: 残り時間がない場合
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded("実行全体の時間予算を超過しました")
+        return min(timeout, remaining)
+
+
+# プロセス共通のデッドライン
+run_deadline = Deadline()
@@ -0,0 +1,201 @@
+"""RSS/Atomフィード取得モジュール（ETag/Last-Modifiedによる条件付き取得）"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from src.utils.config import FEED_CACHE_FILE, RSS_TIMEOUT
+from src.utils.feed_parser import parse_feed
+from src.utils.http_client import http_client
+from src.utils.logger import get_logger
+
+logger = get_logger("utils.feed")
+
+
+class FeedCache:
+    """フィードごとの検証子（ETag/Last-Modified）と304ヒット数を永続化するクラス
+
+    取得した新しい検証子は保留しておき、そのソースの取得結果が実際に使われた時点で
+    commit() により反映する（タイムアウトや例外で捨てた結果の検証子を保存すると、
+    次回は304となりその記事を取りこぼすため）。
+    """
+
+    def __init__(self, path: Path = FEED_CACHE_FILE):
+        self._path = path
+        self._feeds: dict[str, dict[str, Any]] = {}
+        self._run_status: dict[str, int] = {}
+        self._pending: dict[str, tuple[str | None, str | None]] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> bool:
+        """キャッシュファイルを読み込む
+
+        Returns:
+            読み込み成功した場合True（ファイルが存在しない場合も含む）
+        """
+        if not self._path.exists():
+            return True
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            feeds = data.get("feeds", {})
+            if not isinstance(feeds, dict):
+                raise ValueError("'feeds'が辞書ではありません")
+            self._feeds = feeds
+            logger.debug(f"フィードキャッシュを読み込みました（{len(self._feeds)}件）")
+            return True
+        except Exception as e:
+            logger.warning(f"フィードキャッシュの読み込みに失敗（無視して続行）: {e}")
+            self._feeds = {}
+            return False
+
+    def save(self) -> bool:
+        """キャッシュファイルを保存する
+
+        Returns:
+            保存成功した場合True
+        """
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self._path.with_suffix(".tmp")
+            with self._lock:
+                data = {"feeds": self._feeds}
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+            temp_file.replace(self._path)
+            return True
+        except Exception as e:
+            logger.warning(f"フィードキャッシュの保存に失敗: {e}")
+            return False
+
+    def get_validators(self, source: str) -> tuple[str | None, str | None]:
+        """前回取得時の (ETag, Last-Modified) を返す"""
+        with self._lock:
+            entry = self._feeds.get(source, {})
+            return entry.get("etag"), entry.get("modified")
+
+    def record(self, source: str, status: int, etag: str | None, modified: str | None) -> None:
+        """取得結果を記録する（新しい検証子は commit() まで保留する）
+
+        Args:
+            source: ソース名
+            status: HTTPステータスコード
+            etag: レスポンスのETag
+            modified: レスポンスのLast-Modified
+        """
+        with self._lock:
+            entry = self._feeds.setdefault(source, {"requests": 0, "not_modified": 0})
+            entry["requests"] = entry.get("requests", 0) + 1
+            if status == 304:
+                entry["not_modified"] = entry.get("not_modified", 0) + 1
+            else:
+                self._pending[source] = (etag, modified)
+            self._run_status[source] = status
+
+    def commit(self, source: str) -> None:
+        """保留中の検証子を反映する（取得結果を使用したソースについて呼び出す）
+
+        Args:
+            source: ソース名
+        """
+        with self._lock:
+            if source not in self._pending:
+                return
+            # 検証子が返らなかった場合は前回値を破棄する
+            entry = self._feeds[source]
+            entry["etag"], entry["modified"] = self._pending.pop(source)
+
+    def discard(self, source: str) -> None:
+        """保留中の検証子を破棄する（取得した記事を処理できなかった場合に呼び出す）
+
+        Args:
+            source: ソース名
+        """
+        with self._lock:
+            self._pending.pop(source, None)
+
+    def export_run(self) -> dict[str, Any]:
+        """今回の実行で取得したソースの状態を返す（シャード実行の結果バンドル用）
+
+        Returns:
+            {"feeds": {source: 検証子・累計}, "status": {source: 今回のステータス}}
+        """
+        with self._lock:
+            return {
+                "feeds": {source: dict(self._feeds[source]) for source in self._run_status},
+                "status": dict(self._run_status),
+            }
+
+    def apply_run(self, state: dict[str, Any]) -> None:
+        """export_run の結果を取り込む（シャード実行結果のマージ用）"""
+        with self._lock:
+            self._feeds.update(state.get("feeds", {}))
+            self._run_status.update(state.get("status", {}))
+
+    def is_not_modified(self, source: str) -> bool:
+        """今回の実行で指定ソースが304だったかどうか"""
+        return self._run_status.get(source) == 304
+
+    def hit_rates(self) -> dict[str, dict[str, Any]]:
+        """ソース別の304ヒット状況を返す
+
+        Returns:
+            {source: {"status": 今回のステータス, "requests": 累計, "not_modified": 累計, "rate": 累計ヒット率}}
+        """
+        with self._lock:
+            result = {}
+            for source, entry in self._feeds.items():
+                requests = entry.get("requests", 0)
+                not_modified = entry.get("not_modified", 0)
+                result[source] = {
+                    "status": self._run_status.get(source),
+                    "requests": requests,
+                    "not_modified": not_modified,
+                    "rate": not_modified / requests if requests else 0.0,
+                }
+            return result
+
+
+# プロセス共通のフィードキャッシュ
+feed_cache = FeedCache()
+
+
+def fetch_feed(url: str, source: str) -> list[dict[str, Any]] | None:
+    """フィードを条件付きGETで取得・パースする
+
+    前回の検証子を送信し、304（未更新）の場合はパースを行わずNoneを返す。
+    新しい検証子はパース後に保留として記録し、feed_cache.commit() で保存対象になる。
+
+    Args:
+        url: フィードURL
+        source: ソース名（検証子の保存キー）
+
+    Returns:
+        正規化済み記事エントリのリスト（src.utils.feed_parser.parse_feed を参照）
+        未更新（304）の場合はNone
+
+    Raises:
+        requests.RequestException: 通信エラー・タイムアウト・HTTPエラー
+    """
+    etag, modified = feed_cache.get_validators(source)
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+
+    response = http_client.get(url, headers=headers, timeout=RSS_TIMEOUT)
+
+    if response.status_code == 304:
+        feed_cache.record(source, 304, etag, modified)
+        logger.info(f"{source} フィードは前回から更新されていません (304)")
+        return None
+
+    response.raise_for_status()
+    entries = parse_feed(response.content)
+    feed_cache.record(
+        source, response.status_code, response.headers.get("ETag"), response.headers.get("Last-Modified")
+    )
+    return entries
@@ -0,0 +1,200 @@
+"""フィードパーサーモジュール（既知形式向けの高速パーサーとfeedparserフォールバック）
+
+対象フィード（Qiita Atom / Zenn RSS / hnrss RSS / はてなブックマーク RDF）は形式が固定のため、
+xml.etree.ElementTree.iterparse で必要な項目だけを逐次抽出する。
+XMLとして不正な場合や記事要素が見つからない場合はfeedparserで解析する。
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import feedparser
+
+from src.utils.config import FEED_PARSER
+from src.utils.logger import get_logger
+
+logger = get_logger("utils.feed_parser")
+
+# 記事要素のローカル名（Atom: entry, RSS/RDF: item）
+_ENTRY_TAGS = {"entry", "item"}
+
+
+def _local_name(tag: str) -> str:
+    """名前空間を除いた要素名を返す（例: {http://...}title → title）"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_date(text: str | None) -> str | None:
+    """W3CDTF/RFC822形式の日時をUTCのISO形式文字列に変換する
+
+    feedparserの published_parsed と同じく、UTCに変換した上でタイムゾーン情報と
+    マイクロ秒を除いた値を返す。
+    """
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.replace(microsecond=0).isoformat()
+
+
+def _to_int(value: Any) -> int | None:
+    """整数に変換する（変換できない場合はNone）"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _new_entry() -> dict[str, Any]:
+    """正規化済み記事エントリの雛形を返す"""
+    return {
+        "title": "",
+        "link": "",
+        "author": "",
+        "published": None,
+        "tags": [],
+        "description": "",
+        "bookmarkcount": None,
+    }
+
+
+def _parse_entry(element: ET.Element) -> dict[str, Any]:
+    """entry/item要素から必要な項目を抽出する"""
+    entry = _new_entry()
+    fallback_date = None
+
+    for child in element:
+        name = _local_name(child.tag)
+        text = (child.text or "").strip()
+
+        if name == "title":
+            entry["title"] = text
+        elif name == "link":
+            href = child.get("href")
+            if href is not None:
+                # Atom: rel="alternate"（省略時も同じ）のリンクを採用
+                if child.get("rel", "alternate") == "alternate" and not entry["link"]:
+                    entry["link"] = href
+            elif text:
+                entry["link"] = text
+        elif name == "author":
+            author_name = next((c for c in child if _local_name(c.tag) == "name"), None)
+            entry["author"] = (author_name.text or "").strip() if author_name is not None else text
+        elif name == "creator":
+            # dc:creator
+            if not entry["author"]:
+                entry["author"] = text
+        elif name in ("published", "pubDate", "issued"):
+            entry["published"] = _parse_date(text)
+        elif name in ("date", "updated"):
+            # dc:date / Atom updated は公開日時がない場合のみ使用
+            fallback_date = text
+        elif name == "category":
+            term = child.get("term") or text
+            if term:
+                entry["tags"].append(term)
+        elif name == "subject":
+            # dc:subject
+            if text:
+                entry["tags"].append(text)
+        elif name in ("description", "summary"):
+            entry["description"] = text
+        elif name == "content":
+            # Atom content は description/summary がない場合のみ使用
+            if not entry["description"]:
+                entry["description"] = text
+        elif name == "bookmarkcount":
+            # hatena:bookmarkcount
+            entry["bookmarkcount"] = _to_int(text)
+
+    if entry["published"] is None:
+        entry["published"] = _parse_date(fallback_date)
+
+    return entry
+
+
+def parse_fast(content: bytes) -> list[dict[str, Any]]:
+    """iterparseでフィードを逐次解析する
+
+    記事要素は処理後すぐに破棄するため、ツリー全体をメモリに保持しない。
+
+    Args:
+        content: フィードのバイト列
+
+    Returns:
+        正規化済み記事エントリのリスト
+
+    Raises:
+        xml.etree.ElementTree.ParseError: XMLとして不正な場合
+    """
+    entries = []
+    for _, element in ET.iterparse(io.BytesIO(content), events=("end",)):
+        if _local_name(element.tag) in _ENTRY_TAGS:
+            entries.append(_parse_entry(element))
+            element.clear()
+    return entries
+
+
+def parse_with_feedparser(content: bytes) -> list[dict[str, Any]]:
+    """feedparserでフィードを解析し、高速パーサーと同じ形式に正規化する
+
+    Args:
+        content: フィードのバイト列
+
+    Returns:
+        正規化済み記事エントリのリスト
+    """
+    feed = feedparser.parse(content)
+
+    if feed.get("bozo") and feed.get("bozo_exception"):
+        logger.warning(f"RSSパースに問題がありました: {feed.bozo_exception}")
+
+    entries = []
+    for item in feed.entries:
+        entry = _new_entry()
+        entry["title"] = item.get("title", "")
+        entry["link"] = item.get("link", "")
+        entry["author"] = item.get("author", "")
+        parsed = item.get("published_parsed") or item.get("updated_parsed")
+        if parsed:
+            entry["published"] = datetime(*parsed[:6]).isoformat()
+        entry["tags"] = [tag.term for tag in item.get("tags", []) if tag.get("term")]
+        entry["description"] = item.get("description", "")
+        entry["bookmarkcount"] = _to_int(item.get("hatena_bookmarkcount"))
+        entries.append(entry)
+    return entries
+
+
+def parse_feed(content: bytes) -> list[dict[str, Any]]:
+    """フィードを解析する
+
+    FEED_PARSER が "fast" の場合は高速パーサーを使用し、失敗時はfeedparserにフォールバックする。
+
+    Args:
+        content: フィードのバイト列
+
+    Returns:
+        正規化済み記事エントリのリスト
+        （title, link, author, published, tags, description, bookmarkcount）
+    """
+    if FEED_PARSER == "fast":
+        try:
+            entries = parse_fast(content)
+            if entries:
+                return entries
+            logger.debug("高速パーサーで記事要素が見つからないためfeedparserで再解析します")
+        except ET.ParseError as e:
+            logger.warning(f"高速パーサーでの解析に失敗（feedparserで再解析）: {e}")
+
+    return parse_with_feedparser(content)
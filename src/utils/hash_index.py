@@ -0,0 +1,117 @@
+"""URLハッシュ索引モジュール（履歴の重複判定用サイドカーファイル）"""
+
+import bisect
+import heapq
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+from src.utils.url import url_hash
+
+# ファイル形式: ヘッダー（マジック, バージョン, 予約, 件数, 履歴ファイルのフィンガープリント） + 昇順の64ビット整数配列
+# ヘッダーは32バイト（配列を8バイト境界に揃える）。整数配列はネイティブのバイト順
+# （実行環境はいずれもリトルエンディアン）で保存する
+_MAGIC = b"TTCHIDX1"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQq")
+
+
+class HashIndex:
+    """正規化済みURLの64ビットハッシュを昇順に並べた索引
+
+    ファイルはmmapで参照し、二分探索で判定するため、読み込み時に件数分の
+    Pythonオブジェクトを生成しない。新規キーはメモリ上の差分に保持し、
+    保存時に既存の配列とマージする。
+    """
+
+    def __init__(self, hashes: memoryview | array, fingerprint: int = 0, mapped: mmap.mmap | None = None):
+        self.fingerprint = fingerprint
+        self._hashes = hashes
+        self._mapped = mapped
+        self._delta: set[int] = set()
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[str]) -> "HashIndex":
+        """キーの集合から索引を生成する"""
+        return cls(array("q", sorted({url_hash(key) for key in keys})))
+
+    @classmethod
+    def load(cls, path: Path) -> "HashIndex":
+        """ファイルから索引を読み込む（mmap）
+
+        Raises:
+            ValueError: ファイル形式が不正な場合
+            OSError: ファイルを開けない場合
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, _, count, fingerprint = _HEADER.unpack_from(mapped, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("URLハッシュ索引のファイル形式が不正です")
+            if len(mapped) != _HEADER.size + count * 8:
+                raise ValueError("URLハッシュ索引のファイルサイズが不正です")
+        except (struct.error, ValueError):
+            mapped.close()
+            raise
+
+        with memoryview(mapped) as view:
+            hashes = view[_HEADER.size:].cast("q")
+        return cls(hashes, fingerprint=fingerprint, mapped=mapped)
+
+    def __contains__(self, key: str) -> bool:
+        value = url_hash(key)
+        if value in self._delta:
+            return True
+        hashes = self._hashes
+        index = bisect.bisect_left(hashes, value)
+        return index < len(hashes) and hashes[index] == value
+
+    def add(self, key: str) -> None:
+        """キーを差分に追加する（永続化は save で行う）"""
+        self._delta.add(url_hash(key))
+
+    def __len__(self) -> int:
+        return len(self._hashes) + len(self._delta)
+
+    def save(self, path: Path, fingerprint: int) -> None:
+        """差分をマージして保存する（一時ファイルに書き込み後リネーム）
+
+        Args:
+            path: 保存先
+            fingerprint: 索引の元になった履歴ファイルのフィンガープリント
+        """
+        # 差分がなく履歴も変わっていない場合は書き直さない
+        if not self._delta and fingerprint == self.fingerprint and path.exists():
+            return
+
+        merged = array("q")
+        previous = None
+        for value in heapq.merge(self._hashes, sorted(self._delta)):
+            if value != previous:
+                merged.append(value)
+                previous = value
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        with open(temp_file, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, 0, len(merged), fingerprint))
+            merged.tofile(f)
+        temp_file.replace(path)
+
+        self.close()
+        self._hashes = merged
+        self._delta = set()
+        self.fingerprint = fingerprint
+
+    def close(self) -> None:
+        """mmapを解放する"""
+        if self._mapped is not None:
+            if isinstance(self._hashes, memoryview):
+                self._hashes.release()
+            self._mapped.close()
+            self._mapped = None
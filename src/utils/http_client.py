@@ -0,0 +1,187 @@
+"""共通HTTPクライアントモジュール（コネクションプール・keep-alive・圧縮転送）"""
+
+import threading
+import time
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.config import (
+    API_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_POOL_MAXSIZE,
+    PER_HOST_CONCURRENCY,
+)
+from src.utils.deadline import DeadlineExceeded, run_deadline
+from src.utils.logger import get_logger
+
+logger = get_logger("utils.http_client")
+
+USER_AGENT = "TechTrendCollector/1.0"
+
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+# レスポンス本文の読み込み単位（この単位ごとに期限を確認する）
+_CHUNK_SIZE = 64 * 1024
+
+
+class HttpClient:
+    """ホスト単位のコネクションプールを共有するHTTPクライアント
+
+    requests.Sessionを1つだけ保持し、全コレクターから共有する。
+    各リクエストのタイムアウトは実行全体のデッドラインの残り時間以内に収める。
+    リクエスト数・受信バイト数（圧縮後）・接続再利用数を集計する。
+    """
+
+    def __init__(self):
+        self._session = requests.Session()
+        self._session.headers.update(DEFAULT_HEADERS)
+        self._adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_MAXSIZE,
+            pool_maxsize=max(HTTP_POOL_MAXSIZE, PER_HOST_CONCURRENCY),
+        )
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._bytes = 0
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        json: Any = None,
+        timeout: float = API_TIMEOUT,
+    ) -> requests.Response:
+        """HTTPリクエストを送信する
+
+        timeoutはリクエスト全体（接続から本文の読み込み完了まで）の上限で、
+        実行全体のデッドラインの残り時間を超えない。
+
+        Args:
+            method: HTTPメソッド
+            url: リクエストURL
+            headers: 追加ヘッダー
+            json: JSONボディ
+            timeout: リクエスト全体のタイムアウト秒数
+
+        Returns:
+            レスポンス（本文は読み込み済み）
+
+        Raises:
+            DeadlineExceeded: タイムアウト・時間予算の超過
+            requests.RequestException: 通信エラー・タイムアウト
+        """
+        request_timeout = run_deadline.clamp(timeout)
+        expires_at = time.monotonic() + request_timeout
+
+        response = self._session.request(
+            method,
+            url,
+            headers=headers,
+            json=json,
+            timeout=(min(HTTP_CONNECT_TIMEOUT, request_timeout), request_timeout),
+            stream=True,
+        )
+        try:
+            chunks = []
+            for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                if time.monotonic() > expires_at:
+                    raise DeadlineExceeded(f"レスポンスの受信が{request_timeout:.1f}秒以内に完了しませんでした: {url}")
+                chunks.append(chunk)
+        except Exception:
+            response.close()
+            raise
+
+        # 読み込み済みの本文をResponseに設定する（以降は通常のResponseとして扱える）
+        response._content = b"".join(chunks)
+        self._record(response)
+        return response
+
+    def get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float = API_TIMEOUT,
+    ) -> requests.Response:
+        """GETリクエストを送信する
+
+        Raises:
+            requests.RequestException: 通信エラー・タイムアウト
+        """
+        return self.request("GET", url, headers=headers, timeout=timeout)
+
+    def get_json(self, url: str, timeout: float = API_TIMEOUT) -> Any:
+        """GETリクエストを送信しJSONとしてデコードする
+
+        Raises:
+            requests.RequestException: 通信エラー・タイムアウト・HTTPエラー
+            ValueError: JSONのデコードに失敗した場合
+        """
+        response = self.get(url, headers={"Accept": "application/json"}, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def post_json(
+        self,
+        url: str,
+        payload: Any,
+        headers: dict[str, str] | None = None,
+        timeout: float = API_TIMEOUT,
+    ) -> requests.Response:
+        """JSONボディのPOSTリクエストを送信する
+
+        Raises:
+            requests.RequestException: 通信エラー・タイムアウト・HTTPエラー
+        """
+        response = self.request("POST", url, headers=headers, json=payload, timeout=timeout)
+        response.raise_for_status()
+        return response
+
+    def _record(self, response: requests.Response) -> None:
+        """リクエスト数と受信バイト数を集計する"""
+        # 圧縮状態のままの受信バイト数を取得する
+        try:
+            received = response.raw.tell() or len(response.content)
+        except Exception:
+            received = len(response.content)
+
+        with self._lock:
+            self._requests += 1
+            self._bytes += received
+
+    def stats(self) -> dict[str, int]:
+        """通信統計を返す
+
+        Returns:
+            {"requests": リクエスト数, "bytes": 受信バイト数,
+             "new_connections": 新規接続数, "reused_connections": 接続再利用数}
+        """
+        new_connections = 0
+        pool_requests = 0
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            new_connections += pool.num_connections
+            pool_requests += pool.num_requests
+
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "bytes": self._bytes,
+                "new_connections": new_connections,
+                "reused_connections": max(0, pool_requests - new_connections),
+            }
+
+
+# プロセス共通のHTTPクライアント
+http_client = HttpClient()
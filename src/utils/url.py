@@ -0,0 +1,114 @@
+"""URL正規化モジュール（重複判定用の正規化キー生成）"""
+
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 除去するトラッキング用クエリパラメータ
+# "ref" はGitHub/GitLabのブランチ指定など内容を変えるサイトがあるため除去しない
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "yclid",
+    "mc_cid",
+    "mc_eid",
+    "igshid",
+    "ref_src",
+    "_hsenc",
+    "_hsmi",
+}
+TRACKING_PARAM_PREFIXES = ("utm_",)
+
+
+def _is_tracking_param(name: str) -> bool:
+    """トラッキング用クエリパラメータかどうかを判定する"""
+    lower = name.lower()
+    return lower in TRACKING_PARAMS or lower.startswith(TRACKING_PARAM_PREFIXES)
+
+
+def _resolve_short_form(url: str) -> str:
+    """既知の短縮形式・中継URLを元のURLに展開する
+
+    例:
+        https://b.hatena.ne.jp/entry/s/example.com/a → https://example.com/a
+        https://youtu.be/abc → https://www.youtube.com/watch?v=abc
+    """
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    path = parts.path
+
+    # はてなブックマークのエントリページ（/entry/s/ はhttps、/entry/ はhttp）
+    if host == "b.hatena.ne.jp":
+        if path.startswith("/entry/s/"):
+            return "https://" + path[len("/entry/s/"):] + (f"?{parts.query}" if parts.query else "")
+        if path.startswith("/entry/") and not path.startswith("/entry/panel/"):
+            return "http://" + path[len("/entry/"):] + (f"?{parts.query}" if parts.query else "")
+
+    # YouTube短縮URL
+    if host == "youtu.be" and path.strip("/"):
+        query = f"v={path.strip('/')}" + (f"&{parts.query}" if parts.query else "")
+        return f"https://www.youtube.com/watch?{query}"
+
+    return url
+
+
+def canonicalize_url(url: str) -> str:
+    """重複判定用にURLを正規化する
+
+    - 既知の短縮形式を展開（はてなブックマーク、youtu.be）
+    - スキームをhttpsに統一し、ホスト名を小文字化・先頭の "www." を除去
+      （"m." はモバイル版が別の内容を返すサイトがあるため残す）
+    - デフォルトポート・フラグメント・末尾スラッシュを除去
+    - トラッキング用クエリパラメータ（utm_* 等）を除去し、残りをキー順にソート
+
+    Args:
+        url: 元のURL
+
+    Returns:
+        正規化後のURL（パースできない場合は前後の空白を除いた元のURL）
+    """
+    url = url.strip()
+    if not url:
+        return url
+
+    try:
+        parts = urlsplit(_resolve_short_form(url))
+        host = (parts.hostname or "").lower()
+        port = parts.port
+    except ValueError:
+        return url
+
+    if not host:
+        return url
+
+    if host.startswith("www.") and host.count(".") >= 2:
+        host = host[len("www."):]
+
+    netloc = host
+    if port and port not in (80, 443):
+        netloc = f"{host}:{port}"
+
+    path = parts.path.rstrip("/")
+
+    query_params = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(key)
+    ]
+    query = urlencode(sorted(query_params))
+
+    return urlunsplit(("https", netloc, path, query, ""))
+
+
+def url_hash(key: str) -> int:
+    """正規化済みURLキーの64ビットハッシュ値を返す
+
+    SQLiteのINTEGER型に格納できるよう符号付き64ビット整数で返す。
+
+    Args:
+        key: canonicalize_url で正規化したURL
+
+    Returns:
+        符号付き64ビット整数のハッシュ値
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
@@ -0,0 +1,122 @@
+"""NotificationDispatcher のテスト（ローカルHTTPサーバーを送信先にする）"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.services import channels
+from src.services.channels import NotificationDispatcher, ResendChannel, WebhookChannel
+
+PAYLOAD = {"subject": "件名", "html": "<p>本文</p>", "text": "本文"}
+
+
+class _Endpoint:
+    """パスごとの応答（ステータス, 遅延秒数）を順に返すHTTPサーバー"""
+
+    def __init__(self):
+        self.responses: dict[str, list[tuple[int, float]]] = {}
+        self.requests: dict[str, int] = {}
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                endpoint.requests[self.path] = endpoint.requests.get(self.path, 0) + 1
+                responses = endpoint.responses.get(self.path, [])
+                status, delay = responses.pop(0) if len(responses) > 1 else (responses or [(200, 0.0)])[0]
+                time.sleep(delay)
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Length", "2")
+                    self.end_headers()
+                    self.wfile.write(b"{}")
+                except OSError:
+                    # クライアントがタイムアウトで切断した場合
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}{path}"
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def endpoint(monkeypatch):
+    server = _Endpoint()
+    monkeypatch.setattr(channels, "RESEND_API_URL", server.url("/resend"))
+    yield server
+    server.close()
+
+
+def test_flaky_endpoint_is_retried_alone(endpoint):
+    """失敗したチャネルにだけ再送し、送信済みのチャネルには重複送信しない"""
+    endpoint.responses["/webhook"] = [(500, 0.0), (200, 0.0)]
+    dispatcher = NotificationDispatcher(
+        [ResendChannel("key", "to@example.com", timeout=2), WebhookChannel(endpoint.url("/webhook"), timeout=2)]
+    )
+    payload = dict(PAYLOAD)
+
+    assert not dispatcher.send(payload)
+    assert payload["delivered"] == ["resend"]
+    assert dispatcher.send(payload)
+    assert sorted(payload["delivered"]) == ["resend", "webhook"]
+
+    assert endpoint.requests == {"/resend": 1, "/webhook": 2}
+    stats = dispatcher.stats()
+    assert (stats["resend"]["sent"], stats["resend"]["failed"]) == (1, 0)
+    assert (stats["webhook"]["sent"], stats["webhook"]["failed"]) == (1, 1)
+
+
+def test_timed_out_endpoint_is_retried(endpoint, monkeypatch):
+    """応答しない送信先はタイムアウトで打ち切り、次の送信で再送する"""
+    monkeypatch.setattr(channels, "NOTIFICATION_TIMEOUT_GRACE", 0.5)
+    endpoint.responses["/webhook"] = [(200, 3.0), (200, 0.0)]
+    dispatcher = NotificationDispatcher(
+        [ResendChannel("key", "to@example.com", timeout=2), WebhookChannel(endpoint.url("/webhook"), timeout=0.5)]
+    )
+    payload = dict(PAYLOAD)
+
+    started = time.monotonic()
+    assert not dispatcher.send(payload)
+    assert time.monotonic() - started < 2.5
+    assert payload["delivered"] == ["resend"]
+
+    assert dispatcher.send(payload)
+    assert endpoint.requests == {"/resend": 1, "/webhook": 2}
+
+
+class _SlowConnectChannel(WebhookChannel):
+    """接続確立に時間がかかり、HTTPのタイムアウトより後に送信が完了するチャネル"""
+
+    name = "slow"
+
+    def send(self, payload):
+        time.sleep(0.4)
+        super().send(payload)
+
+
+def test_late_success_is_recorded_as_delivered(endpoint, monkeypatch):
+    """待機を打ち切った後でも、戻る前に完了した送信は送信済みとして記録する"""
+    monkeypatch.setattr(channels, "NOTIFICATION_TIMEOUT_GRACE", 0)
+    endpoint.responses["/resend"] = [(200, 0.8)]
+    dispatcher = NotificationDispatcher(
+        [_SlowConnectChannel(endpoint.url("/slow"), timeout=0.2), ResendChannel("key", "to@example.com", timeout=2)]
+    )
+    payload = dict(PAYLOAD)
+
+    assert dispatcher.send(payload)
+    assert sorted(payload["delivered"]) == ["resend", "slow"]
+    assert dispatcher.stats()["slow"]["failed"] == 0
+    assert endpoint.requests == {"/slow": 1, "/resend": 1}
@@ -0,0 +1,29 @@
+"""履歴クリーンアップ時の畳み込みのテスト"""
+
+from src.services.deduplicator import Deduplicator
+from src.services.journal_history_store import JournalHistoryStore
+
+
+def _deduplicator(tmp_path) -> Deduplicator:
+    store = JournalHistoryStore(tmp_path / "history.json", tmp_path / "history.jsonl", compact_threshold=500)
+    return Deduplicator(store=store, seen_filter_path=None, index_path=None)
+
+
+def test_cleanup_compacts_journal_below_threshold(tmp_path):
+    """閾値未満の追記・削除でも、クリーンアップ時はジャーナルをスナップショットに畳み込む"""
+    deduplicator = _deduplicator(tmp_path)
+    assert deduplicator.load_history()
+    for i in range(3):
+        deduplicator.add_to_history({"url": f"https://example.com/{i}", "title": str(i), "source": "qiita"})
+    assert deduplicator.save_history()
+    assert (tmp_path / "history.jsonl").exists()
+
+    deduplicator = _deduplicator(tmp_path)
+    assert deduplicator.load_history()
+    deduplicator.cleanup_old_entries()
+    assert deduplicator.save_history(compact=True)
+
+    assert not (tmp_path / "history.jsonl").exists()
+    store = JournalHistoryStore(tmp_path / "history.json", tmp_path / "history.jsonl")
+    assert store.load()
+    assert len(store) == 3
@@ -0,0 +1,83 @@
+"""複数プロセスからの同時保存のテスト"""
+
+import multiprocessing
+
+import pytest
+
+from src.services import sqlite_history_store
+from src.services.deduplicator import Deduplicator
+from src.services.history_store import JsonHistoryStore
+from src.services.journal_history_store import JournalHistoryStore
+from src.services.sqlite_history_store import SqliteHistoryStore
+from src.utils.bloom import BloomFilter
+
+PROCESSES = 6
+ARTICLES_PER_PROCESS = 20
+
+
+def _create_store(backend: str, directory):
+    if backend == "journal":
+        return JournalHistoryStore(directory / "history.json", directory / "history.jsonl")
+    if backend == "sqlite":
+        return SqliteHistoryStore(directory / "history.db")
+    return JsonHistoryStore(directory / "history.json")
+
+
+def _create_deduplicator(backend: str, directory) -> Deduplicator:
+    return Deduplicator(
+        store=_create_store(backend, directory),
+        seen_filter_path=directory / "seen.bloom",
+        index_path=directory / "history.idx",
+    )
+
+
+def _collect(backend: str, directory, number: int, barrier) -> None:
+    """履歴を読み込み、他プロセスと揃えて記事を追加・保存する"""
+    deduplicator = _create_deduplicator(backend, directory)
+    assert deduplicator.load_history()
+    barrier.wait()
+    for i in range(ARTICLES_PER_PROCESS):
+        deduplicator.add_to_history(
+            {"url": f"https://example.com/{number}/{i}", "title": f"{number}-{i}", "source": "qiita"}
+        )
+    assert deduplicator.save_history()
+
+
+@pytest.mark.parametrize("backend", ["json", "journal", "sqlite"])
+def test_concurrent_saves_keep_every_writer(tmp_path, monkeypatch, backend):
+    """6プロセスが同時に保存しても、履歴・長期重複判定フィルタから追加分が失われない"""
+    # 既存の history.json を取り込まないようにする（子プロセスは fork で引き継ぐ）
+    monkeypatch.setattr(sqlite_history_store, "HISTORY_FILE", tmp_path / "history.json")
+    # 既存の履歴とフィルタを用意する
+    first = _create_deduplicator(backend, tmp_path)
+    assert first.load_history()
+    first.add_to_history({"url": "https://example.com/seed", "title": "seed", "source": "zenn"})
+    assert first.save_history()
+    del first
+
+    context = multiprocessing.get_context("fork")
+    barrier = context.Barrier(PROCESSES)
+    processes = [
+        context.Process(target=_collect, args=(backend, tmp_path, number, barrier)) for number in range(PROCESSES)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+    assert [process.exitcode for process in processes] == [0] * PROCESSES
+
+    urls = ["https://example.com/seed"] + [
+        f"https://example.com/{number}/{i}" for number in range(PROCESSES) for i in range(ARTICLES_PER_PROCESS)
+    ]
+
+    store = _create_store(backend, tmp_path)
+    assert store.load()
+    assert len(store) == len(urls)
+    store.close()
+
+    seen_filter = BloomFilter.load(tmp_path / "seen.bloom")
+    try:
+        missing = [url for url in urls if url not in seen_filter]
+    finally:
+        seen_filter.close()
+    assert missing == []
@@ -0,0 +1,44 @@
+"""Deduplicator のURLハッシュ索引の扱いのテスト"""
+
+from src.services.deduplicator import Deduplicator
+from src.services.history_store import JsonHistoryStore
+
+
+def _deduplicator(tmp_path) -> Deduplicator:
+    return Deduplicator(
+        store=JsonHistoryStore(tmp_path / "history.json"),
+        seen_filter_path=None,
+        index_path=tmp_path / "history.idx",
+    )
+
+
+def test_index_is_not_built_when_store_is_loaded(tmp_path):
+    """一致する索引がない場合は履歴本体で判定し、保存時に1回だけ索引を作る"""
+    deduplicator = _deduplicator(tmp_path)
+    assert deduplicator.load_history()
+    assert deduplicator._index is None
+
+    deduplicator.add_to_history({"url": "https://example.com/1", "title": "1", "source": "qiita"})
+    assert deduplicator.is_duplicate("https://example.com/1")
+    assert deduplicator.save_history()
+    assert (tmp_path / "history.idx").exists()
+
+
+def test_valid_index_skips_loading_store(tmp_path):
+    """履歴と一致する索引があれば履歴本体を読み込まずに判定する"""
+    deduplicator = _deduplicator(tmp_path)
+    deduplicator.load_history()
+    deduplicator.add_to_history({"url": "https://example.com/1", "title": "1", "source": "qiita"})
+    assert deduplicator.save_history()
+    del deduplicator
+
+    deduplicator = _deduplicator(tmp_path)
+    assert deduplicator.load_history()
+    assert not deduplicator._store_loaded
+    assert deduplicator.is_duplicate("https://example.com/1")
+    assert not deduplicator.is_duplicate("https://example.com/2")
+
+
+def test_index_disabled_by_default():
+    """既定では索引を使わない（Actions ではチェックアウトで常に不一致になるため）"""
+    assert Deduplicator(seen_filter_path=None)._index_path is None
@@ -0,0 +1,85 @@
+"""ダイジェストのグループ化・描画のテスト"""
+
+from src.generators.digest import article_anchor, build_digest, render_html, render_markdown, render_text
+from src.generators.markdown import load_saved_articles
+
+
+def _article(number: int, source: str, metric: int = 0, **extra) -> dict:
+    metric_key = {"qiita": "likes", "zenn": "likes", "hackernews": "points", "hatena": "bookmarks"}[source]
+    return {
+        "title": f"{source} {number}",
+        "url": f"https://example.com/{source}/{number}",
+        "author": "author",
+        "published": "2026-03-01T00:00:00",
+        "tags": [],
+        "source": source,
+        metric_key: metric,
+        **extra,
+    }
+
+
+def _digest():
+    articles = [
+        _article(1, "hatena", 10),
+        _article(2, "qiita", 5),
+        _article(3, "qiita", 50),
+        _article(4, "hackernews", 120, title_en="Original title"),
+    ]
+    priority = [
+        {"topic": "python", "source": "zenn", "articles": [_article(5, "zenn", 3)]},
+        {"topic": "aws", "source": "hatena", "articles": [_article(6, "hatena", 40)]},
+        {"topic": "aws", "source": "qiita", "articles": [_article(7, "qiita", 1), _article(8, "qiita", 9)]},
+        {"topic": "aws", "source": "zenn", "articles": []},
+    ]
+    stats = {"qiita_fetched": 30, "zenn_fetched": 20, "hn_fetched": 10, "hatena_fetched": 5, "new_articles": 8}
+    return build_digest(articles, "2026-03-01", stats, priority_articles=priority)
+
+
+def test_grouping_counts_and_order():
+    """ソース・優先トピックごとの件数と並び順"""
+    digest = _digest()
+
+    assert [(section.name, len(section.items)) for section in digest.sources] == [
+        ("qiita", 2),
+        ("hackernews", 1),
+        ("hatena", 1),
+    ]
+    assert [(section.name, len(section.items)) for section in digest.topics] == [("aws", 3), ("python", 1)]
+
+    # ソース内はメトリクスの降順、優先トピック内はソース順 → メトリクスの降順
+    assert [item.article["title"] for item in digest.sources[0].items] == ["qiita 3", "qiita 2"]
+    assert [item.article["title"] for item in digest.topics[0].items] == ["qiita 8", "qiita 7", "hatena 6"]
+    assert [section.key for section in digest.sections()][-2:] == ["topic:aws", "topic:python"]
+
+
+def test_render_html_and_text():
+    """HTML・テキストに件数・記事・原題が描画され、HTMLはエスケープされる"""
+    digest = _digest()
+    digest.sources[0].items[0].article["title"] = "<script>"
+
+    body = render_html(digest, "https://github.com/example")
+    assert "Qiita 30件" in body and "<strong>新規保存:</strong> 8件" in body
+    assert "&lt;script&gt;" in body and "<script>" not in body
+    assert "<small>Original title</small>" in body
+    assert body.index("<h3>AWS</h3>") < body.index("<h3>PYTHON</h3>") < body.index("<h3>Qiita</h3>")
+
+    text = render_text(digest, "https://github.com/example")
+    assert text.startswith("新規保存: 8件")
+    assert "- [Qiita] qiita 8 (9 likes) https://example.com/qiita/8" in text
+    assert "- hackernews 4 (120 points) https://example.com/hackernews/4" in text
+
+
+def test_render_markdown_round_trip(tmp_path):
+    """日別まとめのマークダウンから全記事と優先トピックを復元できる"""
+    digest = _digest()
+    markdown = render_markdown(digest)
+    assert markdown.startswith("# 2026-03-01 の記事\n")
+    assert markdown.count("<!-- section: ") == len(digest.sections())
+    assert f'<a id="{article_anchor("https://example.com/qiita/3")}"></a>' in markdown
+
+    (tmp_path / "index.md").write_text(markdown, encoding="utf-8")
+    restored = {article["url"]: article for article, _ in load_saved_articles(tmp_path)}
+    assert len(restored) == 8
+    assert restored["https://example.com/qiita/8"]["priority_topic"] == "aws"
+    assert restored["https://example.com/hackernews/4"]["title_en"] == "Original title"
+    assert restored["https://example.com/hackernews/4"]["points"] == 120
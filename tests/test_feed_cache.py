@@ -0,0 +1,44 @@
+"""フィード検証子の保存タイミングのテスト"""
+
+import time
+
+from src.collectors import hackernews, hatena
+from src.services import collection
+from src.utils.feed import FeedCache
+
+
+def _fake_fetch(cache: FeedCache, source: str, etag: str, delay: float = 0.0):
+    def fetch(*args, **kwargs):
+        cache.record(source, 200, etag, None)
+        time.sleep(delay)
+        return []
+
+    return fetch
+
+
+def test_validators_of_timed_out_source_are_not_saved(tmp_path, monkeypatch):
+    """タイムアウトで結果を捨てたソースの検証子は保存しない"""
+    cache = FeedCache(tmp_path / "feed_cache.json")
+    monkeypatch.setattr(collection, "feed_cache", cache)
+    monkeypatch.setattr(collection, "COLLECT_TIMEOUTS", {**collection.COLLECT_TIMEOUTS, "hackernews": 0.2})
+    monkeypatch.setattr(hackernews, "fetch_top_articles", _fake_fetch(cache, "hackernews", '"hn-new"', delay=1.0))
+    monkeypatch.setattr(hatena, "fetch_hotentry_articles", _fake_fetch(cache, "hatena", '"hatena-new"'))
+
+    collected = collection.collect_articles({}, sources=["hackernews", "hatena"], topics=[])
+
+    assert collected["hackernews"] == []
+    assert cache.get_validators("hackernews") == (None, None)
+    assert cache.get_validators("hatena") == ('"hatena-new"', None)
+
+
+def test_discarded_validators_are_not_saved(tmp_path):
+    """処理に失敗したソースの検証子は破棄され、前回値が残る"""
+    cache = FeedCache(tmp_path / "feed_cache.json")
+    cache.record("qiita", 200, '"old"', None)
+    cache.commit("qiita")
+
+    cache.record("qiita", 200, '"new"', None)
+    cache.discard("qiita")
+    cache.commit("qiita")
+
+    assert cache.get_validators("qiita") == ('"old"', None)
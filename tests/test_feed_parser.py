@@ -0,0 +1,88 @@
+"""フィードパーサーのテスト"""
+
+from src.utils import feed_parser
+from src.utils.feed_parser import parse_fast, parse_feed, parse_with_feedparser
+
+ATOM = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Qiita</title>
+  <entry>
+    <title>Python の型ヒント</title>
+    <link rel="alternate" type="text/html" href="https://qiita.com/a/items/1"/>
+    <author><name>alice</name></author>
+    <published>2026-03-01T09:00:00+09:00</published>
+    <category term="Python"/>
+    <category term="typing"/>
+  </entry>
+</feed>
+""".encode("utf-8")
+
+RDF = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns="http://purl.org/rss/1.0/" xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:hatena="http://www.hatena.ne.jp/info/xmlns#">
+  <item rdf:about="https://example.com/a">
+    <title>Example</title>
+    <link>https://example.com/a</link>
+    <dc:creator>bob</dc:creator>
+    <dc:date>2026-03-01T00:00:00Z</dc:date>
+    <dc:subject>AWS</dc:subject>
+    <hatena:bookmarkcount>42</hatena:bookmarkcount>
+  </item>
+</rdf:RDF>
+"""
+
+# 閉じタグの欠けたRSS（XMLとして不正）
+MALFORMED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+  <item>
+    <title>Broken &amp; recovered</title>
+    <link>https://example.com/broken</link>
+    <pubDate>Sun, 01 Mar 2026 00:00:00 GMT</pubDate>
+  </item>
+</channel>
+"""
+
+
+def test_parse_fast_atom():
+    """Atom の記事要素から必要な項目を抽出し、日時をUTCに変換する"""
+    [entry] = parse_fast(ATOM)
+    assert entry["title"] == "Python の型ヒント"
+    assert entry["link"] == "https://qiita.com/a/items/1"
+    assert entry["author"] == "alice"
+    assert entry["published"] == "2026-03-01T00:00:00"
+    assert entry["tags"] == ["Python", "typing"]
+
+
+def test_parse_fast_rdf_matches_feedparser():
+    """はてなブックマークの RDF は feedparser と同じ結果になる"""
+    [fast] = parse_fast(RDF)
+    [slow] = parse_with_feedparser(RDF)
+    assert fast["bookmarkcount"] == 42
+    for key in ("title", "link", "author", "published", "tags", "bookmarkcount"):
+        assert fast[key] == slow[key], key
+
+
+def test_malformed_feed_falls_back_to_feedparser(monkeypatch):
+    """XMLとして不正なフィードは feedparser で再解析する"""
+    calls = []
+    original = feed_parser.parse_with_feedparser
+
+    def spy(content):
+        calls.append(content)
+        return original(content)
+
+    monkeypatch.setattr(feed_parser, "FEED_PARSER", "fast")
+    monkeypatch.setattr(feed_parser, "parse_with_feedparser", spy)
+
+    [entry] = parse_feed(MALFORMED)
+    assert calls == [MALFORMED]
+    assert entry["title"] == "Broken & recovered"
+    assert entry["link"] == "https://example.com/broken"
+    assert entry["published"] == "2026-03-01T00:00:00"
+
+
+def test_well_formed_feed_does_not_fall_back(monkeypatch):
+    """正しい形式のフィードは feedparser を使わない"""
+    monkeypatch.setattr(feed_parser, "FEED_PARSER", "fast")
+    monkeypatch.setattr(feed_parser, "parse_with_feedparser", lambda content: [])
+    assert len(parse_feed(ATOM)) == 1
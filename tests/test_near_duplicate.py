@@ -0,0 +1,54 @@
+"""タイトルの類似記事検出のテスト"""
+
+from src.services.near_duplicate import NearDuplicateDetector, group_near_duplicates
+
+
+def _article(url: str, title: str, source: str) -> dict:
+    return {"url": url, "title": title, "source": source}
+
+
+def test_near_duplicate_pair_is_marked_related():
+    """同じ話題のタイトルは、先行する新規記事の関連記事として記録する"""
+    primary = _article(
+        "https://news.ycombinator.com/item?id=1", "OpenAI releases GPT-5 with new reasoning mode", "hackernews"
+    )
+    similar = _article(
+        "https://example.com/gpt5?utm_source=hatena", "OpenAI releases GPT-5 with a new reasoning mode!", "hatena"
+    )
+    unrelated = _article("https://example.com/rust", "Rust 2026 edition is now stable", "hatena")
+
+    related = group_near_duplicates([primary, similar, unrelated], [])
+
+    assert related == [similar]
+    assert similar["related_to"] == "https://news.ycombinator.com/item?id=1"
+    assert 0 < similar["similarity"] <= 1
+    assert primary["related"] == [similar]
+    assert "related_to" not in unrelated
+
+
+def test_match_against_history_entry():
+    """履歴のエントリと類似する記事は、履歴側の正規化済みURLを related_to に持つ"""
+    history = [
+        {
+            "url": "https://zenn.dev/a/articles/bedrock",
+            "title": "Amazon Bedrock で RAG を構築する",
+            "source": "zenn",
+            "collected_at": 1,
+        }
+    ]
+    article = _article("https://qiita.com/b/items/2", "Amazon Bedrock で RAG を構築する！", "qiita")
+
+    assert group_near_duplicates([article], history) == [article]
+    assert article["related_to"] == "https://zenn.dev/a/articles/bedrock"
+    assert "related" not in history[0]
+
+
+def test_detector_threshold():
+    """類似度が閾値未満のタイトルは一致しない"""
+    detector = NearDuplicateDetector(threshold=0.5)
+    detector.add("https://example.com/1", "Python 3.14 の新機能まとめ")
+
+    match = detector.find("Python 3.14 の新機能まとめ")
+    assert match is not None and match[1] == 1.0
+    assert detector.find("TypeScript の型パズル入門") is None
+    assert detector.find("") is None
@@ -0,0 +1,42 @@
+"""NotificationOutbox の終了処理のテスト"""
+
+import time
+
+from src.services.outbox import NotificationOutbox
+from src.utils.config import NOTIFICATION_TIMEOUT, NOTIFICATION_TIMEOUT_GRACE, OUTBOX_WAIT_TIMEOUT
+
+
+def test_close_waits_for_send_in_flight(tmp_path):
+    """送信中の通知は完了を待ってから終了し、キューから削除する"""
+    def slow_send(payload):
+        time.sleep(0.5)
+        return True
+
+    outbox = NotificationOutbox(slow_send, directory=tmp_path / "outbox")
+    path = outbox.enqueue("success", {"subject": "件名"})
+    outbox.start()
+    time.sleep(0.1)
+
+    stats = outbox.close(OUTBOX_WAIT_TIMEOUT)
+    assert stats["sent"] == 1
+    assert not path.exists()
+
+
+def test_close_does_not_wait_for_backoff(tmp_path):
+    """送信に失敗した通知の再送は待たずに終了し、キューに残す"""
+    outbox = NotificationOutbox(lambda payload: False, directory=tmp_path / "outbox")
+    path = outbox.enqueue("success", {"subject": "件名"})
+    outbox.start()
+    time.sleep(0.1)
+
+    started = time.monotonic()
+    stats = outbox.close(OUTBOX_WAIT_TIMEOUT)
+    assert time.monotonic() - started < 1.0
+    assert stats["pending"] == 1
+    assert path.exists()
+    assert not list(path.parent.glob("*.tmp"))
+
+
+def test_wait_timeout_covers_one_channel_attempt():
+    """終了時の待機時間はチャネルの送信1回分（タイムアウト + 猶予）より短くない"""
+    assert OUTBOX_WAIT_TIMEOUT >= NOTIFICATION_TIMEOUT + NOTIFICATION_TIMEOUT_GRACE
@@ -0,0 +1,76 @@
+"""全文検索インデックスのテスト"""
+
+from src.generators.markdown import generate_article_markdown
+from src.services.search_index import SearchIndex
+
+
+def _article(number: int, title: str, source: str = "zenn", tags: list[str] | None = None) -> dict:
+    return {
+        "title": title,
+        "url": f"https://example.com/{source}/{number}",
+        "author": "author",
+        "published": "",
+        "tags": tags or [],
+        "source": source,
+    }
+
+
+def _write(articles_dir, date: str, article: dict) -> None:
+    directory = articles_dir / date
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{article['url'].rsplit('/', 1)[-1]}.md").write_text(
+        generate_article_markdown(article), encoding="utf-8"
+    )
+
+
+def test_catch_up_adds_articles_missing_from_restored_index(tmp_path):
+    """キャッシュから復元したインデックスに欠けている日の記事を補う"""
+    articles_dir = tmp_path / "articles"
+    _write(articles_dir, "2026-03-01", _article(1, "古い記事"))
+    index = SearchIndex(tmp_path / "search.db")
+    index.open()
+    assert index.rebuild(articles_dir) == 1
+
+    # インデックスの保存後に、別の実行で記事が追加された
+    _write(articles_dir, "2026-03-01", _article(2, "同じ日の追加記事"))
+    _write(articles_dir, "2026-03-02", _article(3, "翌日の記事"))
+
+    assert index.catch_up(articles_dir) == 3
+    assert len(index) == 3
+    assert [row["collected_date"] for row in index.search("翌日の記事")] == ["2026-03-02"]
+    index.close()
+
+
+def _index(tmp_path) -> SearchIndex:
+    index = SearchIndex(tmp_path / "search.db")
+    index.open()
+    index.add_articles(
+        [
+            (_article(1, "Amazon Bedrock で生成AIアプリを構築する", tags=["AWS", "Bedrock"]), "2026-03-01", "a"),
+            (_article(2, "Python の型ヒント入門", source="qiita", tags=["Python"]), "2026-03-02", "b"),
+            (_article(3, "生成AIの評価指標まとめ", source="hatena", tags=["AI"]), "2026-03-03", "c"),
+        ]
+    )
+    return index
+
+
+def test_japanese_substring_query(tmp_path):
+    """日本語の部分文字列（3文字以上は trigram 索引, 2文字以下は部分一致）で検索できる"""
+    index = _index(tmp_path)
+    assert {row["title"] for row in index.search("生成AI")} == {
+        "Amazon Bedrock で生成AIアプリを構築する",
+        "生成AIの評価指標まとめ",
+    }
+    assert [row["title"] for row in index.search("型ヒント")] == ["Python の型ヒント入門"]
+    assert [row["title"] for row in index.search("指標")] == ["生成AIの評価指標まとめ"]
+    assert index.search("存在しない語句") == []
+    index.close()
+
+
+def test_filters_by_source_date_and_tag(tmp_path):
+    """ソース・収集日・タグで絞り込める"""
+    index = _index(tmp_path)
+    assert [row["source"] for row in index.search("生成AI", sources=["hatena"])] == ["hatena"]
+    assert [row["collected_date"] for row in index.search(since="2026-03-02", until="2026-03-02")] == ["2026-03-02"]
+    assert [row["title"] for row in index.search(tag="bedrock")] == ["Amazon Bedrock で生成AIアプリを構築する"]
+    index.close()
@@ -0,0 +1,101 @@
+"""SqliteHistoryStore のテスト"""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+from src.services import sqlite_history_store
+from src.services.deduplicator import Deduplicator
+from src.services.sqlite_history_store import SqliteHistoryStore
+
+
+def _create_deduplicator(tmp_path, monkeypatch) -> Deduplicator:
+    # 既存の history.json を取り込まないようにする
+    monkeypatch.setattr(sqlite_history_store, "HISTORY_FILE", tmp_path / "history.json")
+    store = SqliteHistoryStore(tmp_path / "history.db")
+    deduplicator = Deduplicator(store=store, seen_filter_path=None, index_path=None)
+    assert deduplicator.load_history()
+    return deduplicator
+
+
+def test_is_duplicate_from_worker_thread(tmp_path, monkeypatch):
+    """収集ワーカースレッドから is_duplicate を呼び出せる"""
+    deduplicator = _create_deduplicator(tmp_path, monkeypatch)
+    deduplicator.add_to_history({"url": "https://qiita.com/a/items/1", "title": "saved", "source": "qiita"})
+    assert deduplicator.save_history()
+    deduplicator.add_to_history({"url": "https://zenn.dev/a/articles/2", "title": "pending", "source": "zenn"})
+
+    urls = ["https://qiita.com/a/items/1", "https://zenn.dev/a/articles/2", "https://example.com/new"] * 20
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(deduplicator.is_duplicate, urls))
+
+    assert results == [True, True, False] * 20
+
+
+def test_iter_entries_while_adding_from_other_thread(tmp_path, monkeypatch):
+    """走査中に別スレッドから追加・判定しても失敗しない"""
+    deduplicator = _create_deduplicator(tmp_path, monkeypatch)
+    for i in range(2500):
+        deduplicator.add_to_history({"url": f"https://example.com/{i}", "title": str(i), "source": "qiita"})
+    assert deduplicator.save_history()
+
+    def add_more() -> None:
+        for i in range(2500, 2600):
+            deduplicator.add_to_history({"url": f"https://example.com/{i}", "title": str(i), "source": "zenn"})
+            deduplicator.is_duplicate(f"https://example.com/{i}")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(add_more)
+        count = sum(1 for _ in deduplicator.iter_recent_entries(days=1))
+        future.result()
+
+    assert count >= 2500
+
+
+def test_related_entries_round_trip(tmp_path, monkeypatch):
+    """類似記事の related_to / similarity を保存・読み出しできる"""
+    deduplicator = _create_deduplicator(tmp_path, monkeypatch)
+    deduplicator.add_to_history(
+        {
+            "url": "https://zenn.dev/a/articles/2",
+            "title": "related",
+            "source": "zenn",
+            "related_to": "https://qiita.com/a/items/1",
+            "similarity": 0.82,
+        }
+    )
+    deduplicator.add_to_history({"url": "https://qiita.com/a/items/3", "title": "plain", "source": "qiita"})
+    assert deduplicator.save_history()
+
+    entries = {entry["url"]: entry for entry in deduplicator.iter_recent_entries(days=1)}
+    assert entries["https://zenn.dev/a/articles/2"]["related_to"] == "https://qiita.com/a/items/1"
+    assert entries["https://zenn.dev/a/articles/2"]["similarity"] == 0.82
+    assert "related_to" not in entries["https://qiita.com/a/items/3"]
+
+
+def test_migrates_old_schema(tmp_path, monkeypatch):
+    """related_to / similarity 列のない既存データベースに列を追加する"""
+    path = tmp_path / "history.db"
+    with sqlite3.connect(path) as conn:
+        conn.executescript(
+            "CREATE TABLE articles (url_hash INTEGER NOT NULL, url TEXT NOT NULL, "
+            "title TEXT NOT NULL DEFAULT '', source TEXT NOT NULL DEFAULT '', "
+            "collected_at INTEGER NOT NULL, UNIQUE (url_hash, url));"
+        )
+    conn.close()
+
+    monkeypatch.setattr(sqlite_history_store, "HISTORY_FILE", tmp_path / "history.json")
+    store = SqliteHistoryStore(path)
+    assert store.load()
+    store.add(
+        {
+            "url": "https://example.com/a",
+            "title": "t",
+            "source": "qiita",
+            "collected_at": 1,
+            "related_to": "https://example.com/b",
+            "similarity": 0.9,
+        }
+    )
+    assert store.save()
+    assert list(store.iter_entries())[0]["similarity"] == 0.9
+    store.close()
@@ -0,0 +1,41 @@
+"""翻訳キャッシュの保存のテスト"""
+
+import json
+
+from src.services import translator
+from src.services.translation_cache import TranslationCache
+from src.utils.config import TRANSLATION_MODEL
+
+
+def test_all_hits_update_used_at(tmp_path, monkeypatch):
+    """全件キャッシュヒットでも最終利用日時が保存される"""
+    path = tmp_path / "translation_cache.json"
+    cache = TranslationCache(path)
+    cache.put("Hello", TRANSLATION_MODEL, "こんにちは")
+    assert cache.save()
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    for entry in data["entries"].values():
+        entry["used_at"] = 0
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    cache = TranslationCache(path, max_age_days=10**6)
+    monkeypatch.setattr(translator, "translation_cache", cache)
+    articles = translator.translate_hn_titles([{"title": "Hello", "url": "https://example.com/"}])
+
+    assert articles[0]["title"] == "こんにちは"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert all(entry["used_at"] > 0 for entry in data["entries"].values())
+
+
+def test_save_skips_unchanged_cache(tmp_path):
+    """ヒット・登録がない場合はキャッシュファイルを書き直さない"""
+    path = tmp_path / "translation_cache.json"
+    cache = TranslationCache(path)
+    cache.put("Hello", TRANSLATION_MODEL, "こんにちは")
+    assert cache.save()
+
+    assert cache.get("Missing", TRANSLATION_MODEL) is None
+    path.write_text("{}", encoding="utf-8")
+    assert cache.save()
+    assert path.read_text(encoding="utf-8") == "{}"
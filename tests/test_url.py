@@ -0,0 +1,58 @@
+"""URL正規化のテスト"""
+
+import pytest
+
+from src.utils.url import canonicalize_url, url_hash
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [
+        "https://example.com/posts/1",
+        "http://example.com/posts/1",
+        "https://www.example.com/posts/1",
+        "https://EXAMPLE.com/posts/1/",
+        "https://example.com:443/posts/1",
+        "https://example.com/posts/1#comments",
+        "https://example.com/posts/1?utm_source=twitter&utm_medium=social",
+        "https://example.com/posts/1?fbclid=abc",
+        "https://b.hatena.ne.jp/entry/s/example.com/posts/1",
+    ],
+)
+def test_variants_share_canonical_key(variant):
+    """スキーム・www・末尾スラッシュ・トラッキングパラメータ等の違いは同じキーになる"""
+    assert canonicalize_url(variant) == "https://example.com/posts/1"
+
+
+def test_query_order_is_normalized():
+    """クエリパラメータの順序の違いは同じキーになる"""
+    assert canonicalize_url("https://example.com/s?b=2&a=1") == canonicalize_url("https://example.com/s?a=1&b=2")
+
+
+def test_youtube_short_url():
+    """youtu.be の短縮URLは watch URL と同じキーになる"""
+    assert canonicalize_url("https://youtu.be/abc") == canonicalize_url("https://www.youtube.com/watch?v=abc")
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        # 内容を変えるクエリパラメータは残す
+        ("https://example.com/items?id=1", "https://example.com/items?id=2"),
+        ("https://github.com/o/r/blob/x?ref=main", "https://github.com/o/r/blob/x?ref=dev"),
+        # モバイル版は別の内容を返すことがあるため "m." は残す
+        ("https://m.example.com/a", "https://example.com/a"),
+        # 既定以外のポート・パスの大文字小文字は区別する
+        ("https://example.com:8443/a", "https://example.com/a"),
+        ("https://example.com/A", "https://example.com/a"),
+    ],
+)
+def test_distinct_urls_do_not_collide(first, second):
+    """内容が異なりうるURLは別のキーになる"""
+    assert canonicalize_url(first) != canonicalize_url(second)
+    assert url_hash(canonicalize_url(first)) != url_hash(canonicalize_url(second))
+
+
+def test_unparsable_url_is_returned_stripped():
+    """パースできないURLは前後の空白だけ除いて返す"""
+    assert canonicalize_url("  not a url  ") == "not a url"